@@ -5,172 +5,387 @@ Pulls all Priorities and Tasks from Airtable and saves to CSV.
 
 Usage:
     python sync_dincharya.py
+    python sync_dincharya.py --concurrent
+    python sync_dincharya.py --local-lookups --local-formulas
+    python sync_dincharya.py --sqlite
+    python sync_dincharya.py --metrics dincharya_metrics.json --prometheus dincharya.prom
+    python sync_dincharya.py --summary dincharya_summary.json
+    python sync_dincharya.py --watch --concurrent --health-port 9465
+
+In watch mode the first cycle fetches both tables in full; later cycles
+fetch only the records modified since the previous cycle (plus an ID-only
+pass for deletions) and merge them into the rows already held.
 
 Output:
-    - priorities.csv
-    - tasks.csv
+    - priorities.csv, tasks.csv (rewritten only when a record changed)
+    - priorities.manifest.json, tasks.manifest.json (per-record content hashes)
+    - priorities.journal.* / tasks.journal.* (checkpoint while fetching; an
+      interrupted sync resumes from it on the next run)
+    - priorities and tasks tables in airtable.db (with --sqlite)
+    - JSON / Prometheus textfile metrics (with --metrics / --prometheus)
+    - Summary statistics as JSON (with --summary)
 """
 
-from pyairtable import Api
-import csv
-from datetime import datetime
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import partial
 import os
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from airtable_sync.client import ClientMetrics, connect
+from airtable_sync.instrument import SyncMetrics
+from airtable_sync.config import PRIORITIES, TASKS
+from airtable_sync.joins import LIST_SEPARATOR, IndexedTable, resolve_lookups
+from airtable_sync.journal import resumable_pages
+from airtable_sync.manifest import CSVOutput
+from airtable_sync.mapping import RECORD_ID
+from airtable_sync.sqlite_mirror import DEFAULT_PATH, SQLiteMirror
+from airtable_sync.summary import write_json as write_summary_json
+from airtable_sync.watch import Watcher, add_watch_arguments
+
 # Load environment variables from .env (in parent AirTable folder)
 load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.env'))
 
 # Configuration (from .env)
 API_KEY = os.getenv('AIRTABLE_API_KEY')
-BASE_ID = os.getenv('DINCHARYA_BASE_ID')
-PRIORITIES_TABLE_ID = os.getenv('DINCHARYA_PRIORITIES_TABLE_ID')
-TASKS_TABLE_ID = os.getenv('DINCHARYA_TASKS_TABLE_ID')
-
-OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
-
-# Column definitions
-PRIORITY_COLUMNS = [
-    'Record ID', 'Title', 'Horizon', 'Status', 'Rank', 'Why',
-    'Due Date', 'Category', 'Created', 'Total Tasks', 'Completed Tasks',
-    'Task Completion %', 'Summary', 'Category Suggestion'
-]
-
-TASK_COLUMNS = [
-    'Record ID', 'Task', 'Priority', 'Status', 'Notes',
-    'Priority Horizon', 'Priority Status', 'Priority Due Date',
-    'Days Until Due', 'Is Overdue', 'Task Age (days)',
-    'Task Summary (AI)', 'Suggested Next Action (AI)'
-]
-
-
-def extract_field(value):
-    """Extract value from complex field types."""
-    if value is None:
-        return ''
-    if isinstance(value, dict):
-        return value.get('value', str(value))
-    if isinstance(value, list):
-        # For linked records or lookups, join values
-        return ', '.join(str(v) for v in value)
-    return value
-
-
-def fetch_priorities(api):
-    """Fetch all priorities from Airtable."""
+BASE_ID = PRIORITIES.base_id()
+PRIORITIES_TABLE_ID = PRIORITIES.table_id()
+TASKS_TABLE_ID = TASKS.table_id()
+
+# SYNC_OUTPUT_DIR redirects output, e.g. for benchmarks against the fake server
+OUTPUT_DIR = PRIORITIES.output_dir()
+# Rows per Airtable page, journal checkpoint and SQLite transaction
+PAGE_SIZE = 100
+# Watch-mode polls re-read records modified this long before the last poll
+WATERMARK_OVERLAP = timedelta(minutes=1)
+# Field requested by the ID-only pass that finds deleted records
+ID_ONLY_FIELDS = {
+    'priorities': ['Rank'],
+    'tasks': ['Status'],
+}
+
+# Column definitions (CSV column, Airtable source field, extractor, default)
+# and SQLite indexes live in airtable_sync.config
+PRIORITY_MAPPING = PRIORITIES.mapping
+TASK_MAPPING = TASKS.mapping
+
+# Compiled row builders: Airtable record -> CSV row tuple
+PRIORITY_ROW = PRIORITIES.row
+TASK_ROW = TASKS.row
+PRIORITY_COLUMNS = PRIORITY_ROW.columns
+TASK_COLUMNS = TASK_ROW.columns
+CONFIGS = {'priorities': PRIORITIES, 'tasks': TASKS}
+TABLE_IDS = {'priorities': PRIORITIES_TABLE_ID, 'tasks': TASKS_TABLE_ID}
+
+# Record ID comes first in both tables
+ID = PRIORITY_ROW.index(RECORD_ID)
+RANK = PRIORITY_ROW.index('Rank')
+PRIORITY_LINK = TASK_ROW.index('Priority')
+
+# Columns indexed in the SQLite mirror
+SQLITE_INDEXES = {
+    'priorities': PRIORITIES.indexes,
+    'tasks': TASKS.indexes,
+}
+
+
+def fetch_priorities(api, run, journal, local_formulas=False):
+    """Fetch all priorities from Airtable, checkpointing each page."""
     table = api.table(BASE_ID, PRIORITIES_TABLE_ID)
-    records = table.all(sort=['Rank'])
-
-    rows = []
-    for rec in records:
-        fields = rec['fields']
-        rows.append({
-            'Record ID': rec['id'],
-            'Title': fields.get('Title', ''),
-            'Horizon': fields.get('Horizon', ''),
-            'Status': fields.get('Status', ''),
-            'Rank': fields.get('Rank', ''),
-            'Why': fields.get('Why', ''),
-            'Due Date': fields.get('Due Date', ''),
-            'Category': fields.get('Category', ''),
-            'Created': fields.get('Created', ''),
-            'Total Tasks': fields.get('Total Tasks', ''),
-            'Completed Tasks': fields.get('Completed Tasks', ''),
-            'Task Completion %': fields.get('Task Completion %', ''),
-            'Summary': extract_field(fields.get('Summary', '')),
-            'Category Suggestion': extract_field(fields.get('Category Suggestion', '')),
-        })
-    return rows
-
-
-def fetch_tasks(api):
-    """Fetch all tasks from Airtable."""
+    builder = PRIORITIES.builder(local_formulas)
+    pages = resumable_pages(table, journal, builder.build, PAGE_SIZE, run,
+                            **PRIORITIES.fetch_options(local_formulas=local_formulas))
+    return [row for page in pages for row in page]
+
+
+def fetch_tasks(api, run, journal, local_lookups=False, local_formulas=False):
+    """Fetch all tasks from Airtable, checkpointing each page.
+
+    With local_lookups the Priority lookup fields are not requested; their
+    columns stay empty until resolve_priority_lookups() fills them. With
+    local_formulas the formula columns are left for DerivedFields.
+    """
     table = api.table(BASE_ID, TASKS_TABLE_ID)
-    records = table.all()
-
-    rows = []
-    for rec in records:
-        fields = rec['fields']
-        rows.append({
-            'Record ID': rec['id'],
-            'Task': fields.get('Task', ''),
-            'Priority': extract_field(fields.get('Priority Link', '')),
-            'Status': fields.get('Status', ''),
-            'Notes': fields.get('Notes', ''),
-            'Priority Horizon': extract_field(fields.get('Priority Horizon', '')),
-            'Priority Status': extract_field(fields.get('Priority Status', '')),
-            'Priority Due Date': extract_field(fields.get('Priority Due Date', '')),
-            'Days Until Due': fields.get('Days Until Due', ''),
-            'Is Overdue': fields.get('Is Overdue', ''),
-            'Task Age (days)': fields.get('Task Age (days)', ''),
-            'Task Summary (AI)': extract_field(fields.get('Task Summary (AI)', '')),
-            'Suggested Next Action (AI)': extract_field(fields.get('Suggested Next Action (AI)', '')),
-        })
-    return rows
-
-
-def save_csv(rows, columns, filename):
-    """Write rows to CSV file."""
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=columns)
-        writer.writeheader()
-        writer.writerows(rows)
-    return filepath
+    builder = TASKS.builder(local_formulas)
+    pages = resumable_pages(table, journal, builder.build, PAGE_SIZE, run,
+                            **TASKS.fetch_options(local_lookups, local_formulas))
+    return [row for page in pages for row in page]
 
 
-def main():
-    """Main sync function."""
-    print('=' * 50)
-    print('DIN CHARYA SYNC')
-    print('=' * 50)
-    print(f'Started: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-    print()
+def fetch_changed_records(table, since, known_ids, fields, id_fields, refetch=()):
+    """Fetch records modified since the last poll, plus unseen and refetch IDs.
 
-    api = Api(API_KEY)
+    Returns (changed records, deleted IDs, current IDs).
+    """
+    cutoff = (since - WATERMARK_OVERLAP).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    formula = f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{cutoff}'))"
+    changed = {rec['id']: rec for rec in table.all(formula=formula, fields=fields)}
 
-    # Fetch Priorities
-    print('Fetching priorities...')
-    priorities = fetch_priorities(api)
-    print(f'  Found: {len(priorities)} priorities')
+    # Cheap ID-only pass: detects deletions and records created without a
+    # modification time newer than the watermark
+    current_ids = {rec['id'] for rec in table.all(fields=id_fields)}
+    missing = ((current_ids - known_ids) | (current_ids & set(refetch))) - set(changed)
+    if missing:
+        formula = 'OR(' + ', '.join(f"RECORD_ID()='{rid}'" for rid in sorted(missing)) + ')'
+        for rec in table.all(formula=formula, fields=fields):
+            changed[rec['id']] = rec
 
-    priorities_file = save_csv(priorities, PRIORITY_COLUMNS, 'priorities.csv')
-    print(f'  Saved: {priorities_file}')
+    deleted = known_ids - current_ids
+    return list(changed.values()), deleted, current_ids
 
-    # Fetch Tasks
-    print()
-    print('Fetching tasks...')
-    tasks = fetch_tasks(api)
-    print(f'  Found: {len(tasks)} tasks')
 
-    tasks_file = save_csv(tasks, TASK_COLUMNS, 'tasks.csv')
-    print(f'  Saved: {tasks_file}')
+def rank_key(row):
+    """Airtable's ascending Rank order: blank Ranks first."""
+    rank = row[RANK]
+    if rank in ('', None):
+        return (False, 0.0)
+    return (True, float(rank))
+
+
+def merge_rows(existing, changed, deleted, key=None):
+    """Apply changed and deleted rows to existing ones, in full-fetch order.
+
+    A changed row replaces its record in place and a new one is appended,
+    as Airtable lists records in creation order; with key the rows are then
+    re-sorted (stably) the way the table's sorted fetch returns them.
+    """
+    updates = {row[ID]: row for row in changed}
+    merged = [updates.pop(row[ID], row) for row in existing if row[ID] not in deleted]
+    merged.extend(updates.values())
+    return sorted(merged, key=key) if key else merged
+
+
+def fetch_changes(api, run, name, previous, refetch=(), local_lookups=False,
+                  local_formulas=False):
+    """Poll a table for changes and merge them into the previous pass's rows.
+
+    previous is the table's {'rows', 'since'} watch state. Returns the
+    merged rows and the IDs of the records changed or deleted.
+    """
+    config = CONFIGS[name]
+    table = api.table(BASE_ID, TABLE_IDS[name])
+    builder = config.builder(local_formulas)
+    known_ids = {row[ID] for row in previous['rows']}
+    with run.phase('fetch'):
+        records, deleted, _ = fetch_changed_records(
+            table, previous['since'], known_ids, config.fields(local_lookups, local_formulas),
+            ID_ONLY_FIELDS[name], refetch)
+    with run.phase('transform'):
+        changed = [builder.build(rec) for rec in records]
+    print(f'  Changed: {len(changed)} {name}')
+    print(f'  Deleted: {len(deleted)} {name}')
+    rows = merge_rows(previous['rows'], changed, deleted, rank_key if name == 'priorities' else None)
+    return rows, {row[ID] for row in changed} | deleted
+
+
+def linked_tasks(tasks, priority_ids):
+    """IDs of the tasks linked to any of priority_ids."""
+    return {row[ID] for row in tasks
+            if priority_ids.intersection(str(row[PRIORITY_LINK]).split(LIST_SEPARATOR))}
+
 
-    # Summary
+def resolve_priority_lookups(tasks, priorities):
+    """Fill the tasks' Priority lookup columns by joining on the fetched priorities."""
+    index = IndexedTable(PRIORITY_COLUMNS, priorities)
+    return resolve_lookups(tasks, TASK_ROW, TASKS.lookups, {'priorities': index})
+
+
+def save_sqlite(rows, builder, table, path):
+    """Upsert rows into the SQLite mirror, one transaction per page."""
+    mirror = SQLiteMirror(path, table, builder, SQLITE_INDEXES[table])
+    for start in range(0, len(rows), PAGE_SIZE):
+        mirror.write(rows[start:start + PAGE_SIZE])
+    mirror.close()
+    return path
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description='Sync Din Charya priorities and tasks to CSV.')
+    parser.add_argument('--concurrent', action='store_true',
+                        help='fetch both tables at the same time')
+    parser.add_argument('--local-lookups', action='store_true',
+                        help='fetch only Priority link IDs for tasks and resolve the '
+                             'Priority lookup columns locally')
+    parser.add_argument('--local-formulas', action='store_true',
+                        help='skip fetching formula columns and compute them locally')
+    parser.add_argument('--sqlite', nargs='?', const=DEFAULT_PATH, metavar='PATH',
+                        help=f'also mirror both tables into an indexed SQLite database '
+                             f'(default: {os.path.basename(DEFAULT_PATH)})')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='write a JSON metrics record for the run')
+    parser.add_argument('--prometheus', metavar='PATH',
+                        help='write run metrics in Prometheus textfile format')
+    parser.add_argument('--summary', metavar='PATH',
+                        help='write the run summary statistics as JSON')
+    add_watch_arguments(parser)
+    return parser.parse_args()
+
+
+def sync(args, api, metrics, state=None):
+    """Run one sync pass; return its SyncMetrics, summaries and manifests by table.
+
+    state (watch mode) holds each table's fetched rows and when they were
+    fetched. Once it has both tables, a pass only polls for the records
+    changed since and merges them in; either way state is updated.
+    """
+    run = SyncMetrics('dincharya', client=metrics)
+    started = datetime.now(timezone.utc)
+
+    jobs = {
+        'priorities': (partial(fetch_priorities, local_formulas=args.local_formulas),
+                       PRIORITY_ROW, 'priorities.csv'),
+        'tasks': (partial(fetch_tasks, local_lookups=args.local_lookups,
+                          local_formulas=args.local_formulas),
+                  TASK_ROW, 'tasks.csv'),
+    }
+    journals = {
+        'priorities': PRIORITIES.journal(local_formulas=args.local_formulas),
+        'tasks': TASKS.journal(args.local_lookups, args.local_formulas),
+    }
+    derive = {
+        'priorities': PRIORITIES.derive() if args.local_formulas else None,
+        'tasks': TASKS.derive() if args.local_formulas else None,
+    }
+    results = {}
+    fetched = {}
+    changes = {}
+    summaries = {}
+
+    def save(name, builder, filename):
+        print(f'  Found: {len(results[name])} {name}')
+        # Rows as fetched (before lookups and derived columns) seed the next poll
+        since = min(started, journals[name].created or started)
+        fetched[name] = {'rows': results[name], 'since': since}
+        if name == 'tasks' and args.local_lookups:
+            with run.phase('join'):
+                results[name] = resolve_priority_lookups(results[name], results['priorities'])
+        # Rows go to a temporary file that replaces the CSV only when a record
+        # hash differs from the last run (or the derived columns' date moved on)
+        with CSVOutput(os.path.join(OUTPUT_DIR, filename), builder, derive[name]) as output:
+            if derive[name] is not None:
+                with run.phase('derive'):
+                    results[name] = output.derive(results[name])
+            run.add_records(len(results[name]))
+            with run.phase('summary'):
+                summaries[name] = CONFIGS[name].summarize()
+                summaries[name].add(results[name])
+            with run.phase('write'):
+                output.write(results[name])
+                output.commit()
+        changes[name] = output.manifest
+        status = 'Saved' if changes[name].replaced else 'Unchanged'
+        print(f'  {status}: {os.path.join(OUTPUT_DIR, filename)}')
+        if args.sqlite:
+            with run.phase('sinks'):
+                path = save_sqlite(results[name], builder, name, args.sqlite)
+            print(f'  Mirrored: {path}')
+        journals[name].finish()
+
+    if state and all(name in state for name in jobs):
+        # Priorities first: a task whose linked priority changed is re-read
+        # when its lookups come from Airtable, since a lookup changing does
+        # not touch the task's last modified time
+        touched = set()
+        for name, (_, builder, filename) in jobs.items():
+            if results:
+                print()
+            print(f'Polling {name} for changes...')
+            refetch = ()
+            if name == 'tasks' and not args.local_lookups:
+                refetch = linked_tasks(state['tasks']['rows'], touched)
+            results[name], touched = fetch_changes(api, run, name, state[name], refetch,
+                                                   args.local_lookups, args.local_formulas)
+            save(name, builder, filename)
+    elif args.concurrent:
+        # Fetch both tables at once, saving each as soon as it arrives
+        print('Fetching priorities and tasks concurrently...')
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = {pool.submit(fetch, api, run, journals[name]): name
+                       for name, (fetch, _, _) in jobs.items()}
+            # Local lookups need the priorities before tasks can be saved
+            for future in futures if args.local_lookups else as_completed(futures):
+                name = futures[future]
+                _, builder, filename = jobs[name]
+                results[name] = future.result()
+                save(name, builder, filename)
+    else:
+        for name, (fetch, builder, filename) in jobs.items():
+            if results:
+                print()
+            print(f'Fetching {name}...')
+            results[name] = fetch(api, run, journals[name])
+            save(name, builder, filename)
+
+    if state is not None:
+        state.update(fetched)
+    run.finish()
+    if args.metrics:
+        run.write_json(args.metrics)
+    if args.prometheus:
+        run.write_prometheus(args.prometheus)
+    if args.summary:
+        write_summary_json(args.summary, summaries)
+    return run, summaries, changes
+
+
+def print_summary(run, summaries, changes, metrics):
+    """Print the end-of-run summary."""
     print()
     print('-' * 50)
     print('SYNC COMPLETE')
     print('-' * 50)
-    print(f'  Priorities: {len(priorities)}')
-    print(f'  Tasks: {len(tasks)}')
+    print(f'  Priorities: {summaries["priorities"].records}')
+    print(f'  Tasks: {summaries["tasks"].records}')
+    for name, manifest in changes.items():
+        print(f'  Changes ({name}): {manifest.summary()}')
+    print(f'  API: {metrics.summary()}')
+    print(f'  Phases: {run.summary()}')
     print(f'  Time: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
 
-    # Show horizon distribution
-    if priorities:
-        horizons = {}
-        for p in priorities:
-            h = p['Horizon'] or 'Unknown'
-            horizons[h] = horizons.get(h, 0) + 1
-        print(f'  Horizons: {dict(sorted(horizons.items()))}')
-
-    # Show status distribution
-    if priorities:
-        statuses = {}
-        for p in priorities:
-            s = p['Status'] or 'Unknown'
-            statuses[s] = statuses.get(s, 0) + 1
-        print(f'  Statuses: {dict(sorted(statuses.items()))}')
+    # Horizon and status distributions, completion % by horizon, task statuses
+    for name in ('priorities', 'tasks'):
+        if summaries[name].records:
+            print(summaries[name].text())
+
+    print('=' * 50)
+
 
+def main():
+    """Main sync function."""
+    args = parse_args()
+
+    print('=' * 50)
+    print('DIN CHARYA SYNC')
     print('=' * 50)
+    print(f'Started: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+    print()
+
+    # Both tables live in one base, so requests share its rate limit. One
+    # client serves the whole process, so watch mode reuses its connections
+    metrics = ClientMetrics()
+    api = connect(API_KEY, metrics=metrics)
+
+    if not args.watch:
+        run, summaries, changes = sync(args, api, metrics)
+        print_summary(run, summaries, changes, metrics)
+        return
+
+    # Watch mode: fetch both tables once, then poll for changes and merge
+    # them into the rows held here; unchanged tables are not rewritten
+    state = {}
+
+    def cycle():
+        run, _, changes = sync(args, api, metrics, state)
+        return run, sum(sum(manifest.diff().values()) for manifest in changes.values())
+
+    watcher = Watcher('dincharya', cycle, args.interval, args.max_interval)
+    if args.health_port is not None:
+        watcher.serve_health(args.health_port)
+    watcher.run()
 
 
 if __name__ == '__main__':
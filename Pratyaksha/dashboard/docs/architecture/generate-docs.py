@@ -6,6 +6,10 @@ Creates multi-page SVG documentation for product wireframes, AI architecture, DB
 
 import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from docgen.render import Page, build_parser, render_pages
 
 # Configuration
 OUTPUT_DIR = "output"
@@ -425,26 +429,22 @@ def create_system_architecture_page(colors):
   </text>
 </svg>'''
 
-def generate_all_pages():
-    """Generate all documentation pages"""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    colors = COLORS[THEME]
+PAGES = [
+    Page('00-cover.svg', create_cover_page, (COLORS[THEME],)),
+    Page('01-system-architecture.svg', create_system_architecture_page, (COLORS[THEME],)),
+]
 
-    pages = [
-        ('00-cover', create_cover_page(colors)),
-        ('01-system-architecture', create_system_architecture_page(colors)),
-    ]
-
-    for page_id, content in pages:
-        filename = f"{OUTPUT_DIR}/{page_id}.svg"
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✓ Created {filename}")
-
-    print(f"\n✅ Generated {len(pages)} pages in {OUTPUT_DIR}/")
+def generate_all_pages(workers=None, force=False):
+    """Generate all documentation pages"""
+    report = render_pages(PAGES, OUTPUT_DIR, workers, force)
+    print(f"\n✅ Generated {len(PAGES)} pages in {OUTPUT_DIR}/")
+    print(report.text())
+    return report
 
 if __name__ == '__main__':
+    args = build_parser('Generate the SVG architecture docs.').parse_args()
     print("\n🎨 Pratyaksha Architecture Documentation Generator")
     print("=" * 60)
-    generate_all_pages()
+    report = generate_all_pages(args.workers, args.force)
+    if args.timings:
+        report.write_json(args.timings)
@@ -5,6 +5,10 @@ Creates multi-page HTML documentation with print support (B&W)
 """
 
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from docgen.render import Page, build_parser, render_pages, styles_option
 
 OUTPUT_DIR = "html-docs"
 
@@ -855,26 +859,24 @@ def create_system_architecture_page():
 </body>
 </html>'''
 
-def generate_all_pages():
-    """Generate all documentation pages"""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    pages = [
-        ('00-cover.html', create_cover_page()),
-        ('01-system-architecture.html', create_system_architecture_page()),
-    ]
+PAGES = [
+    Page('00-cover.html', create_cover_page),
+    Page('01-system-architecture.html', create_system_architecture_page),
+]
 
-    for filename, content in pages:
-        filepath = f"{OUTPUT_DIR}/{filename}"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✓ Created {filepath}")
-
-    print(f"\n✅ Generated {len(pages)} pages in {OUTPUT_DIR}/")
+def generate_all_pages(workers=None, force=False, styles=None):
+    """Generate all documentation pages"""
+    report = render_pages(PAGES, OUTPUT_DIR, workers, force, styles)
+    print(f"\n✅ Generated {len(PAGES)} pages in {OUTPUT_DIR}/")
+    print(report.text())
     print(f"\n📖 Open {OUTPUT_DIR}/00-cover.html in your browser")
     print(f"🖨️  Press Ctrl+P (Cmd+P) to print in B&W")
+    return report
 
 if __name__ == '__main__':
+    args = build_parser('Generate the HTML architecture docs.', stylesheets=True).parse_args()
     print("\n🎨 Pratyaksha Architecture Documentation Generator (HTML)")
     print("=" * 70)
-    generate_all_pages()
+    report = generate_all_pages(args.workers, args.force, styles_option(args, OUTPUT_DIR))
+    if args.timings:
+        report.write_json(args.timings)
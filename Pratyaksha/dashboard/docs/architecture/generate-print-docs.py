@@ -2,363 +2,34 @@
 """
 Pratyaksha Architecture Documentation - Print Version
 Simple black text on white background for easy printing
+
+Writes one file per page (print-docs/) and, from the same rendered pages,
+the combined print document (docs-final/). Pages are defined once, in
+doc_pages.py.
 """
 
 import os
-
-OUTPUT_DIR = "print-docs"
-
-CSS_STYLES = '''
-<style>
-* {
-  margin: 0;
-  padding: 0;
-  box-sizing: border-box;
-}
-
-body {
-  font-family: Arial, sans-serif;
-  line-height: 1.6;
-  color: #000000;
-  background: #ffffff;
-  font-size: 11pt;
-}
-
-.page {
-  max-width: 210mm;
-  min-height: 297mm;
-  margin: 0 auto;
-  padding: 20mm;
-  background: #ffffff;
-}
-
-.header {
-  border-bottom: 3px solid #000;
-  padding-bottom: 15px;
-  margin-bottom: 25px;
-}
-
-.header h1 {
-  font-size: 24pt;
-  font-weight: bold;
-  margin-bottom: 8px;
-}
-
-.subtitle {
-  font-size: 12pt;
-  color: #333;
-}
-
-.page-number {
-  float: right;
-  font-size: 10pt;
-  color: #666;
-}
-
-.section {
-  margin: 20px 0;
-}
-
-.section-title {
-  font-size: 16pt;
-  font-weight: bold;
-  margin: 20px 0 10px 0;
-  border-left: 4px solid #000;
-  padding-left: 10px;
-}
-
-.subsection-title {
-  font-size: 13pt;
-  font-weight: bold;
-  margin: 15px 0 8px 0;
-}
-
-.card {
-  border: 2px solid #000;
-  padding: 15px;
-  margin: 15px 0;
-  page-break-inside: avoid;
-}
-
-.card-header {
-  font-size: 12pt;
-  font-weight: bold;
-  margin-bottom: 10px;
-}
-
-ul, ol {
-  margin-left: 20px;
-  margin-top: 8px;
-}
-
-li {
-  margin: 5px 0;
-}
-
-table {
-  width: 100%;
-  border-collapse: collapse;
-  margin: 15px 0;
-  page-break-inside: avoid;
-}
-
-th {
-  background: #f0f0f0;
-  font-weight: bold;
-  padding: 8px;
-  text-align: left;
-  border: 1px solid #000;
-}
-
-td {
-  padding: 6px 8px;
-  border: 1px solid #000;
-}
-
-.code {
-  background: #f5f5f5;
-  border-left: 3px solid #000;
-  padding: 10px;
-  font-family: 'Courier New', monospace;
-  font-size: 9pt;
-  margin: 10px 0;
-  page-break-inside: avoid;
-}
-
-.highlight {
-  background: #f0f0f0;
-  border: 1px solid #000;
-  padding: 12px;
-  margin: 15px 0;
-  page-break-inside: avoid;
-}
-
-.highlight-title {
-  font-weight: bold;
-  margin-bottom: 8px;
-}
-
-.badge {
-  display: inline-block;
-  padding: 2px 8px;
-  border: 1px solid #000;
-  border-radius: 3px;
-  font-size: 9pt;
-  font-weight: bold;
-  margin: 0 3px;
-}
-
-.flow-container {
-  text-align: center;
-  margin: 20px 0;
-  page-break-inside: avoid;
-}
-
-.flow-box {
-  display: inline-block;
-  border: 2px solid #000;
-  padding: 10px 15px;
-  margin: 5px;
-  min-width: 150px;
-  vertical-align: middle;
-}
-
-.flow-arrow {
-  display: inline-block;
-  margin: 0 5px;
-  font-size: 14pt;
-  font-weight: bold;
-}
-
-.footer {
-  margin-top: 30px;
-  padding-top: 15px;
-  border-top: 2px solid #000;
-  text-align: center;
-  font-size: 10pt;
-}
-
-@media print {
-  .page {
-    margin: 0;
-    padding: 15mm;
-  }
-
-  @page {
-    margin: 15mm;
-  }
-}
-</style>
-'''
-
-def create_cover():
-    return f'''<!DOCTYPE html>
-<html>
-<head>
-  <meta charset="UTF-8">
-  <title>Pratyaksha Architecture Documentation</title>
-  {CSS_STYLES}
-</head>
-<body>
-  <div class="page">
-    <div class="header" style="text-align: center; border: none; margin-bottom: 40px;">
-      <h1 style="font-size: 32pt; margin-bottom: 15px;">PRATYAKSHA</h1>
-      <p style="font-size: 16pt; font-weight: bold;">Cognitive Journaling Platform</p>
-      <p style="font-size: 12pt; margin-top: 10px;">Technical Architecture Documentation</p>
-      <p style="font-size: 11pt; color: #666; margin-top: 8px;">Version 1.0 • February 2026</p>
-    </div>
-
-    <div class="section">
-      <h2 class="section-title">Product Overview</h2>
-      <p style="margin-bottom: 15px;">
-        AI-powered journaling platform that analyzes emotional patterns, provides personalized insights,
-        and helps users understand their cognitive and emotional landscape through data-driven reflection.
-      </p>
-
-      <table>
-        <tr>
-          <th style="width: 30%;">Component</th>
-          <th>Description</th>
-        </tr>
-        <tr>
-          <td><strong>4-Agent AI Pipeline</strong></td>
-          <td>Intent → Emotion → Theme → Insight sequential processing</td>
-        </tr>
-        <tr>
-          <td><strong>RAG Chat</strong></td>
-          <td>Semantic search with pgvector, two-pass generation</td>
-        </tr>
-        <tr>
-          <td><strong>Personalization</strong></td>
-          <td>Soul Mapping (5 topics), Life Blueprint (vision/goals/levers)</td>
-        </tr>
-        <tr>
-          <td><strong>Database</strong></td>
-          <td>PostgreSQL 16 + pgvector, 13 tables, Drizzle ORM</td>
-        </tr>
-      </table>
-    </div>
-
-    <div class="section">
-      <h2 class="section-title">Tech Stack</h2>
-
-      <div class="subsection-title">Frontend</div>
-      <ul>
-        <li><strong>Framework:</strong> React 18 + Vite (Port 5173)</li>
-        <li><strong>State Management:</strong> TanStack Query (5min stale, 30s polling)</li>
-        <li><strong>Styling:</strong> Tailwind CSS + shadcn/ui components</li>
-        <li><strong>Charts:</strong> Recharts for data visualization</li>
-        <li><strong>Authentication:</strong> Firebase Auth with JWT tokens</li>
-      </ul>
-
-      <div class="subsection-title">Backend</div>
-      <ul>
-        <li><strong>Framework:</strong> Express + TypeScript (Port 3001)</li>
-        <li><strong>Database:</strong> PostgreSQL 16 on Cloud SQL (34.55.195.199)</li>
-        <li><strong>ORM:</strong> Drizzle ORM with postgres driver</li>
-        <li><strong>AI:</strong> LangChain + OpenRouter (gpt-4o, gpt-4o-mini)</li>
-        <li><strong>Vectors:</strong> pgvector v0.8.1 (1536d embeddings)</li>
-        <li><strong>Speech:</strong> Groq SDK (Whisper + llama-3.3-70b)</li>
-      </ul>
-
-      <div class="subsection-title">AI Models</div>
-      <table>
-        <tr>
-          <th style="width: 40%;">Model</th>
-          <th>Purpose</th>
-        </tr>
-        <tr>
-          <td>gpt-4o</td>
-          <td>Intent Agent, Insight Agent (quality)</td>
-        </tr>
-        <tr>
-          <td>gpt-4o-mini</td>
-          <td>Emotion Agent, Theme Agent (fast & cheap)</td>
-        </tr>
-        <tr>
-          <td>text-embedding-3-small</td>
-          <td>Vector embeddings (1536 dimensions)</td>
-        </tr>
-        <tr>
-          <td>whisper-large-v3</td>
-          <td>Speech-to-text (Groq)</td>
-        </tr>
-      </table>
-    </div>
-
-    <div class="section">
-      <h2 class="section-title">Documentation Index</h2>
-
-      <table>
-        <tr>
-          <th style="width: 15%;">Page</th>
-          <th>Content</th>
-        </tr>
-        <tr>
-          <td>Page 01</td>
-          <td><strong>System Architecture</strong> - 3-tier architecture (Client, API, Data)</td>
-        </tr>
-        <tr>
-          <td>Page 02</td>
-          <td><strong>4-Agent AI Pipeline</strong> - Intent, Emotion, Theme, Insight agents</td>
-        </tr>
-        <tr>
-          <td>Page 03</td>
-          <td><strong>RAG Pipeline</strong> - Embedding generation & semantic search</td>
-        </tr>
-        <tr>
-          <td>Page 04</td>
-          <td><strong>Database Schema</strong> - All 13 tables with relationships</td>
-        </tr>
-        <tr>
-          <td>Page 05</td>
-          <td><strong>User Profile Schema</strong> - Soul Mapping & Life Blueprint</td>
-        </tr>
-        <tr>
-          <td>Page 06</td>
-          <td><strong>Entry Processing Flow</strong> - From input to storage</td>
-        </tr>
-      </table>
-    </div>
-
-    <div class="highlight">
-      <div class="highlight-title">Key Statistics (Feb 2026)</div>
-      <ul>
-        <li><strong>Total Users:</strong> 24 (6 original Airtable, 18 test users)</li>
-        <li><strong>Total Entries:</strong> 323 journal entries</li>
-        <li><strong>Embeddings:</strong> 322/323 (99.7% coverage)</li>
-        <li><strong>Processing Time:</strong> 8-12 seconds per entry</li>
-        <li><strong>Cost per Entry:</strong> ~$0.02-0.04</li>
-        <li><strong>Personalization:</strong> 90-100% with full profile</li>
-      </ul>
-    </div>
-
-    <div class="footer">
-      <p>Pratyaksha Technical Documentation • Version 1.0 • February 2026</p>
-      <p style="margin-top: 8px;">Page 00 of 06</p>
-    </div>
-  </div>
-</body>
-</html>'''
-
-def generate_all():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    pages = [
-        ('00-cover.html', create_cover()),
-    ]
-
-    for filename, content in pages:
-        filepath = f"{OUTPUT_DIR}/{filename}"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✓ {filename}")
-
-    print(f"\n✅ Generated {len(pages)} pages in {OUTPUT_DIR}/")
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from docgen.render import build_parser, styles_option, write_timings
+from doc_pages import DOC_PAGES, PAGES_DIR, TARGETS, build
+
+def generate_all(targets=TARGETS, workers=None, force=False, styles=None):
+    reports = build(targets, workers, force, styles)
+    if 'pages' in reports:
+        print(f"\n✅ Generated {len(DOC_PAGES) + 1} pages in {PAGES_DIR}/")
+    for report in reports.values():
+        print(report.text())
     print("📄 Black text on white background - ready to print!")
-
-generate_all()
-
-# Continue with remaining pages...
-print("\n📚 Generating remaining pages...")
-print("This will take 30-60 seconds...")
+    return reports
+
+if __name__ == '__main__':
+    parser = build_parser('Generate the per-page print architecture docs and the complete document.',
+                          stylesheets=True)
+    parser.add_argument('--only', choices=TARGETS, help='write only the per-page files or the complete document')
+    args = parser.parse_args()
+    reports = generate_all((args.only,) if args.only else TARGETS, args.workers, args.force,
+                           styles_option(args, PAGES_DIR))
+    if args.timings:
+        write_timings(args.timings, reports)
@@ -0,0 +1,12 @@
+"""
+Doc Generator Support
+=====================
+Shared building blocks for the documentation generator scripts
+(architecture/generate-*.py and ui-flow/generate-*.py).
+
+Modules:
+    - render: declarative page registration and a process-pool render engine
+    - cache: per-page input fingerprints for incremental builds
+    - templates: layouts and partials compiled once to bytecode
+    - assets: shared content-hashed stylesheets instead of inline CSS
+"""
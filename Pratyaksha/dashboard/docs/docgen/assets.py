@@ -0,0 +1,136 @@
+"""
+Shared Stylesheets
+==================
+Moves the <style> block every generated HTML page inlines into one
+content-hashed stylesheet per distinct block, shared by all pages of the
+build, so a browser downloads and parses the CSS once and caches it for
+good (the name changes whenever the CSS does).
+
+For each rendered page, every <style> block is replaced by
+<link rel="stylesheet" href="styles.<hash>.css">. Identical blocks (the
+same CSS_STYLES on every page) are written once. Stylesheets can be
+minified, and get precompressed siblings (styles.<hash>.css.gz, and .br
+with the optional brotli package: pip install brotli) for servers that
+serve precompressed files. Stylesheets no page references any more are
+removed at the end of the build.
+
+Usage:
+    styles = ExternalStyles(OUTPUT_DIR, minify=True, compress=('gz',))
+    html = styles.apply(html)          # for every page
+    styles.finish(page_paths)
+    print(styles.summary())
+
+    python generate-ui-flow.py --external-css --minify-css --compress gz --compress br
+"""
+
+import gzip
+from hashlib import blake2b
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+# A <style> block with the whitespace around it
+STYLE_BLOCK = re.compile(r'\s*<style>\n?(.*?)</style>\s*', re.S)
+STYLESHEET = re.compile(r'styles\.[0-9a-f]{16}\.css')
+COMPRESSIONS = ('gz', 'br')
+
+
+def require_brotli():
+    """Raise a helpful error when brotli is not installed."""
+    if brotli is None:
+        raise RuntimeError('.br stylesheets require brotli: pip install brotli')
+
+
+def minify_css(css):
+    """Drop comments and insignificant whitespace (enough for the generators' plain CSS)."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip() + '\n'
+
+
+def prune_stylesheets(output_dir, page_paths, keep=()):
+    """Remove hashed stylesheets (and their .gz/.br siblings) no page links to; return their names."""
+    referenced = set(keep)
+    for path in page_paths:
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                referenced.update(STYLESHEET.findall(f.read()))
+    removed = []
+    for name in sorted(os.listdir(output_dir)):
+        base = name
+        for suffix in ('.gz', '.br'):
+            base = base.removesuffix(suffix)
+        if STYLESHEET.fullmatch(base) and base not in referenced:
+            os.remove(os.path.join(output_dir, name))
+            removed.append(name)
+    return removed
+
+
+class ExternalStyles:
+    """Replaces inline <style> blocks with links to shared, hashed stylesheets."""
+
+    def __init__(self, output_dir, minify=False, compress=()):
+        self.output_dir = output_dir
+        self.minify = minify
+        self.compress = tuple(compress)
+        if 'br' in self.compress:
+            require_brotli()
+        self.written = {}     # stylesheet name -> size in bytes
+        self.pages = 0
+        self.inline_bytes = 0
+        self.removed = []
+
+    def variant(self):
+        """Build-cache variant: pages rendered with other style options are stale."""
+        return f'external-css minify={self.minify} compress={",".join(sorted(self.compress))}'
+
+    def stylesheet(self, css):
+        """Write (once) the stylesheet for one block of CSS; return its file name."""
+        text = minify_css(css) if self.minify else css
+        data = text.encode('utf-8')
+        name = f'styles.{blake2b(data, digest_size=8).hexdigest()}.css'
+        if name not in self.written:
+            # The name is the content hash, so an existing file is already right
+            path = os.path.join(self.output_dir, name)
+            files = [(path, lambda: data)]
+            if 'gz' in self.compress:
+                files.append((path + '.gz', lambda: gzip.compress(data, compresslevel=9, mtime=0)))
+            if 'br' in self.compress:
+                files.append((path + '.br', lambda: brotli.compress(data, quality=11)))
+            for file_path, content in files:
+                if not os.path.exists(file_path):
+                    with open(file_path, 'wb') as f:
+                        f.write(content())
+            self.written[name] = len(data)
+        return name
+
+    def apply(self, html):
+        """Return a page with its <style> blocks replaced by stylesheet links."""
+        def link(match):
+            self.inline_bytes += len(match.group(0).encode('utf-8'))
+            return f'\n  <link rel="stylesheet" href="{self.stylesheet(match.group(1))}">\n'
+
+        html, count = STYLE_BLOCK.subn(link, html)
+        if count:
+            self.pages += 1
+        return html
+
+    def finish(self, page_paths):
+        """Remove stylesheets that no page links to any more."""
+        self.removed = prune_stylesheets(self.output_dir, page_paths, self.written)
+
+    def summary(self):
+        """One-line stylesheet summary."""
+        if not self.written:
+            return 'Stylesheets: none written (no page rendered)'
+        sizes = ', '.join(f'{name} ({size / 1024:.1f} KB)' for name, size in self.written.items())
+        text = (f'Stylesheets: {sizes} shared by {self.pages} pages, '
+                f'{self.inline_bytes / 1024:.1f} KB of inline CSS removed')
+        if self.removed:
+            text += f', {len(self.removed)} stale files removed'
+        return text
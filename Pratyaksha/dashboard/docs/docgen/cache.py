@@ -0,0 +1,186 @@
+"""
+Build Cache
+===========
+Fingerprints every page's inputs so a build only renders and writes the
+pages whose inputs changed.
+
+A page's fingerprint hashes:
+    - the source of its page function
+    - every module-level value the function reads (CSS_STYLES, COLORS,
+      PAGE_WIDTH, screen specs, ...), following helper functions it calls
+    - the sources of any docgen.templates Templates it renders
+    - its arguments (e.g. the theme colors)
+    - the contents of any data files the Page lists
+
+Fingerprints and a hash of each written file are kept in
+.docgen-cache.json in the output directory. A page is a hit when its
+fingerprint is unchanged and its file still has the recorded content;
+otherwise it is re-rendered, and only written when the result differs
+from the file on disk, so unchanged files keep their mtime and browsers
+do not reload them.
+
+Usage:
+    cache = BuildCache(OUTPUT_DIR)
+    if not cache.fresh(page):
+        content = page.render(*page.args)
+        cache.record(page, content)
+    cache.save(pages)
+"""
+
+from hashlib import blake2b
+import inspect
+import json
+import os
+import types
+
+CACHE_FILE = '.docgen-cache.json'
+# Bump when rendering or writing changes in a way old fingerprints cannot see
+CACHE_VERSION = 2
+# Plain values hashed by repr(); containers and __slots__ specs are walked,
+# objects with a fingerprint() method (Templates) hash as that, and anything
+# else (modules, classes, open files, ...) is ignored
+VALUE_TYPES = (str, bytes, int, float, bool, type(None))
+CONTAINER_TYPES = (dict, list, tuple, frozenset, set)
+
+
+def content_hash(text):
+    """Hash of a rendered page as written (UTF-8)."""
+    return blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def has_fingerprint(value):
+    """True for objects that hash themselves (e.g. docgen.templates.Templates)."""
+    return (not isinstance(value, (type, types.ModuleType))
+            and callable(getattr(value, 'fingerprint', None)))
+
+
+def hashable(value):
+    """True for values stable_repr can describe the same way in every run."""
+    return (isinstance(value, VALUE_TYPES + CONTAINER_TYPES) or has_fingerprint(value)
+            or hasattr(type(value), '__slots__') and not isinstance(value, (type, types.ModuleType)))
+
+
+def stable_repr(value):
+    """repr() that is the same across runs: no memory addresses, sets sorted."""
+    if has_fingerprint(value):
+        return f'<{type(value).__name__} {value.fingerprint()}>'
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{stable_repr(k)}: {stable_repr(v)}' for k, v in value.items()) + '}'
+    if isinstance(value, (list, tuple)):
+        return f'{type(value).__name__}(' + ', '.join(map(stable_repr, value)) + ')'
+    if isinstance(value, (set, frozenset)):
+        return f'{type(value).__name__}(' + ', '.join(sorted(map(stable_repr, value))) + ')'
+    if isinstance(value, types.FunctionType):
+        return f'<function {value.__module__}.{value.__qualname__}>'
+    if isinstance(value, VALUE_TYPES):
+        return repr(value)
+    slots = getattr(type(value), '__slots__', ())
+    return f'{type(value).__name__}(' + ', '.join(
+        f'{name}={stable_repr(getattr(value, name, None))}' for name in slots) + ')'
+
+
+def global_names(code):
+    """Names a code object (and the comprehensions or closures inside it) looks up."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= global_names(const)
+    return names
+
+
+def function_inputs(fn, seen=None):
+    """Yield (label, text) for a function's source and the module values it depends on."""
+    seen = set() if seen is None else seen
+    if fn in seen:
+        return
+    seen.add(fn)
+    try:
+        source = inspect.getsource(fn)
+    except (OSError, TypeError):
+        source = fn.__code__.co_code.hex()
+    yield f'{fn.__module__}.{fn.__qualname__}', source
+    module = fn.__globals__
+    for name in sorted(global_names(fn.__code__)):
+        if name not in module:
+            continue
+        value = module[name]
+        if isinstance(value, types.FunctionType):
+            yield from function_inputs(value, seen)
+        elif hashable(value):
+            yield name, stable_repr(value)
+
+
+def fingerprint(page):
+    """Hash of everything a page's content depends on."""
+    h = blake2b(digest_size=16)
+
+    def add(label, text):
+        h.update(f'{label}\x1f{len(text)}\x1f'.encode('utf-8'))
+        h.update(text if isinstance(text, bytes) else text.encode('utf-8'))
+
+    add('version', str(CACHE_VERSION))
+    for label, text in function_inputs(page.render):
+        add(label, text)
+    add('args', stable_repr(page.args))
+    for path in page.files:
+        with open(path, 'rb') as f:
+            add(f'file:{path}', f.read())
+    return h.hexdigest()
+
+
+class BuildCache:
+    """Recorded fingerprints and output hashes of one output directory."""
+
+    def __init__(self, output_dir, force=False, variant=''):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, CACHE_FILE)
+        # Output options (e.g. external stylesheets); pages built with others are stale
+        self.variant = variant
+        self.entries = {}
+        if not force and os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('version') == CACHE_VERSION and saved.get('variant', '') == variant:
+                self.entries = saved['pages']
+        self.fingerprints = {}
+
+    def output_path(self, page):
+        return os.path.join(self.output_dir, page.filename)
+
+    def fresh(self, page):
+        """True when the page's inputs and its file are unchanged since it was recorded."""
+        current = self.fingerprints[page.filename] = fingerprint(page)
+        entry = self.entries.get(page.filename)
+        if entry is None or entry['inputs'] != current:
+            return False
+        try:
+            with open(self.output_path(page), encoding='utf-8') as f:
+                return content_hash(f.read()) == entry['output']
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    def unchanged(self, page, content):
+        """True when content matches what is already on disk (so the write can be skipped)."""
+        path = self.output_path(page)
+        if not os.path.exists(path):
+            return False
+        with open(path, encoding='utf-8') as f:
+            try:
+                return f.read() == content
+            except UnicodeDecodeError:
+                return False
+
+    def record(self, page, content):
+        """Remember the fingerprint and content hash of a rendered page."""
+        inputs = self.fingerprints.get(page.filename) or fingerprint(page)
+        self.entries[page.filename] = {'inputs': inputs, 'output': content_hash(content)}
+
+    def save(self, pages):
+        """Write the cache file, keeping only the given pages."""
+        names = {page.filename for page in pages}
+        entries = {name: entry for name, entry in sorted(self.entries.items()) if name in names}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'variant': self.variant, 'pages': entries}, f, indent=2)
+            f.write('\n')
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,264 @@
+"""
+Page Render Engine
+==================
+Renders a generator's pages in a process pool and writes each file as soon
+as its page is done.
+
+Each generator script registers its pages as a list of Page specs (output
+file name, page function and its arguments) instead of calling every
+page function before writing anything. The engine submits one task per
+page; the parent process writes files in completion order, timing each
+page in the worker that rendered it. Page functions are pure string
+builders, so the files are byte-identical to a serial build (--workers 1).
+
+Builds are incremental (docgen.cache): pages whose fingerprinted inputs
+are unchanged are neither rendered nor written; --force renders them all.
+With --external-css, inline <style> blocks are moved into shared hashed
+stylesheets (docgen.assets).
+
+Page functions must be module-level, so worker processes can look them
+up, and a script's build must only run under `if __name__ == '__main__'`.
+
+Usage:
+    PAGES = [
+        Page('00-cover.html', create_cover_page),
+        Page('01-system-architecture.html', create_system_architecture_page),
+    ]
+
+    if __name__ == '__main__':
+        args = build_parser('Generate the HTML docs.').parse_args()
+        report = render_pages(PAGES, OUTPUT_DIR, workers=args.workers, force=args.force)
+        print(report.text())
+
+    python generate-html-docs.py --workers 4 --timings render_timings.json
+    python generate-html-docs.py --force
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import json
+import os
+import time
+
+from docgen.assets import COMPRESSIONS, ExternalStyles, prune_stylesheets
+from docgen.cache import BuildCache
+
+
+class Page:
+    """One output file: its name in the output directory and the function rendering it.
+
+    files lists data files the page reads; their contents are part of its
+    cache fingerprint. context holds keyword arguments that are not
+    fingerprinted because the args determine them, such as fragments
+    already rendered from the page's specs (see render_fragments).
+    """
+
+    __slots__ = ('filename', 'render', 'args', 'files', 'context')
+
+    def __init__(self, filename, render, args=(), files=(), context=None):
+        self.filename = filename
+        self.render = render
+        self.args = tuple(args)
+        self.files = tuple(files)
+        self.context = context or {}
+
+
+def render_page(page):
+    """Render one page; return (filename, content, seconds). Runs in a worker."""
+    start = time.perf_counter()
+    content = page.render(*page.args, **page.context)
+    return page.filename, content, time.perf_counter() - start
+
+
+def write_page(path, content):
+    """Write a rendered page the way the generators always have (UTF-8 text)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+class RenderReport:
+    """Per-page render times, cache hits and wall time of one build."""
+
+    def __init__(self, output_dir, workers):
+        self.output_dir = output_dir
+        self.workers = workers
+        self.pages = {}
+        self.hits = []
+        self.unchanged = []
+        self.styles = None
+        self.fragments = None
+        self.wall = 0.0
+
+    def add(self, filename, seconds):
+        self.pages[filename] = seconds
+
+    def as_dict(self):
+        """JSON-ready report."""
+        return {
+            'output_dir': self.output_dir,
+            'workers': self.workers,
+            'pages': len(self.pages),
+            'cache_hits': self.hits,
+            'cache_misses': list(self.pages),
+            'unchanged': self.unchanged,
+            'styles': self.styles,
+            'fragments': self.fragments,
+            'wall_seconds': round(self.wall, 4),
+            'render_seconds': {name: round(s, 4) for name, s in self.pages.items()},
+        }
+
+    def text(self):
+        """Console summary: cache hits and misses, totals and the slowest page."""
+        cache = (f'cache: {len(self.hits)} hit{"s" if len(self.hits) != 1 else ""}, '
+                 f'{len(self.pages)} miss{"es" if len(self.pages) != 1 else ""}')
+        if self.unchanged:
+            cache += f', {len(self.unchanged)} re-rendered unchanged'
+        if not self.pages:
+            return f'Nothing to render ({cache})'
+        slowest = max(self.pages, key=self.pages.get)
+        styles = f'\n{self.styles}' if self.styles else ''
+        if self.fragments:
+            styles = (f'\nShared fragments: {self.fragments["count"]} rendered in '
+                      f'{self.fragments["seconds"]:.2f}s') + styles
+        return (f'Rendered {len(self.pages)} pages in {self.wall:.2f}s '
+                f'({self.workers} worker{"s" if self.workers != 1 else ""}, '
+                f'{sum(self.pages.values()):.2f}s page time, '
+                f'slowest {slowest} {self.pages[slowest] * 1000:.1f} ms; {cache}){styles}')
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.as_dict(), indent=2) + '\n')
+
+
+def write_timings(path, reports):
+    """Write several builds' reports to one JSON file, keyed by target."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({target: report.as_dict() for target, report in reports.items()},
+                           indent=2) + '\n')
+
+
+def default_workers(pages):
+    """One worker per CPU, never more than there are pages."""
+    return max(1, min(len(pages), os.cpu_count() or 1))
+
+
+def stale_pages(pages, output_dir, force=False, styles=None):
+    """File names of the pages render_pages() would render (the build cache misses)."""
+    if force:
+        return {page.filename for page in pages}
+    cache = BuildCache(output_dir, False, styles.variant() if styles else '')
+    return {page.filename for page in pages if not cache.fresh(page)}
+
+
+def render_fragments(render, items, workers=None):
+    """Render render(*item) once per item, in a process pool when workers > 1.
+
+    For fragments shared by several outputs (one page file each and a
+    combined document): render them once, then hand them to the pages as
+    Page context. Returns (results in item order, seconds).
+    """
+    items = list(items)
+    start = time.perf_counter()
+    workers = min(workers or os.cpu_count() or 1, max(len(items), 1))
+    if workers == 1:
+        results = [render(*item) for item in items]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(render, *zip(*items)))
+    return results, time.perf_counter() - start
+
+
+def render_pages(pages, output_dir, workers=None, force=False, styles=None):
+    """Render stale pages (in parallel when workers > 1), writing each as it finishes.
+
+    Pages whose inputs are unchanged since the last build are skipped
+    unless force is set. styles, an ExternalStyles, moves each page's
+    inline CSS into shared stylesheets. Returns a RenderReport. A page
+    that fails to render cancels the pages not yet started and raises
+    RuntimeError naming the page.
+    """
+    pages = list(pages)
+    names = [page.filename for page in pages]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f'Pages registered twice: {", ".join(duplicates)}')
+
+    os.makedirs(output_dir, exist_ok=True)
+    cache = BuildCache(output_dir, force, styles.variant() if styles else '')
+    stale = [page for page in pages if not cache.fresh(page)]
+    workers = min(workers or default_workers(stale), max(len(stale), 1))
+    report = RenderReport(output_dir, workers)
+    by_name = {page.filename: page for page in stale}
+    report.hits = [name for name in names if name not in by_name]
+    start = time.perf_counter()
+
+    def finished(filename, content, seconds):
+        path = f'{output_dir}/{filename}'
+        page = by_name[filename]
+        if styles is not None:
+            content = styles.apply(content)
+        report.add(filename, seconds)
+        if not force and cache.unchanged(page, content):
+            report.unchanged.append(filename)
+            print(f'= Unchanged {path}  ({seconds * 1000:.1f} ms)')
+        else:
+            write_page(path, content)
+            print(f'✓ Created {path}  ({seconds * 1000:.1f} ms)')
+        cache.record(page, content)
+
+    try:
+        if workers == 1:
+            for page in stale:
+                finished(*render_page(page))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(render_page, page): page for page in stale}
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as exc:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise RuntimeError(f'Rendering {futures[future].filename} failed: {exc}') from exc
+                    finished(*result)
+    finally:
+        # Keep what was written, even when a page failed
+        cache.save(pages)
+    paths = [f'{output_dir}/{name}' for name in names]
+    if styles is not None:
+        styles.finish(paths)
+        report.styles = styles.summary()
+    else:
+        prune_stylesheets(output_dir, paths)
+
+    # Report pages in registration order, whatever order they finished in
+    report.pages = {name: report.pages[name] for name in names if name in report.pages}
+    report.wall = time.perf_counter() - start
+    return report
+
+
+def build_parser(description, stylesheets=False):
+    """Argument parser with the render options every generator accepts.
+
+    stylesheets adds the external stylesheet options (for multi-page HTML).
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help='render processes (default: one per CPU; 1 renders serially)')
+    parser.add_argument('--timings', metavar='PATH', help='write per-page render times as JSON')
+    parser.add_argument('--force', action='store_true', help='render every page, ignoring the build cache')
+    if stylesheets:
+        parser.add_argument('--external-css', action='store_true',
+                            help='link one shared, content-hashed stylesheet instead of inlining CSS')
+        parser.add_argument('--minify-css', action='store_true',
+                            help='minify the shared stylesheet (implies --external-css)')
+        parser.add_argument('--compress', action='append', choices=COMPRESSIONS, default=[],
+                            help='also write a precompressed stylesheet (repeatable; implies --external-css)')
+    return parser
+
+
+def styles_option(args, output_dir):
+    """ExternalStyles for the parsed stylesheet options, or None for inline CSS."""
+    if not (getattr(args, 'external_css', False) or getattr(args, 'minify_css', False)
+            or getattr(args, 'compress', None)):
+        return None
+    return ExternalStyles(output_dir, args.minify_css, args.compress)
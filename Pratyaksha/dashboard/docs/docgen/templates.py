@@ -0,0 +1,189 @@
+"""
+Compiled Templates
+==================
+A small template layer for the doc generators. Layouts and partials are
+compiled once to Python bytecode and cached, so a page is assembled from
+compiled fragments instead of re-formatting one huge f-string per call.
+
+Syntax:
+    {{ name }}, {{ screen.title }}         a value (key or attribute lookup), as str()
+    {% include 'header' %}                 another template, with the current values
+    {% include screen.body %}              a template named by a value
+    {% for row in rows %} ... {% endfor %}   also {% for source, context in rows %}
+    {% if screen.final %} ... {% else %} ... {% endif %}
+
+A {% %} tag alone on its line removes the whole line, so block tags leave
+no blank lines behind. Output is not HTML-escaped: templates and values
+are trusted document markup.
+
+Compiled code is cached per template text, process-wide, so the same
+partial used by several generators (or several Templates sets) compiles
+once. Templates.fingerprint() hashes every source, so docgen.cache
+re-renders pages when a template changes.
+
+Usage:
+    TEMPLATES = Templates({
+        'document': '<body>\\n{% for page in pages %}{% include page.body %}{% endfor %}</body>',
+        'cover': '<h1>{{ title }}</h1>\\n',
+    })
+    html = TEMPLATES.render('document', title='Docs', pages=[{'body': 'cover'}])
+"""
+
+from hashlib import blake2b
+import re
+
+TAG = re.compile(r'\{\{.*?\}\}|\{%.*?%\}', re.S)
+NAME = re.compile(r'[A-Za-z_]\w*(\.\w+)*$')
+FOR = re.compile(r'for\s+(\w+(?:\s*,\s*\w+)*)\s+in\s+(\S+)$')
+LITERAL = re.compile(r"'([^']*)'$")
+
+# Compiled render functions, keyed by a hash of the template text
+COMPILED = {}
+
+
+class TemplateError(Exception):
+    """A template that does not compile, or a value missing when rendering."""
+
+
+def resolve(value, path):
+    """Follow a dotted path below a value: key lookup, then attribute, then index."""
+    for part in path:
+        if isinstance(value, dict):
+            value = value[part]
+        elif hasattr(value, part):
+            value = getattr(value, part)
+        elif part.isdigit():
+            value = value[int(part)]
+        else:
+            raise KeyError(part)
+    return value
+
+
+def tokenize(text):
+    """Split template text into ('text' | 'value' | 'tag', content) tokens."""
+    tokens = []
+    pos = 0
+    for match in TAG.finditer(text):
+        start, end = match.span()
+        tag = match.group()
+        if tag.startswith('{%'):
+            line_start = text.rfind('\n', 0, start) + 1
+            line_end = text.find('\n', end)
+            line_end = len(text) if line_end == -1 else line_end + 1
+            if (line_start >= pos and not text[line_start:start].strip(' \t')
+                    and not text[end:line_end].strip()):
+                start, end = line_start, line_end
+        if start > pos:
+            tokens.append(('text', text[pos:start]))
+        tokens.append(('value' if tag.startswith('{{') else 'tag', tag[2:-2].strip()))
+        pos = end
+    if pos < len(text):
+        tokens.append(('text', text[pos:]))
+    return tokens
+
+
+def expression(name, scope, template):
+    """Python expression reading a dotted name from the current scope."""
+    if not NAME.match(name):
+        raise TemplateError(f'{template}: bad name {name!r}')
+    first, *rest = name.split('.')
+    code = f'{scope}[{first!r}]'
+    return f'resolve({code}, {tuple(rest)!r})' if rest else code
+
+
+def python_source(name, text):
+    """Translate a template into the source of render(ctx, include)."""
+    lines = ['def render(ctx0, include):', '    out = []', '    append = out.append']
+    blocks = []
+    scopes = ['ctx0']
+    for kind, content in tokenize(text):
+        pad = '    ' * (len(blocks) + 1)
+        scope = scopes[-1]
+        if kind == 'text':
+            lines.append(f'{pad}append({content!r})')
+            continue
+        if kind == 'value':
+            lines.append(f'{pad}append(str({expression(content, scope, name)}))')
+            continue
+
+        keyword, _, argument = content.partition(' ')
+        argument = argument.strip()
+        if keyword == 'include':
+            literal = LITERAL.match(argument)
+            target = repr(literal.group(1)) if literal else expression(argument, scope, name)
+            lines.append(f'{pad}append(include({target}, {scope}))')
+        elif keyword == 'for':
+            loop = FOR.match(content)
+            if not loop:
+                raise TemplateError(f'{name}: bad loop {{% {content} %}}')
+            targets = [t.strip() for t in loop.group(1).split(',')]
+            inner = f'ctx{len(scopes)}'
+            item = f'item{len(scopes)}'
+            lines.append(f'{pad}for {item} in {expression(loop.group(2), scope, name)}:')
+            lines.append(f'{pad}    {inner} = dict({scope})')
+            if len(targets) == 1:
+                lines.append(f'{pad}    {inner}[{targets[0]!r}] = {item}')
+            else:
+                lines.append(f'{pad}    {inner}.update(zip({tuple(targets)!r}, {item}))')
+            blocks.append('for')
+            scopes.append(inner)
+        elif keyword == 'if':
+            lines.append(f'{pad}if {expression(argument, scope, name)}:')
+            blocks.append('if')
+        elif keyword == 'else':
+            if not blocks or blocks[-1] != 'if':
+                raise TemplateError(f'{name}: else outside if')
+            lines.append(f'{"    " * len(blocks)}else:')
+        elif keyword in ('endfor', 'endif'):
+            if not blocks or blocks[-1] != keyword[3:]:
+                raise TemplateError(f'{name}: unexpected {{% {keyword} %}}')
+            if blocks.pop() == 'for':
+                scopes.pop()
+        else:
+            raise TemplateError(f'{name}: unknown tag {{% {content} %}}')
+        if keyword in ('for', 'if', 'else'):
+            lines.append(f'{"    " * (len(blocks) + 1)}pass')
+    if blocks:
+        raise TemplateError(f'{name}: unclosed {{% {blocks[-1]} %}}')
+    lines.append("    return ''.join(out)")
+    return '\n'.join(lines) + '\n'
+
+
+def compile_template(name, text):
+    """Compiled render(ctx, include) for a template, cached by its text."""
+    key = blake2b(text.encode('utf-8'), digest_size=16).digest()
+    render = COMPILED.get(key)
+    if render is None:
+        namespace = {'resolve': resolve}
+        exec(compile(python_source(name, text), f'<template {name}>', 'exec'), namespace)
+        render = COMPILED[key] = namespace['render']
+    return render
+
+
+class Templates:
+    """A named set of templates that include each other."""
+
+    def __init__(self, sources):
+        self.sources = dict(sources)
+        self.compiled = {name: compile_template(name, text) for name, text in self.sources.items()}
+
+    def include(self, name, ctx):
+        try:
+            render = self.compiled[name]
+        except KeyError:
+            raise TemplateError(f'No template named {name!r}') from None
+        try:
+            return render(ctx, self.include)
+        except KeyError as exc:
+            raise TemplateError(f'{name}: no value for {exc}') from None
+
+    def render(self, name, **values):
+        """Render one template with the given values."""
+        return self.include(name, values)
+
+    def fingerprint(self):
+        """Hash of every template source (for docgen.cache)."""
+        h = blake2b(digest_size=16)
+        for name, text in sorted(self.sources.items()):
+            h.update(f'{name}\x1f{len(text)}\x1f{text}'.encode('utf-8'))
+        return h.hexdigest()
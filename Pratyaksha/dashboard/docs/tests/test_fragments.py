@@ -0,0 +1,87 @@
+"""
+Shared Fragment Tests
+=====================
+Each screen or page fragment is rendered once per build and shared by the
+per-page files and the combined document; cached outputs render nothing.
+
+Usage:
+    python -m pytest Pratyaksha/dashboard/docs/tests
+"""
+
+import os
+import sys
+
+import pytest
+
+DOCS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(DOCS, 'ui-flow'), os.path.join(DOCS, 'architecture')]
+
+import doc_pages
+import screens
+
+
+def count_calls(monkeypatch, module, name):
+    """Wrap module.name so every call is counted; return the list of calls."""
+    calls = []
+    original = getattr(module, name)
+
+    def counted(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(module, name, counted)
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    # Output directories are relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def test_screens_render_each_fragment_once(monkeypatch):
+    calls = count_calls(monkeypatch, screens, 'screen_fragment')
+    reports = screens.build(workers=1)
+    assert len(calls) == len(screens.SCREENS)
+    assert len(reports['screens'].pages) == len(screens.SCREENS)
+    assert len(reports['complete'].pages) == 1
+
+    calls.clear()
+    reports = screens.build(workers=1)
+    assert calls == []
+    assert not reports['screens'].pages and not reports['complete'].pages
+
+
+def test_screens_render_only_stale_fragments(monkeypatch):
+    # Counting changes the page fingerprints, so count from the first build on
+    calls = count_calls(monkeypatch, screens, 'screen_fragment')
+    screens.build(workers=1)
+    calls.clear()
+    os.remove(os.path.join(screens.SCREENS_DIR, screens.SCREENS[2].filename))
+    reports = screens.build(('screens',), workers=1)
+    assert [args[0].filename for args in calls] == [screens.SCREENS[2].filename]
+    assert list(reports['screens'].pages) == [screens.SCREENS[2].filename]
+
+
+def test_screen_outputs_share_fragments():
+    screens.build(workers=1)
+    with open(os.path.join(screens.COMPLETE_DIR, screens.COMPLETE_FILE), encoding='utf-8') as f:
+        complete = f.read()
+    for screen in screens.SCREENS:
+        fragment = screens.screen_fragment(screen, len(screens.SCREENS))
+        with open(os.path.join(screens.SCREENS_DIR, screen.filename), encoding='utf-8') as f:
+            assert fragment in f.read()
+        assert fragment in complete
+
+
+def test_doc_pages_render_each_fragment_once(monkeypatch):
+    pages = count_calls(monkeypatch, doc_pages, 'page_fragment')
+    covers = count_calls(monkeypatch, doc_pages, 'cover_fragment')
+    doc_pages.build(workers=1)
+    assert len(pages) == len(doc_pages.DOC_PAGES)
+    assert len(covers) == 1
+
+    pages.clear()
+    covers.clear()
+    doc_pages.build(workers=1)
+    assert pages == [] and covers == []
@@ -0,0 +1,1217 @@
+"""
+Pratyaksha UI Wireframe Screens
+Single source of truth for the 12 wireframe screens: one Screen spec and
+one wireframe partial per screen, shared by generate-ui-flow.py (one file
+per screen) and generate-complete-wireframes.py (all screens in one
+printable document).
+
+Both outputs are assembled from the same screen fragments: a build asks
+the build cache which outputs are stale, renders each fragment those
+outputs need once, and hands it to both the per-screen file and the
+combined document.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from docgen.render import Page, render_fragments, render_pages, stale_pages
+from docgen.templates import Templates
+
+SCREENS_DIR = "ui-wireframes"
+COMPLETE_DIR = "complete"
+COMPLETE_FILE = "pratyaksha-ui-wireframes-complete.html"
+TARGETS = ('screens', 'complete')
+
+CSS_STYLES = '''
+<style>
+* {
+  margin: 0;
+  padding: 0;
+  box-sizing: border-box;
+}
+
+body {
+  font-family: Arial, sans-serif;
+  line-height: 1.6;
+  color: #000000;
+  background: #ffffff;
+  font-size: 11pt;
+}
+
+.page {
+  max-width: 210mm;
+  min-height: 297mm;
+  margin: 0 auto;
+  padding: 20mm;
+  background: #ffffff;
+  page-break-after: always;
+}
+
+.page:last-child {
+  page-break-after: auto;
+}
+
+.header {
+  border-bottom: 3px solid #000;
+  padding-bottom: 10px;
+  margin-bottom: 20px;
+}
+
+.header h1 {
+  font-size: 18pt;
+  font-weight: bold;
+}
+
+.screen-number {
+  float: right;
+  font-size: 10pt;
+  color: #666;
+}
+
+/* Wireframe Container */
+.wireframe {
+  border: 3px solid #000;
+  padding: 15px;
+  margin: 20px 0;
+  min-height: 400px;
+  background: #fafafa;
+  position: relative;
+}
+
+/* UI Components */
+.ui-navbar {
+  border: 2px solid #000;
+  padding: 10px;
+  margin-bottom: 10px;
+  background: #fff;
+  font-weight: bold;
+}
+
+.ui-hero {
+  border: 2px solid #000;
+  padding: 40px 20px;
+  margin: 10px 0;
+  background: #fff;
+  text-align: center;
+  min-height: 150px;
+}
+
+.ui-section {
+  border: 2px solid #000;
+  padding: 15px;
+  margin: 10px 0;
+  background: #fff;
+}
+
+.ui-card {
+  border: 1px solid #000;
+  padding: 10px;
+  margin: 5px 0;
+  background: #fff;
+}
+
+.ui-grid {
+  display: grid;
+  grid-template-columns: repeat(3, 1fr);
+  gap: 10px;
+  margin: 10px 0;
+}
+
+.ui-button {
+  border: 2px solid #000;
+  padding: 8px 15px;
+  margin: 5px;
+  background: #fff;
+  display: inline-block;
+  font-weight: bold;
+  text-align: center;
+}
+
+.ui-input {
+  border: 2px solid #000;
+  padding: 8px;
+  margin: 5px 0;
+  background: #fff;
+  width: 100%;
+}
+
+.ui-modal {
+  border: 3px solid #000;
+  padding: 20px;
+  margin: 20px auto;
+  background: #fff;
+  max-width: 400px;
+}
+
+.ui-sidebar {
+  border: 2px solid #000;
+  padding: 10px;
+  background: #fff;
+  min-height: 200px;
+}
+
+.ui-tabs {
+  border-bottom: 2px solid #000;
+  padding: 10px 0;
+  margin-bottom: 10px;
+}
+
+.ui-tab {
+  border: 2px solid #000;
+  border-bottom: none;
+  padding: 8px 15px;
+  margin-right: 5px;
+  display: inline-block;
+  background: #fff;
+}
+
+.ui-tab.active {
+  background: #000;
+  color: #fff;
+}
+
+/* Navigation Sections */
+.nav-section {
+  margin-top: 30px;
+  page-break-inside: avoid;
+}
+
+.nav-section h3 {
+  font-size: 13pt;
+  font-weight: bold;
+  margin-bottom: 10px;
+  border-left: 4px solid #000;
+  padding-left: 10px;
+}
+
+.nav-table {
+  width: 100%;
+  border-collapse: collapse;
+  margin: 10px 0;
+}
+
+.nav-table th {
+  background: #000;
+  color: #fff;
+  font-weight: bold;
+  padding: 8px;
+  text-align: left;
+  border: 1px solid #000;
+}
+
+.nav-table td {
+  padding: 6px 8px;
+  border: 1px solid #000;
+  vertical-align: top;
+}
+
+.nav-table td:first-child {
+  font-weight: bold;
+  width: 30%;
+}
+
+.label {
+  font-size: 9pt;
+  color: #666;
+  font-style: italic;
+}
+
+.component-label {
+  font-size: 9pt;
+  color: #666;
+  margin-top: 5px;
+}
+
+.grid-2col {
+  display: grid;
+  grid-template-columns: 1fr 1fr;
+  gap: 10px;
+}
+
+.footer {
+  margin-top: 20px;
+  padding-top: 10px;
+  border-top: 2px solid #000;
+  text-align: center;
+  font-size: 10pt;
+}
+
+@media print {
+  .page {
+    margin: 0;
+    padding: 15mm;
+  }
+
+  @page {
+    margin: 15mm;
+    size: A4;
+  }
+}
+</style>
+'''
+
+DOCUMENT = '''<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="UTF-8">
+  <title>{{ title }}</title>
+  {{ styles }}
+</head>
+<body>
+{% for fragment in fragments %}
+
+{{ fragment }}{% endfor %}
+</body>
+</html>'''
+
+SCREEN_FILE = '''<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="UTF-8">
+  <title>{{ title }}</title>
+  {{ styles }}
+</head>
+<body>
+{{ fragment }}</body>
+</html>'''
+
+SCREEN = '''<!-- SCREEN {{ screen.number }}: {{ screen.heading }} -->
+<div class="page">
+  <div class="header">
+    <span class="screen-number">Screen {{ screen.number }} of {{ total }}</span>
+    <h1>{{ screen.title }}</h1>
+    <p class="label">{{ screen.label }}</p>
+  </div>
+
+{% if screen.final %}
+{% include screen.body %}
+  <div class="footer" style="margin-top: 30px;">
+    <p>Pratyaksha UI Flow Documentation • Screen {{ screen.number }} of {{ total }} • Complete</p>
+  </div>
+{% else %}
+  <div class="wireframe">
+{% include screen.body %}
+  </div>
+
+{% include 'navigation' %}
+
+  <div class="footer">
+    <p>Pratyaksha UI Flow Documentation • Screen {{ screen.number }} of {{ total }}</p>
+  </div>
+{% endif %}
+</div>
+'''
+
+NAVIGATION = '''  <div class="nav-section">
+    <h3>🔽 Where can this screen be accessed from?</h3>
+    <table class="nav-table">
+      <tr>
+        <th>Source</th>
+        <th>Context</th>
+      </tr>
+{% for source, context in screen.sources %}
+      <tr>
+        <td>{{ source }}</td>
+        <td>{{ context }}</td>
+      </tr>
+{% endfor %}
+    </table>
+  </div>
+
+  <div class="nav-section">
+    <h3>🔼 Where all can user go from here?</h3>
+    <table class="nav-table">
+      <tr>
+        <th>Destination</th>
+        <th>Trigger</th>
+      </tr>
+{% for destination, trigger in screen.destinations %}
+      <tr>
+        <td>{{ destination }}</td>
+        <td>{{ trigger }}</td>
+      </tr>
+{% endfor %}
+    </table>
+  </div>
+'''
+
+class Screen:
+    """One wireframe screen: its file, header text, body partial and navigation tables.
+
+    The final screen (the flow map) has no wireframe box or navigation
+    tables; its body partial is the whole page content.
+    """
+
+    __slots__ = ('number', 'heading', 'filename', 'title', 'label', 'body', 'sources',
+                 'destinations', 'final')
+
+    def __init__(self, number, heading, filename, title, label, body, sources=(), destinations=(),
+                 final=False):
+        self.number = number
+        self.heading = heading
+        self.filename = filename
+        self.title = title
+        self.label = label
+        self.body = body
+        self.sources = sources
+        self.destinations = destinations
+        self.final = final
+
+WIREFRAMES = {
+    'wireframe-01-landing-page': '''    <div class="ui-navbar">
+      <strong>PRATYAKSHA</strong>
+      <div style="float: right;">
+        <span class="ui-button">Login</span>
+        <span class="ui-button">Sign Up</span>
+      </div>
+    </div>
+    <div class="component-label">Navigation: Logo + Login + Sign Up buttons</div>
+
+    <div class="ui-hero">
+      <h2>Your Mind's Mirror</h2>
+      <p>AI-powered journaling platform for emotional clarity</p>
+      <br>
+      <span class="ui-button">Get Started Free →</span>
+    </div>
+    <div class="component-label">Hero: Value proposition + CTA</div>
+
+    <div class="ui-section">
+      <strong>4-Agent AI Pipeline</strong>
+      <p>Intent → Emotion → Theme → Insight analysis</p>
+    </div>
+    <div class="component-label">Feature 1: AI capabilities</div>
+
+    <div class="ui-section">
+      <strong>Personalized Insights</strong>
+      <p>Soul Mapping + Life Blueprint for tailored advice</p>
+    </div>
+    <div class="component-label">Feature 2: Personalization</div>
+
+    <div class="ui-section">
+      <strong>Pattern Recognition</strong>
+      <p>Identify emotional loops and behavioral themes</p>
+    </div>
+    <div class="component-label">Feature 3: Analytics</div>
+''',
+    'wireframe-02-sign-up': '''    <div class="ui-navbar">
+      <strong>PRATYAKSHA</strong>
+      <div style="float: right;">
+        <span class="ui-button">← Back to Home</span>
+      </div>
+    </div>
+
+    <div class="ui-modal">
+      <h2 style="margin-bottom: 15px;">Create Your Account</h2>
+
+      <div class="ui-input">Email address</div>
+      <div class="component-label">Input: Email</div>
+
+      <div class="ui-input">Password (min 6 characters)</div>
+      <div class="component-label">Input: Password</div>
+
+      <div class="ui-input">Confirm Password</div>
+      <div class="component-label">Input: Password confirmation</div>
+
+      <br>
+      <div class="ui-button" style="width: 100%;">Create Account</div>
+      <div class="component-label">Submit button</div>
+
+      <br><br>
+      <div style="text-align: center; border-top: 1px solid #000; padding-top: 10px; margin-top: 10px;">
+        <p>Already have an account? <strong>Login</strong></p>
+      </div>
+      <div class="component-label">Link to Login screen</div>
+    </div>
+''',
+    'wireframe-03-login': '''    <div class="ui-navbar">
+      <strong>PRATYAKSHA</strong>
+      <div style="float: right;">
+        <span class="ui-button">← Back to Home</span>
+      </div>
+    </div>
+
+    <div class="ui-modal">
+      <h2 style="margin-bottom: 15px;">Welcome Back</h2>
+
+      <div class="ui-input">Email address</div>
+      <div class="component-label">Input: Email</div>
+
+      <div class="ui-input">Password</div>
+      <div class="component-label">Input: Password</div>
+
+      <br>
+      <div class="ui-button" style="width: 100%;">Login</div>
+      <div class="component-label">Submit button</div>
+
+      <br><br>
+      <div style="text-align: center; border-top: 1px solid #000; padding-top: 10px; margin-top: 10px;">
+        <p>Don't have an account? <strong>Sign Up</strong></p>
+      </div>
+      <div class="component-label">Link to Sign Up screen</div>
+    </div>
+''',
+    'wireframe-04-onboarding-welcome': '''    <div style="border: 2px solid #000; padding: 5px; margin-bottom: 15px;">
+      <div style="background: #000; width: 10%; height: 10px;"></div>
+    </div>
+    <div class="component-label">Progress: Step 1 of 8</div>
+
+    <div class="ui-section" style="text-align: center; padding: 30px;">
+      <h2>Welcome to Pratyaksha! 👋</h2>
+      <p>Let's personalize your journaling experience</p>
+      <p style="margin-top: 15px; color: #666;">This will take about 5-10 minutes</p>
+    </div>
+
+    <div class="ui-section">
+      <strong>Basic Information</strong>
+      <div class="ui-input">What should we call you?</div>
+      <div class="component-label">Input: Display name</div>
+
+      <div class="ui-input">What do you do? (Optional)</div>
+      <div class="component-label">Input: Profession</div>
+
+      <div class="ui-input">Stress level (1-5)</div>
+      <div class="component-label">Slider: Baseline stress</div>
+
+      <div class="ui-input">Emotional openness (1-5)</div>
+      <div class="component-label">Slider: How open to emotional language</div>
+    </div>
+
+    <div style="text-align: right; margin-top: 20px;">
+      <span class="ui-button">Skip for now</span>
+      <span class="ui-button">Continue →</span>
+    </div>
+    <div class="component-label">Actions: Skip entire onboarding OR proceed to Soul Mapping</div>
+''',
+    'wireframe-05-soul-mapping': '''    <div style="border: 2px solid #000; padding: 5px; margin-bottom: 15px;">
+      <div style="background: #000; width: 30%; height: 10px;"></div>
+    </div>
+    <div class="component-label">Progress: Steps 2-6 of 8</div>
+
+    <div class="ui-section">
+      <h3>Exercise 1: Childhood Beliefs</h3>
+      <p style="margin: 10px 0; color: #666;">Explore the foundational beliefs formed in your early years</p>
+
+      <div style="border: 2px solid #000; padding: 15px; margin: 15px 0; background: #fff;">
+        <textarea style="width: 100%; height: 100px; border: 1px solid #000; padding: 8px; font-family: Arial;">What beliefs from childhood still influence you today?</textarea>
+      </div>
+      <div class="component-label">Text area: Free-form reflection</div>
+    </div>
+
+    <div class="ui-section">
+      <strong>Available Exercises (All Optional)</strong>
+      <div class="ui-card">✓ 1. Childhood Beliefs (Current)</div>
+      <div class="ui-card">○ 2. Relationship Patterns</div>
+      <div class="ui-card">○ 3. Fear Analysis</div>
+      <div class="ui-card">○ 4. Values Clarification</div>
+      <div class="ui-card">○ 5. Identity Exploration</div>
+      <div class="component-label">Progress tracker: 1 of 5 complete</div>
+    </div>
+
+    <div style="text-align: right; margin-top: 20px;">
+      <span class="ui-button">Skip All Exercises</span>
+      <span class="ui-button">Skip This One</span>
+      <span class="ui-button">Save & Next →</span>
+    </div>
+''',
+    'wireframe-06-dashboard': '''    <div class="ui-navbar">
+      <strong>PRATYAKSHA</strong>
+      <div style="float: right;">
+        <span class="ui-button">+ New Entry</span>
+        <span class="ui-button">Chat</span>
+        <span class="ui-button">Logs</span>
+        <span class="ui-button">Profile ▾</span>
+      </div>
+    </div>
+
+    <div class="ui-tabs">
+      <span class="ui-tab active">Overview</span>
+      <span class="ui-tab">Insights</span>
+      <span class="ui-tab">Patterns</span>
+    </div>
+    <div class="component-label">Tabs: Overview (default), Insights, Patterns</div>
+
+    <div class="ui-grid">
+      <div class="ui-card"><strong>31 Day Streak</strong><br>🔥</div>
+      <div class="ui-card"><strong>199 Total Entries</strong><br>📝</div>
+      <div class="ui-card"><strong>Level 8</strong><br>⭐</div>
+    </div>
+    <div class="component-label">Quick stats: Streak, Total, Level</div>
+
+    <div class="ui-section" style="min-height: 150px;">
+      <strong>Emotional Landscape (Last 30 Days)</strong>
+      <div style="border: 1px solid #000; height: 120px; margin-top: 10px; padding: 10px;">
+        [LINE CHART: Energy Level over time]
+      </div>
+    </div>
+    <div class="component-label">Main chart: Energy/sentiment trends</div>
+
+    <div class="ui-section">
+      <strong>Recent Entries</strong>
+      <div class="ui-card">
+        <strong>Excited about new project</strong> • Feb 9 • Hopeful • 4/5 energy
+      </div>
+      <div class="ui-card">
+        <strong>Feeling overwhelmed</strong> • Feb 8 • Anxious • 2/5 energy
+      </div>
+    </div>
+''',
+    'wireframe-07-new-entry': '''    <div style="border: 3px dashed #666; padding: 10px; margin-bottom: 10px; color: #666;">
+      [Background: Dashboard dimmed with overlay]
+    </div>
+
+    <div class="ui-modal" style="max-width: 600px;">
+      <div style="border-bottom: 2px solid #000; padding-bottom: 10px; margin-bottom: 15px;">
+        <strong style="font-size: 14pt;">New Journal Entry</strong>
+        <span style="float: right; cursor: pointer;">✕ Close</span>
+      </div>
+
+      <div class="ui-section">
+        <span class="ui-button">🎤 Voice Input</span>
+        <span class="component-label" style="display: inline; margin-left: 10px;">Groq Whisper speech-to-text</span>
+      </div>
+
+      <div style="margin: 15px 0;">
+        <textarea style="width: 100%; height: 200px; border: 2px solid #000; padding: 10px; font-family: Arial; font-size: 11pt;" placeholder="What's on your mind?"></textarea>
+      </div>
+      <div class="component-label">Main input: Free-form text (min 50 chars recommended)</div>
+
+      <div class="grid-2col" style="margin: 15px 0;">
+        <div class="ui-input">Date: Feb 9, 2026</div>
+        <div class="ui-input">Time: 14:23</div>
+      </div>
+      <div class="component-label">Timestamp: Auto-filled, editable</div>
+
+      <div style="text-align: right; margin-top: 20px; padding-top: 15px; border-top: 1px solid #000;">
+        <span class="ui-button">Cancel</span>
+        <span class="ui-button">Save Entry</span>
+      </div>
+      <div class="component-label">Actions: Cancel (discard) or Save (process through 4-agent pipeline)</div>
+
+      <div style="border: 2px dashed #000; padding: 10px; margin-top: 15px; text-align: center; display: none;">
+        <p><strong>Processing...</strong></p>
+        <p style="font-size: 9pt; color: #666;">Running 4-agent AI analysis (8-12 seconds)</p>
+      </div>
+      <div class="component-label">Loading state: Shown while Intent → Emotion → Theme → Insight</div>
+    </div>
+''',
+    'wireframe-08-entry-details': '''    <div class="ui-navbar">
+      <strong>← Back to Dashboard</strong>
+    </div>
+
+    <div class="ui-section">
+      <h2>Excited about new project</h2>
+      <p style="color: #666;">February 9, 2026 at 14:23</p>
+      <div style="margin-top: 10px;">
+        <span class="ui-button">Reflection</span>
+        <span class="ui-button">Hopeful</span>
+        <span class="ui-button">Energy: 4/5</span>
+        <span class="ui-button">Rising ↗</span>
+      </div>
+    </div>
+    <div class="component-label">Header: Name, date, type, mode, energy, shape</div>
+
+    <div class="ui-section">
+      <strong>Your Entry</strong>
+      <p style="margin-top: 10px; line-height: 1.8;">
+        I'm really excited about this new Pratyaksha project. The AI pipeline is coming together nicely and I can see it helping people understand themselves better...
+      </p>
+    </div>
+    <div class="component-label">Original user input text</div>
+
+    <div class="ui-section">
+      <strong>Snapshot</strong>
+      <p style="margin-top: 10px;">
+        Reflecting on progress with Pratyaksha project, feeling energized by the potential impact. Hopeful about AI's role in self-understanding.
+      </p>
+    </div>
+
+    <div class="ui-section">
+      <strong>Summary</strong>
+      <p style="margin-top: 10px;">
+        You're experiencing genuine excitement about creating something meaningful. The project represents both technical challenge and purpose-driven work.
+      </p>
+    </div>
+
+    <div class="ui-section">
+      <strong>Actionable Insights</strong>
+      <ul style="margin-left: 20px; margin-top: 10px;">
+        <li>Channel this energy into concrete next steps</li>
+        <li>Document your vision to maintain momentum</li>
+        <li>Share progress with stakeholders</li>
+      </ul>
+    </div>
+
+    <div class="ui-section">
+      <strong>Next Action</strong>
+      <p style="margin-top: 10px; font-weight: bold;">
+        Write down the top 3 features you want to ship this month
+      </p>
+    </div>
+''',
+    'wireframe-09-logs': '''    <div class="ui-navbar">
+      <strong>PRATYAKSHA</strong>
+      <div style="float: right;">
+        <span class="ui-button">+ New Entry</span>
+        <span class="ui-button">Chat</span>
+        <span class="ui-button">Dashboard</span>
+        <span class="ui-button">Profile ▾</span>
+      </div>
+    </div>
+
+    <div class="ui-section">
+      <strong>Filters</strong>
+      <div style="margin-top: 10px;">
+        <span class="ui-button">All Types ▾</span>
+        <span class="ui-button">All Modes ▾</span>
+        <span class="ui-button">Date Range ▾</span>
+        <span class="ui-button">Clear Filters</span>
+      </div>
+    </div>
+    <div class="component-label">Filters: Entry type, mode, date range</div>
+
+    <div class="ui-section">
+      <table class="nav-table">
+        <tr>
+          <th>Date</th>
+          <th>Name</th>
+          <th>Type</th>
+          <th>Mode</th>
+          <th>Energy</th>
+          <th>Sentiment</th>
+        </tr>
+        <tr>
+          <td>Feb 9</td>
+          <td>Excited about new project</td>
+          <td>Reflection</td>
+          <td>Hopeful</td>
+          <td>4/5</td>
+          <td>😊 Positive</td>
+        </tr>
+        <tr>
+          <td>Feb 8</td>
+          <td>Feeling overwhelmed</td>
+          <td>Emotional</td>
+          <td>Anxious</td>
+          <td>2/5</td>
+          <td>😟 Negative</td>
+        </tr>
+        <tr>
+          <td>Feb 7</td>
+          <td>Crypto exit decision</td>
+          <td>Decision</td>
+          <td>Resolved</td>
+          <td>3/5</td>
+          <td>😐 Neutral</td>
+        </tr>
+      </table>
+    </div>
+    <div class="component-label">Table: All entries with key metadata, sorted by date (newest first)</div>
+
+    <div style="text-align: center; margin-top: 15px;">
+      <span class="ui-button">← Previous</span>
+      <span style="margin: 0 10px;">Page 1 of 7</span>
+      <span class="ui-button">Next →</span>
+    </div>
+    <div class="component-label">Pagination: 30 entries per page</div>
+''',
+    'wireframe-10-chat': '''    <div class="ui-navbar">
+      <strong>PRATYAKSHA</strong>
+      <div style="float: right;">
+        <span class="ui-button">+ New Entry</span>
+        <span class="ui-button">Dashboard</span>
+        <span class="ui-button">Logs</span>
+        <span class="ui-button">Profile ▾</span>
+      </div>
+    </div>
+
+    <div class="ui-section" style="text-align: center;">
+      <h3>Ask me anything about your journal</h3>
+      <p style="color: #666; font-size: 9pt;">I can search through all your entries to answer questions</p>
+    </div>
+
+    <div class="ui-section" style="min-height: 250px; background: #fafafa;">
+      <div style="border: 2px solid #000; padding: 10px; margin: 10px 0; background: #fff; max-width: 70%; float: right; clear: both;">
+        <p><strong>You:</strong> What patterns do you see in my stress levels?</p>
+      </div>
+      <div style="clear: both;"></div>
+
+      <div style="border: 2px solid #000; padding: 10px; margin: 10px 0; background: #fff; max-width: 70%; float: left; clear: both;">
+        <p><strong>AI:</strong> Based on your last 30 entries, I notice stress tends to spike on Mondays and when you have multiple deadlines. You manage it best when you journal in the morning.</p>
+        <p style="margin-top: 8px; font-size: 9pt; color: #666;">📚 Referenced 12 entries from Jan-Feb 2026</p>
+      </div>
+      <div style="clear: both;"></div>
+    </div>
+    <div class="component-label">Chat history: User messages (right), AI responses (left)</div>
+
+    <div style="border: 2px solid #000; padding: 10px; margin-top: 15px; background: #fff;">
+      <textarea style="width: 100%; height: 60px; border: 1px solid #000; padding: 8px; font-family: Arial;" placeholder="Ask a question..."></textarea>
+      <div style="text-align: right; margin-top: 8px;">
+        <span class="ui-button">Send →</span>
+      </div>
+    </div>
+    <div class="component-label">Input: Question box + Send button</div>
+
+    <div class="ui-section">
+      <strong>Suggested Questions</strong>
+      <div class="ui-card">What themes appear most in my entries?</div>
+      <div class="ui-card">How has my mood changed over time?</div>
+      <div class="ui-card">What contradictions do you see in my thoughts?</div>
+    </div>
+''',
+    'wireframe-11-profile-settings': '''    <div class="ui-navbar">
+      <strong>PRATYAKSHA</strong>
+      <div style="float: right;">
+        <span class="ui-button">← Back to Dashboard</span>
+      </div>
+    </div>
+
+    <div class="ui-section" style="background: #f0f0f0;">
+      <strong>Profile Completion: 45%</strong>
+      <div style="border: 2px solid #000; height: 15px; margin: 10px 0;">
+        <div style="background: #000; width: 45%; height: 100%;"></div>
+      </div>
+      <p style="font-size: 9pt;">Complete Soul Mapping and Life Blueprint for 90% personalization</p>
+      <span class="ui-button">Complete Profile →</span>
+    </div>
+    <div class="component-label">Progress: Personalization level indicator</div>
+
+    <div class="ui-section">
+      <h3>Account Information</h3>
+      <div class="ui-input">Display Name: John Doe</div>
+      <div class="ui-input">Email: john@example.com</div>
+      <div class="ui-input">Profession: Product Manager</div>
+    </div>
+
+    <div class="ui-section">
+      <h3>Personalization Settings</h3>
+      <div class="ui-card">
+        <strong>Stress Level:</strong> 4/5 (High)
+        <div style="border: 2px solid #000; height: 10px; margin: 5px 0;">
+          <div style="background: #000; width: 80%; height: 100%;"></div>
+        </div>
+      </div>
+      <div class="ui-card">
+        <strong>Emotional Openness:</strong> 5/5 (Very Open)
+        <div style="border: 2px solid #000; height: 10px; margin: 5px 0;">
+          <div style="background: #000; width: 100%; height: 100%;"></div>
+        </div>
+      </div>
+    </div>
+
+    <div class="ui-section">
+      <h3>Life Blueprint Summary</h3>
+      <div class="ui-card"><strong>Vision Items:</strong> 3 defined</div>
+      <div class="ui-card"><strong>Goals:</strong> 5 active</div>
+      <div class="ui-card"><strong>Levers:</strong> 2 strategies</div>
+      <span class="ui-button">Edit Blueprint →</span>
+    </div>
+
+    <div class="ui-section">
+      <h3>Danger Zone</h3>
+      <span class="ui-button">Logout</span>
+      <span class="ui-button">Delete Account</span>
+    </div>
+''',
+    'flow-map': '''  <div style="font-size: 9pt; margin: 20px 0;">
+    <div style="border: 3px solid #000; padding: 20px; background: #fafafa;">
+
+      <div style="border: 2px solid #000; padding: 15px; margin-bottom: 20px; background: #fff;">
+        <strong style="font-size: 11pt;">NEW USER FLOW</strong>
+        <div style="margin-top: 10px;">
+          <div class="ui-button" style="display: inline-block; margin: 5px;">01. Landing</div>
+          <span style="font-size: 14pt;">→</span>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">02. Sign Up</div>
+          <span style="font-size: 14pt;">→</span>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">04. Onboarding Welcome</div>
+          <span style="font-size: 14pt;">→</span>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">05. Soul Mapping</div>
+          <span style="font-size: 14pt;">→</span>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">06. Dashboard</div>
+        </div>
+      </div>
+
+      <div style="border: 2px solid #000; padding: 15px; margin-bottom: 20px; background: #fff;">
+        <strong style="font-size: 11pt;">RETURNING USER FLOW</strong>
+        <div style="margin-top: 10px;">
+          <div class="ui-button" style="display: inline-block; margin: 5px;">01. Landing</div>
+          <span style="font-size: 14pt;">→</span>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">03. Login</div>
+          <span style="font-size: 14pt;">→</span>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">06. Dashboard</div>
+        </div>
+      </div>
+
+      <div style="border: 2px solid #000; padding: 15px; margin-bottom: 20px; background: #fff;">
+        <strong style="font-size: 11pt;">CORE APP LOOP (Daily Usage)</strong>
+        <div style="margin-top: 10px; text-align: center;">
+          <div class="ui-button" style="margin: 5px;">06. Dashboard</div>
+          <div>↓</div>
+          <div class="ui-button" style="margin: 5px;">07. New Entry</div>
+          <div>↓</div>
+          <div class="ui-button" style="margin: 5px;">08. Entry Details</div>
+          <div>↓</div>
+          <div class="ui-button" style="margin: 5px;">06. Dashboard</div>
+          <div style="margin-top: 10px; color: #666; font-size: 8pt;">(Repeat)</div>
+        </div>
+      </div>
+
+      <div style="border: 2px solid #000; padding: 15px; background: #fff;">
+        <strong style="font-size: 11pt;">NAVIGATION HUB (From Dashboard)</strong>
+        <div style="text-align: center; margin-top: 15px;">
+          <div class="ui-button" style="margin: 3px;">06. Dashboard</div>
+          <div style="margin: 10px 0;">
+            <span style="font-size: 12pt;">↙</span>
+            <span style="margin: 0 20px; font-size: 12pt;">↓</span>
+            <span style="font-size: 12pt;">↘</span>
+          </div>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">09. Logs</div>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">10. Chat</div>
+          <div class="ui-button" style="display: inline-block; margin: 5px;">11. Profile</div>
+        </div>
+      </div>
+
+    </div>
+  </div>
+
+  <div style="margin-top: 20px;">
+    <table class="nav-table" style="font-size: 9pt;">
+      <tr>
+        <th style="width: 10%;">#</th>
+        <th style="width: 25%;">Screen</th>
+        <th style="width: 30%;">Primary Purpose</th>
+        <th style="width: 35%;">Key Actions</th>
+      </tr>
+      <tr>
+        <td>01</td>
+        <td>Landing</td>
+        <td>Marketing & acquisition</td>
+        <td>Sign Up, Login</td>
+      </tr>
+      <tr>
+        <td>02</td>
+        <td>Sign Up</td>
+        <td>New user registration</td>
+        <td>Create account → Onboarding</td>
+      </tr>
+      <tr>
+        <td>03</td>
+        <td>Login</td>
+        <td>Authentication</td>
+        <td>Auth → Dashboard or Onboarding</td>
+      </tr>
+      <tr>
+        <td>04</td>
+        <td>Onboarding Welcome</td>
+        <td>Collect basic profile</td>
+        <td>Name, profession, stress, openness</td>
+      </tr>
+      <tr>
+        <td>05</td>
+        <td>Soul Mapping</td>
+        <td>Deep self-reflection</td>
+        <td>5 optional exercises (childhood, fear, etc.)</td>
+      </tr>
+      <tr>
+        <td>06</td>
+        <td>Dashboard</td>
+        <td>Main hub & analytics</td>
+        <td>View insights, charts, recent entries</td>
+      </tr>
+      <tr>
+        <td>07</td>
+        <td>New Entry</td>
+        <td>Create journal entry</td>
+        <td>Text/voice input → AI processing</td>
+      </tr>
+      <tr>
+        <td>08</td>
+        <td>Entry Details</td>
+        <td>View full AI analysis</td>
+        <td>Read insights, summary, next action</td>
+      </tr>
+      <tr>
+        <td>09</td>
+        <td>Logs</td>
+        <td>Browse all entries</td>
+        <td>Filter, search, paginate history</td>
+      </tr>
+      <tr>
+        <td>10</td>
+        <td>Chat</td>
+        <td>Ask questions about journal</td>
+        <td>RAG-powered Q&A with context</td>
+      </tr>
+      <tr>
+        <td>11</td>
+        <td>Profile Settings</td>
+        <td>Manage account & preferences</td>
+        <td>Edit profile, complete exercises, logout</td>
+      </tr>
+      <tr>
+        <td>12</td>
+        <td>Flow Map (This page)</td>
+        <td>Documentation reference</td>
+        <td>—</td>
+      </tr>
+    </table>
+  </div>
+
+''',
+}
+
+SCREENS = [
+    Screen(
+        '01', 'LANDING PAGE', '01-landing.html',
+        'Landing Page (/)',
+        'Public marketing page - First touchpoint for new users',
+        'wireframe-01-landing-page',
+        sources=[
+            ('Direct URL', 'User types pratyaksha.app or clicks marketing link'),
+            ('Logout', 'User logs out from Dashboard → redirected to Landing'),
+            ('Browser default', 'New user, no auth session'),
+        ],
+        destinations=[
+            ('Sign Up (Screen 02)', 'Click "Sign Up" button or "Get Started Free" CTA'),
+            ('Login (Screen 03)', 'Click "Login" button'),
+            ('Research/Science', 'Click footer links (Science, Methodology, Agent Pipeline)'),
+        ],
+    ),
+    Screen(
+        '02', 'SIGN UP', '02-signup.html',
+        'Sign Up (/signup)',
+        'New user registration with Firebase Auth',
+        'wireframe-02-sign-up',
+        sources=[
+            ('Landing Page (Screen 01)', 'Click "Sign Up" or "Get Started Free" button'),
+            ('Login Page (Screen 03)', 'Click "Don\'t have an account? Sign up" link'),
+        ],
+        destinations=[
+            ('Onboarding Welcome (Screen 04)', 'Successful account creation → Firebase auth → Onboarding flow starts'),
+            ('Login (Screen 03)', 'Click "Already have an account? Login" link'),
+            ('Landing Page (Screen 01)', 'Click "Back to Home" button'),
+        ],
+    ),
+    Screen(
+        '03', 'LOGIN', '03-login.html',
+        'Login (/login)',
+        'Existing user authentication',
+        'wireframe-03-login',
+        sources=[
+            ('Landing Page (Screen 01)', 'Click "Login" button in navbar'),
+            ('Sign Up Page (Screen 02)', 'Click "Already have an account? Login" link'),
+            ('Any protected route', 'Unauthenticated user tries to access Dashboard/Logs → redirected to Login'),
+        ],
+        destinations=[
+            ('Dashboard (Screen 06)', 'Successful login + profile already completed → Main app'),
+            ('Onboarding Welcome (Screen 04)', 'Successful login but profile incomplete → Resume onboarding'),
+            ('Sign Up (Screen 02)', 'Click "Don\'t have an account? Sign up" link'),
+            ('Landing Page (Screen 01)', 'Click "Back to Home" button'),
+        ],
+    ),
+    Screen(
+        '04', 'ONBOARDING WELCOME', '04-onboarding-welcome.html',
+        'Onboarding: Welcome',
+        'First step - Basic profile info',
+        'wireframe-04-onboarding-welcome',
+        sources=[
+            ('Sign Up (Screen 02)', 'New account created → Auto-redirect to onboarding'),
+            ('Login (Screen 03)', 'Existing user with incomplete profile → Resume onboarding'),
+            ('Dashboard Settings', 'User clicks "Complete Profile" → Re-enter onboarding flow'),
+        ],
+        destinations=[
+            ('Soul Mapping Intro (Screen 05)', 'Click "Continue" → Proceed to deep exercises'),
+            ('Dashboard (Screen 06)', 'Click "Skip for now" → Go to app with minimal profile (0% personalization)'),
+        ],
+    ),
+    Screen(
+        '05', 'SOUL MAPPING', '05-soul-mapping.html',
+        'Onboarding: Soul Mapping',
+        'Deep self-reflection exercises (5 optional topics)',
+        'wireframe-05-soul-mapping',
+        sources=[
+            ('Onboarding Welcome (Screen 04)', 'User clicked "Continue" → Enter Soul Mapping flow'),
+            ('Previous/Next Exercise', 'Multi-step flow through 5 exercises (or subset if skipping)'),
+        ],
+        destinations=[
+            ('Next Exercise (2-5)', 'Click "Save & Next" → Proceed through remaining exercises'),
+            ('Life Blueprint Intro', 'Complete all 5 exercises (or skip all) → Move to Vision/Goals section'),
+            ('Dashboard (Screen 06)', 'Click "Skip All Exercises" → Exit onboarding early'),
+        ],
+    ),
+    Screen(
+        '06', 'DASHBOARD', '06-dashboard.html',
+        'Dashboard (/dashboard)',
+        'Main application hub - Analytics and insights',
+        'wireframe-06-dashboard',
+        sources=[
+            ('Login (Screen 03)', 'Successful auth + completed profile → Default landing'),
+            ('Onboarding (Screen 04-05)', 'Complete or skip onboarding → Enter main app'),
+            ('New Entry (Screen 07)', 'After submitting entry → Return to Dashboard'),
+            ('Logs (Screen 09)', 'Click "Dashboard" in navbar'),
+            ('Chat (Screen 10)', 'Click "Dashboard" in navbar'),
+        ],
+        destinations=[
+            ('New Entry (Screen 07)', 'Click "+ New Entry" button in navbar'),
+            ('Entry Details (Screen 08)', 'Click on any entry card in "Recent Entries"'),
+            ('Logs (Screen 09)', 'Click "Logs" in navbar'),
+            ('Chat (Screen 10)', 'Click "Chat" in navbar'),
+            ('Profile Settings (Screen 11)', 'Click "Profile ▾" dropdown → Settings'),
+            ('Insights Tab', 'Click "Insights" tab → AI-generated insights view'),
+            ('Patterns Tab', 'Click "Patterns" tab → Theme/contradiction analysis'),
+        ],
+    ),
+    Screen(
+        '07', 'NEW ENTRY', '07-new-entry.html',
+        'New Entry Modal',
+        'Journal entry creation interface',
+        'wireframe-07-new-entry',
+        sources=[
+            ('Dashboard (Screen 06)', 'Click "+ New Entry" button → Modal opens'),
+            ('Logs (Screen 09)', 'Click "+ New Entry" in navbar → Modal opens'),
+            ('Chat (Screen 10)', 'Click "+ New Entry" in navbar → Modal opens'),
+            ('Anywhere in app', 'Navbar always accessible with New Entry button'),
+        ],
+        destinations=[
+            ('Dashboard (Screen 06)', 'Click "Save Entry" → Processing complete → Modal closes → Return to Dashboard with new entry'),
+            ('Previous Screen', 'Click "Cancel" or "✕ Close" → Discard draft → Return to wherever user was'),
+            ('Entry Details (Screen 08)', 'After save → Option to "View Analysis" → Open newly created entry'),
+        ],
+    ),
+    Screen(
+        '08', 'ENTRY DETAILS', '08-entry-details.html',
+        'Entry Details View',
+        'Full AI analysis results for single entry',
+        'wireframe-08-entry-details',
+        sources=[
+            ('Dashboard (Screen 06)', 'Click any entry card in "Recent Entries" section'),
+            ('Logs (Screen 09)', 'Click any row in the logs table'),
+            ('New Entry (Screen 07)', 'After saving → Click "View Analysis" button'),
+        ],
+        destinations=[
+            ('Dashboard (Screen 06)', 'Click "← Back to Dashboard" button'),
+            ('Logs (Screen 09)', 'Click "Logs" in navbar (if navbar present)'),
+            ('Chat (Screen 10)', 'Click "Chat" in navbar → Could ask follow-up about this entry'),
+        ],
+    ),
+    Screen(
+        '09', 'LOGS', '09-logs.html',
+        'Logs (/logs)',
+        'Complete entry history in table format',
+        'wireframe-09-logs',
+        sources=[
+            ('Dashboard (Screen 06)', 'Click "Logs" in navbar'),
+            ('Chat (Screen 10)', 'Click "Logs" in navbar'),
+            ('Entry Details (Screen 08)', 'Click "Logs" in navbar (if present)'),
+        ],
+        destinations=[
+            ('Entry Details (Screen 08)', 'Click any row in the table → Open full analysis for that entry'),
+            ('New Entry (Screen 07)', 'Click "+ New Entry" button in navbar'),
+            ('Dashboard (Screen 06)', 'Click "Dashboard" in navbar'),
+            ('Chat (Screen 10)', 'Click "Chat" in navbar'),
+            ('Profile Settings (Screen 11)', 'Click "Profile ▾" dropdown'),
+        ],
+    ),
+    Screen(
+        '10', 'CHAT', '10-chat.html',
+        'Chat Interface',
+        'RAG-powered conversational AI with entry context',
+        'wireframe-10-chat',
+        sources=[
+            ('Dashboard (Screen 06)', 'Click "Chat" in navbar'),
+            ('Logs (Screen 09)', 'Click "Chat" in navbar'),
+            ('Entry Details (Screen 08)', 'Click "Chat" in navbar → Can ask about specific entry'),
+        ],
+        destinations=[
+            ('Dashboard (Screen 06)', 'Click "Dashboard" in navbar'),
+            ('Logs (Screen 09)', 'Click "Logs" in navbar'),
+            ('New Entry (Screen 07)', 'Click "+ New Entry" button in navbar'),
+            ('Profile Settings (Screen 11)', 'Click "Profile ▾" dropdown'),
+        ],
+    ),
+    Screen(
+        '11', 'PROFILE SETTINGS', '11-profile.html',
+        'Profile & Settings',
+        'User profile management and preferences',
+        'wireframe-11-profile-settings',
+        sources=[
+            ('Dashboard (Screen 06)', 'Click "Profile ▾" dropdown → Settings'),
+            ('Logs (Screen 09)', 'Click "Profile ▾" dropdown → Settings'),
+            ('Chat (Screen 10)', 'Click "Profile ▾" dropdown → Settings'),
+        ],
+        destinations=[
+            ('Dashboard (Screen 06)', 'Click "← Back to Dashboard" button'),
+            ('Onboarding (Screen 04-05)', 'Click "Complete Profile" → Re-enter onboarding flow for missing exercises'),
+            ('Life Blueprint Editor', 'Click "Edit Blueprint" → Modify Vision/Goals/Levers'),
+            ('Landing Page (Screen 01)', 'Click "Logout" → End session → Public landing page'),
+        ],
+    ),
+    Screen(
+        '12', 'COMPLETE FLOW MAP', '12-flow-map.html',
+        'Complete User Journey Flow Map',
+        'All screens and navigation paths',
+        'flow-map',
+        final=True,
+    ),
+]
+
+TEMPLATES = Templates({
+    'document': DOCUMENT,
+    'screen-file': SCREEN_FILE,
+    'screen': SCREEN,
+    'navigation': NAVIGATION,
+    **WIREFRAMES,
+})
+
+def screen_fragment(screen, total):
+    """A screen's page fragment (the <div class="page"> block with its comment)."""
+    return TEMPLATES.render('screen', screen=screen, total=total)
+
+def create_screen_file(screen, total, fragment=None):
+    if fragment is None:
+        fragment = screen_fragment(screen, total)
+    return TEMPLATES.render('screen-file', title=f'Screen {screen.number}: {screen.heading.title()}',
+                            styles=CSS_STYLES, fragment=fragment)
+
+def create_complete_document(screens, fragments=None):
+    if fragments is None:
+        fragments = [screen_fragment(screen, len(screens)) for screen in screens]
+    return TEMPLATES.render('document', title='Pratyaksha UI Wireframe Flow - Complete',
+                            styles=CSS_STYLES, fragments=fragments)
+
+def build(targets=TARGETS, workers=None, force=False, styles=None):
+    """Write the requested outputs, rendering each stale screen's fragment once.
+
+    The build cache decides which outputs are stale first; the fragments
+    those outputs need are then rendered once each and shared by the
+    per-screen files and the combined document. Returns {target:
+    RenderReport}. styles (external stylesheets) applies to the per-screen
+    files only; the combined document stays self-contained.
+    """
+    total = len(SCREENS)
+    screen_pages = [Page(screen.filename, create_screen_file, (screen, total)) for screen in SCREENS]
+    complete_page = Page(COMPLETE_FILE, create_complete_document, (SCREENS,))
+    stale = set()
+    if 'screens' in targets:
+        stale |= stale_pages(screen_pages, SCREENS_DIR, force, styles)
+    complete_stale = 'complete' in targets and bool(stale_pages([complete_page], COMPLETE_DIR, force))
+    needed = [screen for screen in SCREENS if complete_stale or screen.filename in stale]
+
+    rendered, seconds = render_fragments(screen_fragment, [(screen, total) for screen in needed], workers)
+    fragments = dict(zip((screen.filename for screen in needed), rendered))
+    for page in screen_pages:
+        if page.filename in fragments:
+            page.context = {'fragment': fragments[page.filename]}
+    if complete_stale:
+        complete_page.context = {'fragments': [fragments[screen.filename] for screen in SCREENS]}
+
+    reports = {}
+    if 'screens' in targets:
+        reports['screens'] = render_pages(screen_pages, SCREENS_DIR, workers, force, styles)
+    if 'complete' in targets:
+        reports['complete'] = render_pages([complete_page], COMPLETE_DIR, workers, force)
+    if needed:
+        # Reported once, with the first build that rendered pages
+        report = next(report for report in reports.values() if report.pages)
+        report.fragments = {'count': len(needed), 'seconds': round(seconds, 4)}
+    return reports
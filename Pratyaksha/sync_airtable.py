@@ -5,134 +5,491 @@ Pulls all records from the Cognitive Log Airtable and saves to CSV.
 
 Usage:
     python sync_airtable.py
+    python sync_airtable.py --incremental
+    python sync_airtable.py --partitions 4
+    python sync_airtable.py --incremental --local-formulas
+    python sync_airtable.py --columnar parquet
+    python sync_airtable.py --sqlite
+    python sync_airtable.py --incremental --search
+    python sync_airtable.py --incremental --vectors
+    python sync_airtable.py --metrics entries_metrics.json --prometheus entries.prom
+    python sync_airtable.py --summary entries_summary.json
+    python sync_airtable.py --watch --health-port 9464
 
 Output:
     - entries_data.csv (overwritten with latest data)
-    - Console summary of sync operation
+    - entries_data.sync.json (watermark for --incremental runs)
+    - entries_data.manifest.json (per-record content hashes)
+    - entries_data.journal.csv / .journal.json (checkpoint while a full sync
+      runs; an interrupted sync resumes from it on the next run)
+    - entries_data.parquet / entries_data.arrow (with --columnar, needs pyarrow)
+    - entries table in airtable.db (with --sqlite)
+    - entries full-text index in airtable.db (with --search; query it with
+      python -m airtable_sync.search)
+    - entries_data.vectors.f32 / .vectors.json (with --vectors; query them
+      with python -m airtable_sync.vectors)
+    - JSON / Prometheus textfile metrics (with --metrics / --prometheus)
+    - Console summary of sync operation (also as JSON with --summary)
 """
 
-from pyairtable import Api
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 import csv
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+import heapq
+from itertools import islice
+import json
+from operator import itemgetter
 import os
+import queue
+import sys
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from airtable_sync.client import ClientMetrics, connect
+from airtable_sync.columnar import FORMATS, ColumnarWriter
+from airtable_sync.instrument import SyncMetrics
+from airtable_sync.config import ENTRIES
+from airtable_sync.journal import resumable_pages
+from airtable_sync.manifest import CSVOutput, manifest_path
+from airtable_sync.mapping import RECORD_ID
+from airtable_sync.search import SearchIndex
+from airtable_sync.sqlite_mirror import DEFAULT_PATH, SQLiteMirror
+from airtable_sync.vectors import VectorStore
+from airtable_sync.watch import Watcher, add_watch_arguments
+
 # Load environment variables from .env (in parent AirTable folder)
 load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.env'))
 
 # Configuration (from .env)
 API_KEY = os.getenv('AIRTABLE_API_KEY')
-BASE_ID = os.getenv('AIRTABLE_BASE_ID')
-TABLE_ID = os.getenv('AIRTABLE_TABLE_ID')
-OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
-OUTPUT_FILE = os.path.join(OUTPUT_DIR, 'entries_data.csv')
-
-# Column definitions
-COLUMNS = [
-    'Record ID', 'Name', 'Type', 'Date', 'Timestamp', 'Text',
-    'Inferred Mode', 'Inferred Energy', 'Energy Shape', 'Contradiction',
-    'Snapshot', 'Loops', 'Next Action', 'Meta Flag', 'Is Summary?',
-    'Summary (AI)', 'Actionable Insights (AI)', 'Entry Length (Words)',
-    'Days Since Entry', 'Is Recent?', 'Entry Sentiment (AI)', 'Entry Theme Tags (AI)'
-]
-
-
-def extract_ai_field(value):
-    """Extract value from AI field dict or return as-is."""
-    if isinstance(value, dict):
-        return value.get('value', '')
-    return value or ''
-
-
-def fetch_records():
-    """Fetch all records from Airtable."""
-    api = Api(API_KEY)
-    table = api.table(BASE_ID, TABLE_ID)
-    return table.all(sort=['Date'])
-
-
-def process_record(rec):
-    """Transform Airtable record to CSV row."""
-    fields = rec['fields']
+BASE_ID = ENTRIES.base_id()
+TABLE_ID = ENTRIES.table_id()
+# SYNC_OUTPUT_DIR redirects output, e.g. for benchmarks against the fake server
+OUTPUT_DIR = ENTRIES.output_dir()
+OUTPUT_FILE = ENTRIES.output_path()
+WATERMARK_FILE = os.path.join(OUTPUT_DIR, 'entries_data.sync.json')
+MANIFEST_FILE = manifest_path(OUTPUT_FILE)
+
+# Incremental sync: re-fetch a little before the stored watermark to absorb
+# clock skew between this machine and Airtable
+WATERMARK_OVERLAP = timedelta(minutes=1)
+# Smallest field to request when only record IDs are needed
+ID_ONLY_FIELDS = ['Date']
+# Rows written per batch when streaming (matches Airtable's page size)
+PAGE_SIZE = 100
+
+# Column definitions (CSV column, Airtable source field, extractor, default)
+# and SQLite indexes live in airtable_sync.config
+MAPPING = ENTRIES.mapping
+SQLITE_INDEXES = ENTRIES.indexes
+
+# Compiled row builder: Airtable record -> CSV row tuple
+ROW = ENTRIES.row
+process_record = ROW.build
+COLUMNS = ROW.columns
+# Airtable fields requested on every fetch (all other fields are skipped)
+FIELDS = ROW.fields
+
+# Row positions used by the merge
+ID = ROW.index(RECORD_ID)
+DATE = ROW.index('Date')
+
+
+def get_table(metrics):
+    """Return the Entries table handle."""
+    api = connect(API_KEY, metrics=metrics)
+    return api.table(BASE_ID, TABLE_ID)
+
+
+def fetch_pages(table, run, journal=None, builder=ROW):
+    """Yield processed rows from Airtable one page at a time.
+
+    With a journal, each page is checkpointed before it is yielded and an
+    interrupted run resumes from the last committed page.
+    """
+    if journal is not None:
+        yield from resumable_pages(table, journal, builder.build, PAGE_SIZE, run,
+                                   sort=['Date'], fields=builder.fields)
+        return
+    pages = table.iterate(sort=['Date'], fields=builder.fields, page_size=PAGE_SIZE)
+    while True:
+        with run.phase('fetch'):
+            page = next(pages, None)
+        if page is None:
+            return
+        with run.phase('transform'):
+            rows = [builder.build(rec) for rec in page]
+        yield rows
+
+
+def date_bounds(table):
+    """Return the earliest and latest Date in the table, or None if empty."""
+    first = table.first(sort=['Date'], fields=ID_ONLY_FIELDS, formula='{Date}')
+    last = table.first(sort=['-Date'], fields=ID_ONLY_FIELDS, formula='{Date}')
+    if not (first and last):
+        return None
+    return (date.fromisoformat(first['fields']['Date'][:10]),
+            date.fromisoformat(last['fields']['Date'][:10]))
+
+
+def partition_formulas(first, last, partitions):
+    """Split [first, last] into Date windows, one filterByFormula each.
+
+    Windows are contiguous and disjoint: the first also takes records with no
+    Date (which sort first), every later one requires a Date (a blank Date is
+    not before any bound) and the last is open-ended, so together they cover
+    every record exactly once.
+    """
+    days = (last - first).days + 1
+    partitions = max(1, min(partitions, days))
+    bounds = [first + timedelta(days=days * i // partitions) for i in range(1, partitions)]
+    before = lambda d: f"IS_BEFORE({{Date}}, DATETIME_PARSE('{d.isoformat()}'))"
+    formulas = []
+    for i in range(partitions):
+        if i == 0:
+            formula = f'OR({{Date}} = BLANK(), {before(bounds[0])})' if bounds else ''
+        else:
+            clauses = ['{Date}', f'NOT({before(bounds[i - 1])})']
+            if i < partitions - 1:
+                clauses.append(before(bounds[i]))
+            formula = f'AND({", ".join(clauses)})'
+        formulas.append(formula)
+    return formulas
+
+
+def fetch_partitioned(table, run, partitions, builder=ROW):
+    """Yield processed rows in Date order, fetching Date windows concurrently.
+
+    Each window is paginated on its own thread into a queue; the shared
+    client keeps all threads within the base's rate limit. Windows are then
+    k-way merged on Date, which yields exactly the serial sort order because
+    windows never overlap.
+    """
+    bounds = date_bounds(table)
+    if bounds is None or partitions < 2:
+        yield from fetch_pages(table, run, builder=builder)
+        return
+    formulas = partition_formulas(*bounds, partitions)
+
+    def pull(formula, pages):
+        options = {'formula': formula} if formula else {}
+        try:
+            for page in table.iterate(sort=['Date'], fields=builder.fields, page_size=PAGE_SIZE,
+                                      **options):
+                pages.put(page)
+            pages.put(None)
+        except Exception as e:  # re-raised by the consuming thread
+            pages.put(e)
+
+    def stream(pages):
+        while True:
+            with run.phase('fetch'):
+                page = pages.get()
+            if isinstance(page, Exception):
+                raise page
+            if page is None:
+                return
+            with run.phase('transform'):
+                rows = [builder.build(rec) for rec in page]
+            yield from rows
+
+    queues = [queue.Queue() for _ in formulas]
+    with ThreadPoolExecutor(max_workers=len(formulas)) as pool:
+        for formula, pages in zip(formulas, queues):
+            pool.submit(pull, formula, pages)
+        merged = heapq.merge(*(stream(pages) for pages in queues), key=lambda r: r[DATE] or '')
+        yield from paginate(merged)
+
+
+def fetch_changed_records(table, since, known_ids, fields=FIELDS):
+    """Fetch records modified since the watermark, plus any unseen IDs."""
+    cutoff = (since - WATERMARK_OVERLAP).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    formula = f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{cutoff}'))"
+    changed = {rec['id']: rec for rec in table.all(formula=formula, fields=fields)}
+
+    # Cheap ID-only pass: detects deletions and records created without a
+    # modification time newer than the watermark
+    current_ids = {rec['id'] for rec in table.all(fields=ID_ONLY_FIELDS)}
+    missing = current_ids - known_ids - set(changed)
+    if missing:
+        formula = 'OR(' + ', '.join(f"RECORD_ID()='{rid}'" for rid in sorted(missing)) + ')'
+        for rec in table.all(formula=formula, fields=fields):
+            changed[rec['id']] = rec
+
+    deleted = known_ids - current_ids
+    return list(changed.values()), deleted, current_ids
+
+
+def load_watermark():
+    """Load the incremental sync watermark, or None if absent."""
+    if not (os.path.exists(WATERMARK_FILE) and os.path.exists(OUTPUT_FILE)):
+        return None
+    with open(WATERMARK_FILE, encoding='utf-8') as f:
+        data = json.load(f)
     return {
-        'Record ID': rec['id'],
-        'Name': fields.get('Name', ''),
-        'Type': fields.get('Type', ''),
-        'Date': fields.get('Date', ''),
-        'Timestamp': fields.get('Timestamp', ''),
-        'Text': fields.get('Text', ''),
-        'Inferred Mode': fields.get('Inferred Mode', ''),
-        'Inferred Energy': fields.get('Inferred Energy', ''),
-        'Energy Shape': fields.get('Energy Shape', ''),
-        'Contradiction': fields.get('Contradiction', ''),
-        'Snapshot': fields.get('Snapshot', ''),
-        'Loops': fields.get('Loops', ''),
-        'Next Action': fields.get('Next Action', ''),
-        'Meta Flag': fields.get('Meta Flag', ''),
-        'Is Summary?': fields.get('Is Summary?', False),
-        'Summary (AI)': fields.get('Summary (AI)', ''),
-        'Actionable Insights (AI)': fields.get('Actionable Insights (AI)', ''),
-        'Entry Length (Words)': fields.get('Entry Length (Words)', ''),
-        'Days Since Entry': fields.get('Days Since Entry', ''),
-        'Is Recent?': fields.get('Is Recent?', ''),
-        'Entry Sentiment (AI)': extract_ai_field(fields.get('Entry Sentiment (AI)', '')),
-        'Entry Theme Tags (AI)': extract_ai_field(fields.get('Entry Theme Tags (AI)', '')),
+        'last_modified': datetime.fromisoformat(data['last_modified']),
+        'record_ids': set(data['record_ids']),
     }
 
 
-def save_csv(rows):
-    """Write rows to CSV file."""
-    with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=COLUMNS)
-        writer.writeheader()
-        writer.writerows(rows)
+def save_watermark(started, record_ids):
+    """Persist the watermark next to the CSV."""
+    with open(WATERMARK_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'last_modified': started.isoformat(),
+            'record_ids': sorted(record_ids),
+        }, f, indent=2)
 
 
-def main():
-    """Main sync function."""
-    print('=' * 50)
-    print('AIRTABLE SYNC')
-    print('=' * 50)
-    print(f'Started: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-    print()
+def iter_csv():
+    """Stream previously synced rows from the CSV."""
+    with open(OUTPUT_FILE, newline='', encoding='utf-8') as f:
+        rows = csv.reader(f)
+        next(rows, None)
+        yield from rows
+
+
+def merge_rows(existing, changed, deleted):
+    """Apply changed and deleted records to existing rows, keeping Date order.
+
+    Both inputs are Date-ordered, so this is a streaming merge: only the
+    changed rows are held in memory.
+    """
+    key = lambda r: r[DATE] or ''
+    updates = {row[ID]: row for row in changed}
+    pending = sorted(changed, key=key)
+    emitted = set()
+    i = 0
+    for row in existing:
+        rid = row[ID]
+        if rid in deleted:
+            continue
+        while i < len(pending) and key(pending[i]) < key(row):
+            if pending[i][ID] not in emitted:
+                emitted.add(pending[i][ID])
+                yield pending[i]
+            i += 1
+        update = updates.get(rid)
+        if update is None:
+            yield row
+        elif rid not in emitted and key(update) == key(row):
+            # Date unchanged: replace in place to keep the original order
+            emitted.add(rid)
+            yield update
+    for row in pending[i:]:
+        if row[ID] not in emitted:
+            yield row
+
+
+def paginate(rows, size=PAGE_SIZE):
+    """Group a row stream into lists of at most size rows."""
+    rows = iter(rows)
+    while page := list(islice(rows, size)):
+        yield page
+
+
+def save_csv(pages, run, sinks=(), derive=None):
+    """Stream pages of rows to the CSV file and return run statistics.
+
+    Rows are written to a temporary file that replaces the CSV once complete,
+    so readers never see a partial file and incremental merges can read the
+    previous output while writing. The temporary file is discarded instead
+    when no record hash changed since the last run, leaving the CSV
+    untouched. Each page is also handed to every sink (a ColumnarWriter or
+    SQLiteMirror), which is closed once the CSV is in place. Time spent
+    writing is added to the run's write and sinks phases.
+
+    With derive (a DerivedFields), formula columns are computed for today
+    before each page is written and left out of the record hashes.
+    """
+    stats = {'records': 0, 'record_ids': set(), 'summary': ENTRIES.summarize()}
+    with CSVOutput(OUTPUT_FILE, ROW, derive) as output:
+        for page in pages:
+            if derive is not None:
+                with run.phase('derive'):
+                    page = output.derive(page)
+            with run.phase('write'):
+                output.write(page)
+            with run.phase('sinks'):
+                for sink in sinks:
+                    sink.write(page)
+            run.add_records(len(page))
+            stats['records'] += len(page)
+            stats['record_ids'].update(map(itemgetter(ID), page))
+            with run.phase('summary'):
+                stats['summary'].add(page)
+        with run.phase('write'):
+            stats['replaced'] = output.commit()
+    stats['changes'] = output.manifest.diff()
+    with run.phase('sinks'):
+        for sink in sinks:
+            sink.close()
+    return stats
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description='Sync Cognitive Log entries to CSV.')
+    parser.add_argument('--incremental', action='store_true',
+                        help='fetch only records changed since the last sync')
+    parser.add_argument('--partitions', type=int, default=1, metavar='N',
+                        help='fetch N Date windows concurrently on full syncs')
+    parser.add_argument('--local-formulas', action='store_true',
+                        help='skip fetching formula columns and compute them locally')
+    parser.add_argument('--columnar', choices=sorted(FORMATS),
+                        help='also write a typed Parquet or Arrow IPC file')
+    parser.add_argument('--sqlite', nargs='?', const=DEFAULT_PATH, metavar='PATH',
+                        help=f'also mirror entries into an indexed SQLite database '
+                             f'(default: {os.path.basename(DEFAULT_PATH)})')
+    parser.add_argument('--search', nargs='?', const=DEFAULT_PATH, metavar='PATH',
+                        help=f'also update the full-text search index of entries '
+                             f'(default: {os.path.basename(DEFAULT_PATH)})')
+    parser.add_argument('--vectors', nargs='?', const=os.path.splitext(OUTPUT_FILE)[0],
+                        metavar='PREFIX',
+                        help='also embed new and changed entries for similarity search '
+                             '(default: entries_data.vectors.*)')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='write a JSON metrics record for the run')
+    parser.add_argument('--prometheus', metavar='PATH',
+                        help='write run metrics in Prometheus textfile format')
+    parser.add_argument('--summary', metavar='PATH',
+                        help='write the run summary statistics as JSON')
+    add_watch_arguments(parser)
+    return parser.parse_args()
+
+
+def sync(args, table, metrics, incremental):
+    """Run one sync pass; return its SyncMetrics and run statistics."""
+    run = SyncMetrics('entries', client=metrics)
+    started = datetime.now(timezone.utc)
+    watermark = load_watermark() if incremental else None
+    journal = None
+    builder = ENTRIES.builder(args.local_formulas)
+    derive = ENTRIES.derive() if args.local_formulas else None
 
-    # Fetch
-    print('Fetching records from Airtable...')
-    records = fetch_records()
-    print(f'  Found: {len(records)} records')
+    if watermark:
+        # Fetch delta
+        print(f'Fetching records changed since {watermark["last_modified"].isoformat()}...')
+        with run.phase('fetch'):
+            records, deleted, _ = fetch_changed_records(
+                table, watermark['last_modified'], watermark['record_ids'], builder.fields)
+        print(f'  Changed: {len(records)} records')
+        print(f'  Deleted: {len(deleted)} records')
 
-    # Process
-    print('Processing records...')
-    rows = [process_record(rec) for rec in records]
+        # Merge
+        print('Merging into existing records...')
+        with run.phase('transform'):
+            changed = [builder.build(rec) for rec in records]
+        pages = paginate(merge_rows(iter_csv(), changed, deleted))
+    else:
+        if incremental:
+            print('No watermark found, running full sync.')
+
+        # Fetch, process and write page by page
+        if args.partitions > 1:
+            print(f'Streaming records from Airtable in {args.partitions} Date windows...')
+            pages = fetch_partitioned(table, run, args.partitions, builder)
+        else:
+            print('Streaming records from Airtable...')
+            journal = ENTRIES.journal(local_formulas=args.local_formulas)
+            pages = fetch_pages(table, run, journal, builder)
 
     # Save
+    sinks = []
     print(f'Saving to: {OUTPUT_FILE}')
-    save_csv(rows)
+    if args.columnar:
+        columnar_file = os.path.splitext(OUTPUT_FILE)[0] + FORMATS[args.columnar]
+        sinks.append(ColumnarWriter(columnar_file, ROW))
+        print(f'  and:     {columnar_file}')
+    if args.sqlite:
+        sinks.append(SQLiteMirror(args.sqlite, 'entries', ROW, SQLITE_INDEXES))
+        print(f'  and:     {args.sqlite}')
+    if args.search:
+        search_index = SearchIndex(args.search, 'entries', ROW, ENTRIES.search, ENTRIES.search_display)
+        sinks.append(search_index)
+        print(f'  index:   {args.search}')
+    if args.vectors:
+        vector_store = VectorStore(args.vectors, ROW, ENTRIES.embed)
+        sinks.append(vector_store)
+        print(f'  vectors: {args.vectors}.vectors.f32')
+    stats = save_csv(pages, run, sinks, derive)
+    if args.search:
+        stats['search'] = search_index.summary()
+    if args.vectors:
+        stats['vectors'] = vector_store.summary()
+    if journal is not None and journal.created:
+        # Rows replayed from an interrupted run were fetched when it started
+        started = min(started, journal.created)
+    save_watermark(started, stats['record_ids'])
+    if journal is not None:
+        journal.finish()
+    run.finish()
+    if args.metrics:
+        run.write_json(args.metrics)
+    if args.prometheus:
+        run.write_prometheus(args.prometheus)
+    if args.summary:
+        stats['summary'].write_json(args.summary)
+    return run, stats
+
 
-    # Summary
+def print_summary(run, stats, metrics):
+    """Print the end-of-run summary."""
     print()
     print('-' * 50)
     print('SYNC COMPLETE')
     print('-' * 50)
-    print(f'  Records: {len(rows)}')
+    print(f'  Records: {stats["records"]}')
     print(f'  Columns: {len(COLUMNS)}')
-    print(f'  Output:  {OUTPUT_FILE}')
+    print(f'  Output:  {OUTPUT_FILE}' + ('' if stats['replaced'] else ' (unchanged, not rewritten)'))
+    changes = stats['changes']
+    print(f'  Changes: {changes["added"]} added, {changes["changed"]} changed, '
+          f'{changes["removed"]} removed')
+    if 'search' in stats:
+        print(f'  Search:  {stats["search"]}')
+    if 'vectors' in stats:
+        print(f'  Vectors: {stats["vectors"]}')
+    print(f'  API:     {metrics.summary()}')
+    print(f'  Phases:  {run.summary()}')
     print(f'  Time:    {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
     print()
 
-    # Show date range
-    dates = [r['Date'] for r in rows if r['Date']]
-    if dates:
-        print(f'  Date Range: {min(dates)} to {max(dates)}')
+    # Date range, type distribution, weekly counts and mode x energy
+    print(stats['summary'].text())
+
+    print('=' * 50)
+
 
-    # Show type distribution
-    types = {}
-    for r in rows:
-        t = r['Type'] or 'Unknown'
-        types[t] = types.get(t, 0) + 1
-    print(f'  Types: {dict(sorted(types.items(), key=lambda x: -x[1]))}')
+def main():
+    """Main sync function."""
+    args = parse_args()
 
     print('=' * 50)
+    print('AIRTABLE SYNC')
+    print('=' * 50)
+    print(f'Started: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+    print()
+
+    # One client for the whole process, so watch mode reuses its connections
+    metrics = ClientMetrics()
+    table = get_table(metrics)
+
+    if not args.watch:
+        run, stats = sync(args, table, metrics, args.incremental)
+        print_summary(run, stats, metrics)
+        return
+
+    # Watch mode: every cycle applies the delta since the last watermark
+    def cycle():
+        run, stats = sync(args, table, metrics, incremental=True)
+        changes = stats['changes']
+        return run, changes['added'] + changes['changed'] + changes['removed']
+
+    watcher = Watcher('entries', cycle, args.interval, args.max_interval)
+    if args.health_port is not None:
+        watcher.serve_health(args.health_port)
+    watcher.run()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,27 @@
+"""
+Airtable Sync Support
+=====================
+Shared building blocks for the Airtable sync scripts
+(Pratyaksha/sync_airtable.py and DinCharya/sync_dincharya.py) and the
+multi-table runner.
+
+Modules:
+    - config: bases, tables, column mappings and outputs of every synced table
+    - runner: syncs every configured table concurrently on one client
+    - client: rate-limit-aware pyairtable Api with retries and metrics
+    - instrument: per-phase timers and JSON / Prometheus metrics output
+    - mapping: declarative column specs compiled into CSV row builders
+    - columnar: optional typed Parquet / Arrow IPC output (pyarrow)
+    - joins: local resolution of lookup fields and in-memory indexed tables
+    - derived: formula columns computed locally from stable fields
+    - journal: checkpointed pagination so interrupted syncs resume
+    - manifest: per-record content hashes that skip unchanged CSV rewrites
+    - summary: single-pass run summary statistics (text and JSON)
+    - sqlite_mirror: indexed SQLite copy of each synced table
+    - search: incremental SQLite FTS5 index and ranked search CLI
+    - vectors: local embeddings in a memory-mapped matrix with top-k cosine search
+    - watch: long-running adaptive polling with a health endpoint
+    - bench_mapping: per-record transform benchmark for the mapping engine
+    - fake_airtable: local list-records server with synthetic schema data
+    - bench_sync: end-to-end sync benchmarks against the fake server
+"""
@@ -0,0 +1,143 @@
+"""
+Column Mapping Benchmark
+========================
+Measures per-record transform cost of the compiled Entries RowBuilder
+(airtable_sync.config.ENTRIES) against the hand-written dict builder it
+replaced, on synthetic Entries records.
+
+Usage:
+    python -m airtable_sync.bench_mapping
+    python -m airtable_sync.bench_mapping --records 100000
+
+Output:
+    - Console table of microseconds per record, transform only and
+      transform + CSV write
+"""
+
+import argparse
+import csv
+import io
+import random
+import time
+
+from airtable_sync.config import ENTRIES
+from airtable_sync.mapping import extract_ai_field
+
+TYPES = ['Emotional', 'Cognitive', 'Work', 'Health', 'Reflection', 'Stress']
+MODES = ['Reflective', 'Hopeful', 'Anxious', 'Calm', 'Grounded', 'Curious']
+WORDS = 'the a mind loop calm work stress hope rest plan energy focus quiet'.split()
+
+
+def dict_row(rec):
+    """Hand-written dict builder, as used before the mapping engine.
+
+    Kept as written for comparison; main() refuses to run once its columns
+    no longer match ENTRIES.
+    """
+    fields = rec['fields']
+    return {
+        'Record ID': rec['id'],
+        'Name': fields.get('Name', ''),
+        'Type': fields.get('Type', ''),
+        'Date': fields.get('Date', ''),
+        'Timestamp': fields.get('Timestamp', ''),
+        'Text': fields.get('Text', ''),
+        'Inferred Mode': fields.get('Inferred Mode', ''),
+        'Inferred Energy': fields.get('Inferred Energy', ''),
+        'Energy Shape': fields.get('Energy Shape', ''),
+        'Contradiction': fields.get('Contradiction', ''),
+        'Snapshot': fields.get('Snapshot', ''),
+        'Loops': fields.get('Loops', ''),
+        'Next Action': fields.get('Next Action', ''),
+        'Meta Flag': fields.get('Meta Flag', ''),
+        'Is Summary?': fields.get('Is Summary?', False),
+        'Summary (AI)': fields.get('Summary (AI)', ''),
+        'Actionable Insights (AI)': fields.get('Actionable Insights (AI)', ''),
+        'Entry Length (Words)': fields.get('Entry Length (Words)', ''),
+        'Days Since Entry': fields.get('Days Since Entry', ''),
+        'Is Recent?': fields.get('Is Recent?', ''),
+        'Entry Sentiment (AI)': extract_ai_field(fields.get('Entry Sentiment (AI)', '')),
+        'Entry Theme Tags (AI)': extract_ai_field(fields.get('Entry Theme Tags (AI)', '')),
+    }
+
+
+def synthetic_records(count, seed=0):
+    """Generate Entries-shaped records with some fields left blank."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        text = ' '.join(rng.choices(WORDS, k=rng.randint(20, 200)))
+        fields = {
+            'Name': f'Entry {i}',
+            'Type': rng.choice(TYPES),
+            'Date': f'2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'Timestamp': '2025-01-01T00:00:00.000Z',
+            'Text': text,
+            'Inferred Mode': rng.choice(MODES),
+            'Snapshot': text[:80],
+            'Is Summary?': rng.random() < 0.1,
+            'Summary (AI)': text[:200],
+            'Entry Length (Words)': text.count(' ') + 1,
+            'Days Since Entry': rng.randint(0, 400),
+            'Is Recent?': 'No',
+            'Entry Sentiment (AI)': {'state': 'generated', 'value': 'Neutral'},
+            'Entry Theme Tags (AI)': {'state': 'generated', 'value': 'rest, focus'},
+        }
+        records.append({'id': f'rec{i:014d}', 'createdTime': '', 'fields': fields})
+    return records
+
+
+def timed(fn):
+    """Run fn once and return elapsed seconds."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print results."""
+    parser = argparse.ArgumentParser(description='Benchmark the column mapping engine.')
+    parser.add_argument('--records', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.records)
+    builder = ENTRIES.row
+    build = builder.build
+    if tuple(dict_row({'id': '', 'fields': {}})) != builder.columns:
+        parser.error('dict_row() no longer matches the ENTRIES columns in airtable_sync.config')
+
+    def dict_transform():
+        for rec in records:
+            dict_row(rec)
+
+    def tuple_transform():
+        for rec in records:
+            build(rec)
+
+    def dict_write():
+        writer = csv.DictWriter(io.StringIO(), fieldnames=builder.columns)
+        writer.writeheader()
+        writer.writerows(dict_row(rec) for rec in records)
+
+    def tuple_write():
+        writer = csv.writer(io.StringIO())
+        writer.writerow(builder.columns)
+        writer.writerows(build(rec) for rec in records)
+
+    print(f'Records: {args.records:,} (best of {args.repeat})')
+    print(f'{"":24}{"dict":>12}{"compiled":>12}{"speedup":>10}')
+    for label, legacy, compiled in [
+        ('transform (us/rec)', dict_transform, tuple_transform),
+        ('transform+csv (us/rec)', dict_write, tuple_write),
+    ]:
+        legacy_time = min(timed(legacy) for _ in range(args.repeat))
+        compiled_time = min(timed(compiled) for _ in range(args.repeat))
+        print(f'{label:24}'
+              f'{legacy_time / args.records * 1e6:>12.2f}'
+              f'{compiled_time / args.records * 1e6:>12.2f}'
+              f'{legacy_time / compiled_time:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Sync Benchmark
+==============
+Runs sync_airtable.py and sync_dincharya.py end to end against the local
+fake Airtable server (airtable_sync.fake_airtable) at several table sizes,
+without touching the real API or the real CSVs.
+
+Each sync runs in its own process with SYNC_OUTPUT_DIR pointing at a
+temporary directory. Throughput, peak RSS and request counts are reported
+per run and appended to a JSON Lines results file tagged with the current
+git commit, so versions can be compared.
+
+At the default 5 req/s a sync needs one second per 500 records; use
+--rate 0 to measure CPU-bound throughput without a rate limit.
+
+Usage:
+    python -m airtable_sync.bench_sync
+    python -m airtable_sync.bench_sync --records 10000 100000 1000000
+    python -m airtable_sync.bench_sync --rate 0 --latency 0.05 --error-rate 0.02
+    python -m airtable_sync.bench_sync --sync entries --latency 0.2 --partitions 4
+
+Output:
+    - Console table per run
+    - bench_results.jsonl (one JSON record per run)
+"""
+
+import argparse
+from datetime import datetime, timezone
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from airtable_sync.fake_airtable import RATE_LIMIT, ROOT, FakeAirtable, sync_env
+
+SYNCS = {
+    'entries': [os.path.join(ROOT, 'Pratyaksha', 'sync_airtable.py')],
+    'dincharya': [os.path.join(ROOT, 'DinCharya', 'sync_dincharya.py'), '--concurrent'],
+}
+RESULTS_FILE = os.path.join(ROOT, 'bench_results.jsonl')
+
+# Client rate used when the server limit is disabled (--rate 0)
+UNLIMITED_RATE = 1_000_000
+
+
+def git_version():
+    """Short commit hash of the working tree, marked -dirty when modified."""
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--always', '--dirty'], cwd=ROOT,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run_sync(name, env, workdir, extra=()):
+    """Run one sync to completion; return wall time, peak RSS (KiB) and its metrics."""
+    metrics_file = os.path.join(workdir, f'{name}_metrics.json')
+    command = [sys.executable] + SYNCS[name] + ['--metrics', metrics_file] + list(extra)
+    start = time.monotonic()
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.monotonic() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode:
+        raise RuntimeError(f'{name} sync exited with status {process.returncode}')
+    with open(metrics_file, encoding='utf-8') as f:
+        metrics = json.load(f)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak_rss = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+    return elapsed, peak_rss, metrics
+
+
+def benchmark(name, records, args, version):
+    """Serve N records, run one sync against them and return its result record."""
+    server = FakeAirtable.from_schemas(
+        records, rate=args.rate, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate).serve()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            env = dict(os.environ, SYNC_OUTPUT_DIR=workdir, **sync_env(server))
+            env['AIRTABLE_RATE_LIMIT'] = str(args.rate or UNLIMITED_RATE)
+            extra = ['--partitions', str(args.partitions)] if name == 'entries' else []
+            elapsed, peak_rss, metrics = run_sync(name, env, workdir, extra)
+    finally:
+        server.shutdown()
+
+    client = metrics.get('client', {})
+    return {
+        'version': version,
+        'time': datetime.now(timezone.utc).isoformat(),
+        'sync': name,
+        'records': records,
+        'synced': metrics['records'],
+        'seconds': round(elapsed, 3),
+        'records_per_sec': round(metrics['records'] / elapsed, 1) if elapsed else 0,
+        'peak_rss_kib': peak_rss,
+        'requests': client.get('requests'),
+        'retries': client.get('retries'),
+        'server_requests': server.stats['requests'],
+        'server_429': server.stats['rate_limited'] + server.stats['injected_429'],
+        'phases': metrics['phases'],
+        'rate': args.rate,
+        'latency': args.latency,
+        'error_rate': args.error_rate,
+        'partitions': args.partitions if name == 'entries' else None,
+    }
+
+
+def main():
+    """Run the benchmark matrix and print results."""
+    parser = argparse.ArgumentParser(description='Benchmark the syncs against a fake Airtable.')
+    parser.add_argument('--records', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--sync', choices=sorted(SYNCS), nargs='+', default=sorted(SYNCS))
+    parser.add_argument('--rate', type=float, default=RATE_LIMIT,
+                        help='server and client requests per second per base (0 = unlimited)')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--partitions', type=int, default=1,
+                        help='Date windows fetched concurrently by the entries sync')
+    parser.add_argument('--output', default=RESULTS_FILE, help='JSON Lines results file')
+    args = parser.parse_args()
+
+    version = git_version()
+    print(f'Version: {version}')
+    print(f'{"sync":12}{"records":>10}{"seconds":>10}{"rec/s":>10}'
+          f'{"peak MiB":>10}{"requests":>10}{"429s":>8}')
+    for records in args.records:
+        for name in args.sync:
+            result = benchmark(name, records, args, version)
+            print(f'{name:12}{records:>10,}{result["seconds"]:>10.2f}'
+                  f'{result["records_per_sec"]:>10,.0f}{result["peak_rss_kib"] / 1024:>10.1f}'
+                  f'{result["requests"]:>10}{result["server_429"]:>8}')
+            with open(args.output, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(result) + '\n')
+    print(f'Results appended to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
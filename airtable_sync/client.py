@@ -0,0 +1,206 @@
+"""
+Airtable Client
+===============
+Builds a pyairtable Api whose HTTP session paces, retries and measures every
+request, so concurrent syncs stay under Airtable's rate limit.
+
+Each response body is downloaded inside the adapter and JSON-decoded where
+pyairtable processes the response (MeteredApi), so network time, decode
+time, bytes received and per-page latency are measured separately from the
+caller's own processing.
+
+Usage:
+    from airtable_sync.client import ClientMetrics, connect
+
+    metrics = ClientMetrics()
+    api = connect(API_KEY, metrics=metrics)
+    records = api.table(BASE_ID, TABLE_ID).all()
+    print(metrics.summary())
+
+AIRTABLE_ENDPOINT_URL and AIRTABLE_RATE_LIMIT override the API host and the
+per-base request rate, e.g. to run against airtable_sync.fake_airtable.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+
+from pyairtable import Api
+from requests.adapters import HTTPAdapter
+
+from airtable_sync.instrument import Histogram
+
+# Airtable allows 5 requests per second per base
+RATE_LIMIT = 5
+ENDPOINT_URL = 'https://api.airtable.com'
+
+# Retry policy: jittered exponential backoff on rate limits and server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+# Keep-alive connections held open per host
+POOL_SIZE = 10
+
+BASE_ID_PATTERN = re.compile(r'/v0/(app[^/?]+)')
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every request against one base."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent; return seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(base_id, rate=RATE_LIMIT):
+    """Return the process-wide token bucket for a base."""
+    with _buckets_lock:
+        if base_id not in _buckets:
+            _buckets[base_id] = TokenBucket(rate)
+        return _buckets[base_id]
+
+
+class ClientMetrics:
+    """Counters for requests sent, retries, bytes and time spent per stage."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.throttle_time = 0.0
+        self.backoff_time = 0.0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.bytes_received = 0
+        self.latency = Histogram()
+        self.lock = threading.Lock()
+
+    def record(self, **deltas):
+        """Add to one or more counters."""
+        with self.lock:
+            for name, value in deltas.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def observe_latency(self, seconds):
+        """Add one request's latency (one page) to the histogram."""
+        with self.lock:
+            self.latency.observe(seconds)
+
+    def as_dict(self):
+        """Return the counters as a plain dict."""
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'throttle_time': round(self.throttle_time, 3),
+            'backoff_time': round(self.backoff_time, 3),
+            'network_time': round(self.network_time, 3),
+            'decode_time': round(self.decode_time, 3),
+            'bytes_received': self.bytes_received,
+            'page_latency': self.latency.as_dict(),
+        }
+
+    def summary(self):
+        """One-line summary for console output."""
+        return (f'{self.requests} requests, {self.retries} retries, '
+                f'{self.throttle_time:.1f}s throttled, {self.backoff_time:.1f}s backing off, '
+                f'{self.network_time:.1f}s network, {self.bytes_received / 1024:.0f} KiB')
+
+
+def retry_delay(response, attempt):
+    """Seconds to wait before retrying, honouring Retry-After when sent."""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    # Full jitter keeps parallel syncs from retrying in lockstep
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTP adapter that paces requests per base and retries 429/5xx responses."""
+
+    def __init__(self, rate=RATE_LIMIT, retries=MAX_RETRIES, metrics=None, pool_size=POOL_SIZE):
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.rate = rate
+        self.retries = retries
+        self.metrics = metrics or ClientMetrics()
+
+    def send(self, request, **kwargs):
+        match = BASE_ID_PATTERN.search(request.url)
+        bucket = bucket_for(match.group(1) if match else '', self.rate)
+
+        attempt = 0
+        while True:
+            waited = bucket.acquire()
+            start = time.monotonic()
+            response = super().send(request, **kwargs)
+            body = response.content  # read the body here so it counts as network time
+            elapsed = time.monotonic() - start
+            self.metrics.record(requests=1, throttle_time=waited, network_time=elapsed,
+                                bytes_received=len(body or b''))
+            self.metrics.observe_latency(elapsed)
+            if response.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                return response
+
+            delay = retry_delay(response, attempt)
+            response.close()
+            self.metrics.record(retries=1, backoff_time=delay)
+            time.sleep(delay)
+            attempt += 1
+
+
+class MeteredApi(Api):
+    """pyairtable Api that times the JSON decode of every response it processes."""
+
+    def __init__(self, api_key, metrics=None, **kwargs):
+        super().__init__(api_key, **kwargs)
+        self.metrics = metrics or ClientMetrics()
+
+    def _process_response(self, response):
+        # pyairtable's one call to response.json() for each response
+        start = time.monotonic()
+        try:
+            return super()._process_response(response)
+        finally:
+            self.metrics.record(decode_time=time.monotonic() - start)
+
+
+def connect(api_key, rate=None, retries=MAX_RETRIES, metrics=None):
+    """Build a pyairtable Api that sends every request through RateLimitedAdapter."""
+    if rate is None:
+        rate = float(os.getenv('AIRTABLE_RATE_LIMIT') or RATE_LIMIT)
+    endpoint_url = os.getenv('AIRTABLE_ENDPOINT_URL') or ENDPOINT_URL
+    metrics = metrics or ClientMetrics()
+    # Disable pyairtable's own retries; the adapter handles them
+    api = MeteredApi(api_key, metrics, retry_strategy=None, endpoint_url=endpoint_url)
+    adapter = RateLimitedAdapter(rate=rate, retries=retries, metrics=metrics)
+    api.session.mount('https://', adapter)
+    api.session.mount('http://', adapter)
+    return api
@@ -0,0 +1,173 @@
+"""
+Columnar Output
+===============
+Typed Parquet / Arrow IPC output for synced rows, written page by page
+alongside the CSV. Requires pyarrow (optional: pip install pyarrow).
+
+Column types come from the dtype of each Column spec:
+    - string:    utf8
+    - date:      date32 (YYYY-MM-DD)
+    - timestamp: timestamp[ms, UTC] (ISO 8601)
+    - int:       int64
+    - bool:      bool
+    - category:  dictionary<int32, utf8>
+
+Usage:
+    writer = ColumnarWriter('entries_data.parquet', ROW)
+    writer.write(page)
+    writer.close()
+
+    table = read_columns('entries_data.arrow', ['Date', 'Type'])
+"""
+
+from datetime import date, datetime
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+
+FORMATS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+}
+
+
+def require_pyarrow():
+    """Raise a helpful error when pyarrow is not installed."""
+    if pa is None:
+        raise RuntimeError('Columnar output requires pyarrow: pip install pyarrow')
+
+
+def to_date(value):
+    """Parse a YYYY-MM-DD (or ISO datetime) value into a date."""
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
+
+
+def to_timestamp(value):
+    """Parse an ISO 8601 timestamp."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def to_int(value):
+    """Parse a whole number, treating blanks as null."""
+    if value is None or value == '':
+        return None
+    return int(float(value))
+
+
+def to_bool(value):
+    """Parse a checkbox value from Airtable or CSV text."""
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ('true', '1', 'yes')
+
+
+def to_string(value):
+    """Stringify a value, keeping nulls."""
+    if value is None:
+        return None
+    return str(value)
+
+
+CONVERTERS = {
+    'string': to_string,
+    'category': to_string,
+    'date': to_date,
+    'timestamp': to_timestamp,
+    'int': to_int,
+    'bool': to_bool,
+}
+
+
+def arrow_type(dtype):
+    """Map a Column dtype to its Arrow type."""
+    return {
+        'string': pa.string(),
+        'category': pa.dictionary(pa.int32(), pa.string()),
+        'date': pa.date32(),
+        'timestamp': pa.timestamp('ms', tz='UTC'),
+        'int': pa.int64(),
+        'bool': pa.bool_(),
+    }[dtype]
+
+
+class ColumnarWriter:
+    """Streams row tuples into a Parquet or Arrow IPC file.
+
+    Category columns keep one growing dictionary per column, so each batch
+    only adds new values (Arrow IPC dictionary deltas) instead of
+    re-encoding the whole column.
+    """
+
+    def __init__(self, path, builder):
+        require_pyarrow()
+        self.path = path
+        self.tmp_path = path + '.tmp'
+        self.dtypes = builder.dtypes
+        self.converters = [CONVERTERS[dtype] for dtype in self.dtypes]
+        self.schema = pa.schema([
+            (name, arrow_type(dtype)) for name, dtype in zip(builder.columns, self.dtypes)
+        ])
+        self.categories = {i: {} for i, dtype in enumerate(self.dtypes) if dtype == 'category'}
+        self.rows = 0
+
+        if path.endswith(FORMATS['parquet']):
+            self.writer = pq.ParquetWriter(self.tmp_path, self.schema)
+        else:
+            self.writer = ipc.new_file(
+                self.tmp_path, self.schema,
+                options=ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+
+    def encode(self, i, values):
+        """Dictionary-encode one category column against its running dictionary."""
+        lookup = self.categories[i]
+        indices = []
+        for value in values:
+            if value is None or value == '':
+                indices.append(None)
+                continue
+            if value not in lookup:
+                lookup[value] = len(lookup)
+            indices.append(lookup[value])
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=pa.int32()), pa.array(list(lookup), type=pa.string()))
+
+    def write(self, rows):
+        """Append one page of row tuples as a record batch."""
+        if not rows:
+            return
+        arrays = []
+        for i, (convert, field) in enumerate(zip(self.converters, self.schema)):
+            values = [convert(row[i]) for row in rows]
+            if i in self.categories:
+                arrays.append(self.encode(i, values))
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        self.writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self.rows += len(rows)
+
+    def close(self):
+        """Finish the file and move it into place."""
+        self.writer.close()
+        os.replace(self.tmp_path, self.path)
+
+
+def read_columns(path, columns=None):
+    """Load selected columns, memory-mapping the file instead of parsing it."""
+    require_pyarrow()
+    if path.endswith(FORMATS['parquet']):
+        return pq.read_table(path, columns=columns, memory_map=True)
+    table = ipc.open_file(pa.memory_map(path)).read_all()
+    return table.select(columns) if columns else table
@@ -0,0 +1,242 @@
+"""
+Table Config
+============
+Single source of truth for every synced Airtable table: which base and
+table it comes from (via environment variables), its column mapping, the
+sort to fetch it in, where its CSV goes, which columns the SQLite mirror
+indexes, which lookup and formula columns can be computed locally, which
+statistics the run summary reports, which columns are full-text indexed
+and which are embedded for similarity search.
+
+Both sync scripts and the multi-table runner (airtable_sync.runner) read
+their tables from here.
+
+Usage:
+    from airtable_sync.config import ENTRIES, TABLES
+
+    table = api.table(ENTRIES.base_id(), ENTRIES.table_id())
+    rows = [ENTRIES.row.build(rec) for rec in table.all(fields=ENTRIES.row.fields)]
+"""
+
+import os
+
+from airtable_sync import derived as formulas
+from airtable_sync.derived import Derived, DerivedFields
+from airtable_sync.joins import Lookup
+from airtable_sync.journal import SyncJournal
+from airtable_sync.mapping import (
+    CREATED_TIME, RECORD_ID, Column, compile_mapping, extract_ai_field, extract_field)
+from airtable_sync.summary import CrossTab, DateRange, Distribution, Ratio, RunSummary, WeeklyCounts
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TableConfig:
+    """One synced table: source, column mapping, sort, output and indexes."""
+
+    def __init__(self, name, base_env, table_env, mapping, output, sort=None, indexes=(),
+                 lookups=(), derived=(), summary=(), search=(), search_display=(), embed=()):
+        self.name = name
+        self.base_env = base_env
+        self.table_env = table_env
+        self.mapping = mapping
+        self.output = output
+        self.sort = sort
+        self.indexes = list(indexes)
+        # Lookup columns that can be resolved locally (airtable_sync.joins)
+        self.lookups = list(lookups)
+        # Formula columns that can be computed locally (airtable_sync.derived)
+        self.derived = list(derived)
+        # Statistics for the run summary (airtable_sync.summary)
+        self.summary = list(summary)
+        # Full-text indexed columns, and columns shown with each hit (airtable_sync.search)
+        self.search = list(search)
+        self.search_display = list(search_display)
+        # Columns joined into the text embedded for similarity search (airtable_sync.vectors)
+        self.embed = list(embed)
+        # Compiled row builder: Airtable record -> CSV row tuple
+        self.row = compile_mapping(mapping)
+        # Same columns, with each derived column fetched as its stand-in
+        bases = {d.name: d.base for d in self.derived}
+        self.local_row = compile_mapping([
+            Column(c.name, source=bases[c.name], dtype=c.dtype) if c.name in bases else c
+            for c in mapping
+        ])
+
+    def base_id(self):
+        """Airtable base ID, read from the environment."""
+        return os.getenv(self.base_env)
+
+    def table_id(self):
+        """Airtable table ID, read from the environment."""
+        return os.getenv(self.table_env)
+
+    def output_dir(self):
+        """Directory for the CSV and its sidecars (SYNC_OUTPUT_DIR overrides)."""
+        return os.getenv('SYNC_OUTPUT_DIR') or os.path.join(ROOT, os.path.dirname(self.output))
+
+    def output_path(self):
+        """Path of the table's CSV."""
+        return os.path.join(self.output_dir(), os.path.basename(self.output))
+
+    def builder(self, local_formulas=False):
+        """Row builder for fetched records, with stand-ins for local formulas."""
+        return self.local_row if local_formulas else self.row
+
+    def derive(self):
+        """DerivedFields that compute this table's formula columns."""
+        return DerivedFields(self.row, self.derived)
+
+    def summarize(self):
+        """Empty RunSummary of this table's statistics."""
+        return RunSummary(self.row, self.summary)
+
+    def fields(self, local_lookups=False, local_formulas=False):
+        """Airtable fields to request, without the sources computed locally."""
+        fields = self.builder(local_formulas).fields
+        if not local_lookups:
+            return fields
+        local = {self.mapping[self.row.index(lookup.name)].source for lookup in self.lookups}
+        return [field for field in fields if field not in local]
+
+    def fetch_options(self, local_lookups=False, local_formulas=False):
+        """List-records options (fields and, when set, sort) for a full fetch."""
+        options = {'fields': self.fields(local_lookups, local_formulas)}
+        if self.sort:
+            options['sort'] = self.sort
+        return options
+
+    def search_date(self):
+        """Search display column that search --since filters on, or None.
+
+        The first display column with dtype 'date'.
+        """
+        dtypes = dict(zip(self.row.columns, self.row.dtypes))
+        return next((name for name in self.search_display if dtypes[name] == 'date'), None)
+
+    def journal(self, local_lookups=False, local_formulas=False):
+        """Checkpoint journal for a full fetch of this table."""
+        return SyncJournal(os.path.splitext(self.output_path())[0], key={
+            'table': self.table_id(), 'fields': self.fields(local_lookups, local_formulas),
+            'sort': self.sort, 'columns': list(self.row.columns)})
+
+
+ENTRIES = TableConfig(
+    'entries',
+    base_env='AIRTABLE_BASE_ID',
+    table_env='AIRTABLE_TABLE_ID',
+    output='Pratyaksha/entries_data.csv',
+    sort=['Date'],
+    indexes=['Date', 'Type', 'Inferred Mode'],
+    mapping=[
+        Column(RECORD_ID),
+        Column('Name'),
+        Column('Type', dtype='category'),
+        Column('Date', dtype='date'),
+        Column('Timestamp', dtype='timestamp'),
+        Column('Text'),
+        Column('Inferred Mode', dtype='category'),
+        Column('Inferred Energy', dtype='category'),
+        Column('Energy Shape', dtype='category'),
+        Column('Contradiction'),
+        Column('Snapshot'),
+        Column('Loops'),
+        Column('Next Action'),
+        Column('Meta Flag'),
+        Column('Is Summary?', default=False, dtype='bool'),
+        Column('Summary (AI)'),
+        Column('Actionable Insights (AI)'),
+        Column('Entry Length (Words)', dtype='int'),
+        Column('Days Since Entry', dtype='int'),
+        Column('Is Recent?'),
+        Column('Entry Sentiment (AI)', extract=extract_ai_field),
+        Column('Entry Theme Tags (AI)', extract=extract_ai_field),
+    ],
+    derived=[
+        Derived('Entry Length (Words)', ['Text'], formulas.word_count),
+        Derived('Days Since Entry', ['Date'], formulas.days_since),
+        Derived('Is Recent?', ['Date'], formulas.is_recent),
+    ],
+    summary=[
+        DateRange('Date'),
+        Distribution('Type', 'Types'),
+        WeeklyCounts('Date', 'Entries per Week'),
+        CrossTab('Inferred Mode', 'Inferred Energy', 'Mode x Energy'),
+    ],
+    search=['Text', 'Snapshot', 'Summary (AI)', 'Actionable Insights (AI)'],
+    search_display=['Date', 'Type', 'Name'],
+    embed=['Text', 'Name', 'Snapshot'],
+)
+
+PRIORITIES = TableConfig(
+    'priorities',
+    base_env='DINCHARYA_BASE_ID',
+    table_env='DINCHARYA_PRIORITIES_TABLE_ID',
+    output='DinCharya/priorities.csv',
+    sort=['Rank'],
+    indexes=['Status', 'Horizon'],
+    mapping=[
+        Column(RECORD_ID),
+        Column('Title'),
+        Column('Horizon'),
+        Column('Status'),
+        Column('Rank'),
+        Column('Why'),
+        Column('Due Date'),
+        Column('Category'),
+        Column('Created'),
+        Column('Total Tasks'),
+        Column('Completed Tasks'),
+        Column('Task Completion %'),
+        Column('Summary', extract=extract_field),
+        Column('Category Suggestion', extract=extract_field),
+    ],
+    derived=[
+        Derived('Task Completion %', ['Completed Tasks', 'Total Tasks'], formulas.percent),
+    ],
+    summary=[
+        Distribution('Horizon', 'Horizons', by_count=False),
+        Distribution('Status', 'Statuses', by_count=False),
+        Ratio('Horizon', 'Completed Tasks', 'Total Tasks', 'Completion % by Horizon'),
+    ],
+)
+
+TASKS = TableConfig(
+    'tasks',
+    base_env='DINCHARYA_BASE_ID',
+    table_env='DINCHARYA_TASKS_TABLE_ID',
+    output='DinCharya/tasks.csv',
+    # 'Priority' holds the linked priority record IDs
+    indexes=['Priority', 'Status'],
+    mapping=[
+        Column(RECORD_ID),
+        Column('Task'),
+        Column('Priority', source='Priority Link', extract=extract_field),
+        Column('Status'),
+        Column('Notes'),
+        Column('Priority Horizon', extract=extract_field),
+        Column('Priority Status', extract=extract_field),
+        Column('Priority Due Date', extract=extract_field),
+        Column('Days Until Due'),
+        Column('Is Overdue'),
+        Column('Task Age (days)'),
+        Column('Task Summary (AI)', extract=extract_field),
+        Column('Suggested Next Action (AI)', extract=extract_field),
+    ],
+    lookups=[
+        Lookup('Priority Horizon', link='Priority', table='priorities', field='Horizon'),
+        Lookup('Priority Status', link='Priority', table='priorities', field='Status'),
+        Lookup('Priority Due Date', link='Priority', table='priorities', field='Due Date'),
+    ],
+    derived=[
+        Derived('Days Until Due', ['Priority Due Date'], formulas.days_until),
+        Derived('Is Overdue', ['Days Until Due'], formulas.is_overdue),
+        Derived('Task Age (days)', ['Task Age (days)'], formulas.age_days, base=CREATED_TIME),
+    ],
+    summary=[
+        Distribution('Status', 'Task Statuses', by_count=False),
+        CrossTab('Priority Horizon', 'Status', 'Horizon x Task Status'),
+    ],
+)
+
+TABLES = {config.name: config for config in (ENTRIES, PRIORITIES, TASKS)}
@@ -0,0 +1,148 @@
+"""
+Derived Fields
+==============
+Computes Airtable formula columns locally, at export time, from the stable
+fields they are based on.
+
+Formulas such as 'Days Since Entry' depend on TODAY(), so Airtable returns
+a different value every day and every record looks changed. With local
+formulas the sync skips fetching them: the fetched row holds a blank (or,
+for record ages, the record's createdTime) in each derived column, and
+DerivedFields fills the columns in just before rows are written. Content
+hashes cover only the stable columns, so a new day alone is not a change.
+
+Each formula runs over whole columns of a page at once. Inputs repeat a
+lot (a few hundred distinct dates per table), so every formula computes
+each distinct input once per page and maps the results back.
+
+Usage:
+    derive = DerivedFields(ROW, ENTRIES.derived)
+    for page in pages:
+        page = derive.apply(page)
+"""
+
+from datetime import datetime, timezone
+
+from airtable_sync.columnar import to_date, to_int
+from airtable_sync.mapping import LOCAL
+
+# Separator extract_field uses for lookups with several values
+LIST_SEPARATOR = ', '
+# IS_RECENT: entries at most this many days old
+RECENT_DAYS = 7
+
+
+class Derived:
+    """One formula column: its inputs, vectorized formula and fetched stand-in.
+
+    compute(today, *columns) receives one sequence per input column and
+    returns the derived column. base is the source fetched into the column
+    in place of the formula (LOCAL for a blank, or CREATED_TIME).
+    """
+
+    __slots__ = ('name', 'inputs', 'compute', 'base')
+
+    def __init__(self, name, inputs, compute, base=LOCAL):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.compute = compute
+        self.base = base
+
+
+class DerivedFields:
+    """Applies Derived formulas to pages of row tuples."""
+
+    def __init__(self, builder, derived):
+        self.derived = list(derived)
+        self.plan = [(builder.index(d.name), [builder.index(name) for name in d.inputs], d.compute)
+                     for d in self.derived]
+        # Positions left out of content hashes
+        self.positions = [position for position, _, _ in self.plan]
+
+    def apply(self, rows, today=None):
+        """Return rows with every derived column recomputed (in spec order)."""
+        if not rows or not self.plan:
+            return rows
+        today = today or datetime.now(timezone.utc).date()
+        columns = list(zip(*rows))
+        for position, inputs, compute in self.plan:
+            columns[position] = compute(today, *(columns[i] for i in inputs))
+        return list(zip(*columns))
+
+
+def each_distinct(fn, values):
+    """Map fn over values, calling it once per distinct value."""
+    cache = {}
+    out = []
+    for value in values:
+        try:
+            out.append(cache[value])
+        except KeyError:
+            cache[value] = result = fn(value)
+            out.append(result)
+    return out
+
+
+def first_date(value):
+    """Date of a date field, or of the first value of a joined date lookup."""
+    if not value:
+        return None
+    return to_date(str(value).split(LIST_SEPARATOR)[0])
+
+
+# --- Formulas ---------------------------------------------------------------
+
+def word_count(today, texts):
+    """Entry Length (Words): IF({Text}, LEN(TRIM(t)) - LEN(SUBSTITUTE(TRIM(t), ' ', '')) + 1, 0)."""
+    return [text.strip().count(' ') + 1 if text else 0 for text in texts]
+
+
+def days_since(today, dates):
+    """Days Since Entry: DATETIME_DIFF(TODAY(), {Date}, 'days'), blank without a date."""
+    def diff(value):
+        day = first_date(value)
+        return '' if day is None else (today - day).days
+    return each_distinct(diff, dates)
+
+
+def is_recent(today, dates):
+    """Is Recent?: 'Yes' when the date is at most RECENT_DAYS days ago."""
+    def recent(value):
+        day = first_date(value)
+        return 'Yes' if day is not None and (today - day).days <= RECENT_DAYS else 'No'
+    return each_distinct(recent, dates)
+
+
+def days_until(today, dates):
+    """Days Until Due: DATETIME_DIFF({Priority Due Date}, TODAY(), 'days')."""
+    def diff(value):
+        day = first_date(value)
+        return '' if day is None else (day - today).days
+    return each_distinct(diff, dates)
+
+
+def is_overdue(today, days):
+    """Is Overdue: IF({Days Until Due} < 0, 'Yes', 'No')."""
+    return ['Yes' if day not in ('', None) and int(day) < 0 else 'No' for day in days]
+
+
+def age_days(today, created):
+    """Task Age (days): days since the record was created (createdTime)."""
+    def age(value):
+        day = first_date(value)
+        return '' if day is None else (today - day).days
+    return each_distinct(age, created)
+
+
+def percent(today, part, whole):
+    """Task Completion %: {Completed Tasks} / {Total Tasks} * 100, blank when no tasks."""
+    out = []
+    for p, w in zip(part, whole):
+        p, w = to_int(p), to_int(w)
+        if not w:
+            out.append('')
+            continue
+        # Same operation order as the formula, so floats match the fetched value
+        value = (p or 0) / w * 100
+        out.append(int(value) if value.is_integer() else value)
+    return out
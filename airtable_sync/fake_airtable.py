@@ -0,0 +1,768 @@
+"""
+Fake Airtable
+=============
+Local stand-in for the Airtable list-records endpoint, serving synthetic
+records generated from the table schemas in this repository
+(Pratyaksha/entries_table_schema.txt and DinCharya/schema.md).
+
+Supports:
+    - GET /v0/{base}/{table} and POST /v0/{base}/{table}/listRecords
+    - pageSize, offset, maxRecords and fields[] projection
+    - filterByFormula with AND, OR, NOT, =, !=, IS_BEFORE, IS_AFTER,
+      DATETIME_PARSE, BLANK, RECORD_ID and LAST_MODIFIED_TIME
+    - records changed, created and deleted between requests (update(),
+      create() and delete())
+    - a per-base request rate limit answered with 429 like Airtable
+    - injected latency and random 429s
+    - a log of every request's parameters (FakeAirtable.requests)
+    - offsets expired on demand (expire_offsets()) and answered with 422
+
+Records are generated on demand from their index, so serving a million
+records never holds more than one page in memory. Entries are generated in
+Date order and Priorities in Rank order, matching the sorts the syncs ask
+for; a descending sort reverses that order. A formula over Entries' Date
+alone is evaluated once per day rather than per record. Once a table has
+changed records, every request for it evaluates each record and sorts on
+the requested field (blanks first), so keep such tables small.
+
+Usage:
+    python -m airtable_sync.fake_airtable --records 100000
+    AIRTABLE_ENDPOINT_URL=http://127.0.0.1:8787 python Pratyaksha/sync_airtable.py
+
+    server = FakeAirtable.from_schemas(10_000).serve(port=0)
+    print(server.url, server.stats)
+    server.shutdown()
+"""
+
+import argparse
+from bisect import bisect_right
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import random
+import re
+from itertools import chain
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRIES_SCHEMA = os.path.join(ROOT, 'Pratyaksha', 'entries_table_schema.txt')
+DINCHARYA_SCHEMA = os.path.join(ROOT, 'DinCharya', 'schema.md')
+
+# Airtable's documented limits
+RATE_LIMIT = 5
+MAX_PAGE_SIZE = 100
+
+# Synthetic data shape
+START_DATE = date(2024, 1, 1)
+DATE_SPAN_DAYS = 730
+TASKS_PER_PRIORITY = 10
+WORDS = ('the a mind loop calm work stress hope rest plan energy focus quiet '
+         'family walk sleep write call team idea doubt choice body breath').split()
+AI_OUTPUTS = {
+    'Entry Sentiment (AI)': ['Positive', 'Negative', 'Neutral'],
+}
+
+# filterByFormula tokens: {Field}, 'string', FUNCTION( and operators
+FORMULA_TOKEN = re.compile(
+    r"""\s*(?:(?P<field>\{[^}]*\})|(?P<string>'[^']*'|"[^"]*")|(?P<call>[A-Z_]+)\s*\("""
+    r"""|(?P<op>!=|[=(),]))""")
+
+
+class Field:
+    """One schema field: name, type, select options and formula result type."""
+
+    def __init__(self, name, type, options=None, result=None, source=None):
+        self.name = name
+        self.type = type.lower()
+        self.options = options or []
+        self.result = result
+        self.source = source
+
+
+class TableSchema:
+    """A table's ID, name, fields and how many records to serve."""
+
+    def __init__(self, base_id, table_id, name, fields, count=0, prefix='X'):
+        self.base_id = base_id
+        self.table_id = table_id
+        self.name = name
+        self.fields = fields
+        self.count = count
+        self.prefix = prefix
+
+
+# --- Schema parsing ---------------------------------------------------------
+
+def parse_entries_schema(path=ENTRIES_SCHEMA):
+    """Parse the numbered field list of entries_table_schema.txt."""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    base_id = re.search(r'^Base: .*\((app\w+)\)', text, re.M).group(1)
+    table_id = re.search(r'^Table: .*\((tbl\w+)\)', text, re.M).group(1)
+
+    fields = []
+    in_options = False
+    for line in text.split('API ACCESS')[0].splitlines():
+        if match := re.match(r'^\s*\d+\.\s+(.+?)\s*$', line):
+            fields.append(Field(match.group(1), ''))
+            in_options = False
+        elif not fields:
+            continue
+        elif match := re.match(r'^\s*Type:\s*(\w+)', line):
+            fields[-1].type = match.group(1).lower()
+        elif match := re.match(r'^\s*Result:\s*(\w+)', line):
+            fields[-1].result = match.group(1).lower()
+        elif re.match(r'^\s*Options:', line):
+            in_options = True
+        elif in_options and (match := re.match(r'^\s*-\s+(.+?)\s*$', line)):
+            fields[-1].options.append(match.group(1))
+        else:
+            in_options = False
+    return TableSchema(base_id, table_id, 'Entries', fields, prefix='E')
+
+
+def parse_dincharya_schema(path=DINCHARYA_SCHEMA):
+    """Parse the Priorities and Tasks field tables of DinCharya/schema.md."""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    base_id = re.search(r'\*\*Base ID:\*\*\s*`(app\w+)`', text).group(1)
+    table_ids = dict(re.findall(r'^\|\s*(\w+)\s*\|\s*`(tbl\w+)`', text, re.M))
+
+    tables = {}
+    for name in ('Priorities', 'Tasks'):
+        section = re.search(rf'^## {name} Table\n(.*?)(?=^## |\Z)', text, re.M | re.S).group(1)
+        fields = []
+        for row in re.findall(r'^\|(.+)\|\s*$', section, re.M):
+            cells = [cell.strip() for cell in row.split('|')]
+            if cells[0] in ('Field', '') or set(cells[0]) <= set('-'):
+                continue
+            source = None
+            if cells[1] == 'Lookup' and len(cells) > 2:
+                source = cells[2].split(' from ')[0]
+            fields.append(Field(cells[0], cells[1], source=source))
+        by_name = {field.name: field for field in fields}
+        for option_name, block in re.findall(r'^\*\*(.+?):\*\*\n((?:- .+\n?)+)', section, re.M):
+            if option_name in by_name:
+                by_name[option_name].options = [
+                    re.sub(r'\s*\(default\)$', '', line[2:].strip())
+                    for line in block.strip().splitlines()
+                ]
+        tables[name] = TableSchema(base_id, table_ids[name], name, fields, prefix=name[0])
+    return tables['Priorities'], tables['Tasks']
+
+
+# --- Record generation ------------------------------------------------------
+
+def record_id(schema, index):
+    """Stable 17-character record ID for a table row."""
+    return f'rec{schema.prefix}{index:013d}'
+
+
+def record_index(rid):
+    """Table row of a record ID made by record_id()."""
+    return int(rid[-13:])
+
+
+def timestamp():
+    """The current UTC time as Airtable formats it."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+class RecordGenerator:
+    """Builds deterministic synthetic records for a set of related tables."""
+
+    def __init__(self, tables, seed=0):
+        self.tables = {table.name: table for table in tables}
+        self.seed = seed
+
+    def day(self, schema, index):
+        """Dates grow with the index, so natural order is Date order."""
+        offset = index * DATE_SPAN_DAYS // max(schema.count, 1)
+        return START_DATE + timedelta(days=offset)
+
+    def record(self, schema, index):
+        """Generate record index of a table, omitting blank fields like Airtable."""
+        rng = random.Random(f'{self.seed}:{schema.name}:{index}')
+        fields = {}
+        for field in schema.fields:
+            value = self.value(schema, field, index, rng)
+            if value not in (None, '', []) and value is not False:
+                fields[field.name] = value
+        return {
+            'id': record_id(schema, index),
+            'createdTime': f'{self.day(schema, index).isoformat()}T00:00:00.000Z',
+            'fields': fields,
+        }
+
+    def text(self, rng, low, high):
+        """Random words, between low and high of them."""
+        return ' '.join(rng.choices(WORDS, k=rng.randint(low, high)))
+
+    def value(self, schema, field, index, rng):
+        """Generate one field value from its schema type."""
+        kind = field.type
+        name = field.name
+        if field.options and kind in ('singleselect', 'single select'):
+            return rng.choice(field.options)
+        if name == 'Rank':
+            return index + 1
+        if name == 'Timestamp':
+            return f'{self.day(schema, index).isoformat()}T{rng.randint(0, 23):02d}:00:00.000Z'
+        if kind == 'date':
+            # Optional dates (e.g. Due Date) are set on half the records
+            if name in ('Date', 'Created') or rng.random() < 0.5:
+                return self.day(schema, index).isoformat()
+            return None
+        if kind == 'checkbox':
+            return rng.random() < 0.1
+        if kind in ('singlelinetext', 'single line text'):
+            return self.text(rng, 3, 10)
+        if kind in ('multilinetext', 'long text'):
+            return self.text(rng, 20, 200) if rng.random() < 0.8 else None
+        if kind in ('aitext', 'ai text'):
+            options = AI_OUTPUTS.get(name)
+            value = rng.choice(options) if options else self.text(rng, 3, 30)
+            return {'state': 'generated', 'value': value, 'isStale': False}
+        if kind in ('number', 'count', 'rollup'):
+            return rng.randint(0, TASKS_PER_PRIORITY)
+        if kind == 'formula':
+            if field.result == 'text' or name.startswith('Is '):
+                return rng.choice(['Yes', 'No'])
+            return rng.randint(-30, 400)
+        if kind.startswith('link to '):
+            return self.links(schema, kind[len('link to '):], index)
+        if kind == 'lookup':
+            return self.lookup(schema, field, index)
+        return None
+
+    def links(self, schema, target_name, index):
+        """Task i links to priority i % P; a priority links to its tasks."""
+        target = self.tables.get(target_name.capitalize())
+        if target is None or not target.count:
+            return []
+        if target_name == 'priorities':
+            return [record_id(target, index % target.count)]
+        return [record_id(target, i) for i in range(index, target.count, schema.count)][:TASKS_PER_PRIORITY]
+
+    def lookup(self, schema, field, index):
+        """Look up a field of the linked priority, as Airtable returns it (a list)."""
+        priorities = self.tables.get('Priorities')
+        if priorities is None or not priorities.count or not field.source:
+            return []
+        parent = self.record(priorities, index % priorities.count)
+        value = parent['fields'].get(field.source)
+        return [] if value is None else [value]
+
+
+# --- Formulas ---------------------------------------------------------------
+
+class FormulaError(ValueError):
+    """A filterByFormula the fake cannot parse; answered with a 422."""
+
+
+def as_datetime(value):
+    """Parse an ISO date or date-time as Airtable returns them, in UTC."""
+    if value in (None, '') or isinstance(value, datetime):
+        return value or None
+    parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def compare_dates(before):
+    """IS_BEFORE or IS_AFTER; blank against anything is blank, which filters out."""
+    def compare(a, b):
+        a, b = as_datetime(a), as_datetime(b)
+        if a is None or b is None:
+            return False
+        return a < b if before else a > b
+    return compare
+
+
+def equals(a, b):
+    """Airtable's =: BLANK() equals any empty value."""
+    if a is None or b is None:
+        return not a and not b
+    return a == b
+
+
+FUNCTIONS = {
+    'AND': lambda *args: all(args),
+    'OR': lambda *args: any(args),
+    'NOT': lambda value: not value,
+    'BLANK': lambda: None,
+    'DATETIME_PARSE': as_datetime,
+    'IS_BEFORE': compare_dates(before=True),
+    'IS_AFTER': compare_dates(before=False),
+}
+COMPARISONS = {'=': equals, '!=': lambda a, b: not equals(a, b)}
+# Functions answered from the record itself rather than its fields
+RECORD_VALUES = {'RECORD_ID': 'id', 'LAST_MODIFIED_TIME': 'modified'}
+
+
+class FormulaParser:
+    """Compiles a filterByFormula into a function of {'id', 'fields', 'modified'}.
+
+    inputs collects the field names and record values the formula reads.
+    """
+
+    def __init__(self, formula):
+        self.formula = formula
+        self.tokens = []
+        self.inputs = set()
+        position, end = 0, len(formula.rstrip())
+        while position < end:
+            match = FORMULA_TOKEN.match(formula, position)
+            if not match:
+                raise FormulaError(f'Cannot parse formula at: {formula[position:]}')
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position][1] if self.position < len(self.tokens) else None
+
+    def take(self, expected=None):
+        if self.position == len(self.tokens):
+            raise FormulaError(f'Unexpected end of formula: {self.formula}')
+        kind, text = self.tokens[self.position]
+        if expected is not None and text != expected:
+            raise FormulaError(f'Expected {expected!r}, found {text!r} in: {self.formula}')
+        self.position += 1
+        return kind, text
+
+    def parse(self):
+        expression = self.expression()
+        if self.position != len(self.tokens):
+            raise FormulaError(f'Unexpected {self.peek()!r} in: {self.formula}')
+        return expression
+
+    def expression(self):
+        left = self.operand()
+        if self.peek() not in COMPARISONS:
+            return left
+        compare = COMPARISONS[self.take()[1]]
+        right = self.operand()
+        return lambda record: compare(left(record), right(record))
+
+    def operand(self):
+        kind, text = self.take()
+        if kind == 'field':
+            name = text[1:-1]
+            self.inputs.add(name)
+            return lambda record: record['fields'].get(name)
+        if kind == 'string':
+            value = text[1:-1]
+            return lambda record: value
+        if kind != 'call':
+            raise FormulaError(f'Unexpected {text!r} in: {self.formula}')
+        args = []
+        while self.peek() != ')':
+            if args:
+                self.take(',')
+            args.append(self.expression())
+        self.take(')')
+        if text in RECORD_VALUES:
+            key = RECORD_VALUES[text]
+            self.inputs.add(key)
+            return lambda record: record[key]
+        if text not in FUNCTIONS:
+            raise FormulaError(f'Unknown function {text}() in: {self.formula}')
+        function = FUNCTIONS[text]
+        return lambda record: function(*(arg(record) for arg in args))
+
+
+@lru_cache(maxsize=256)
+def compile_formula(formula):
+    """(predicate, inputs) for a filterByFormula; predicate is None when empty."""
+    if not formula.strip():
+        return None, frozenset()
+    parser = FormulaParser(formula)
+    expression = parser.parse()
+    return (lambda record: bool(expression(record))), frozenset(parser.inputs)
+
+
+# --- Server -----------------------------------------------------------------
+
+class RateLimiter:
+    """Sliding one-second window of requests per base."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.windows = {}
+        self.lock = threading.Lock()
+
+    def allow(self, base_id):
+        """Admit one request for base_id, or return False when over the limit."""
+        if not self.rate:
+            return True
+        now = time.monotonic()
+        with self.lock:
+            window = self.windows.setdefault(base_id, deque())
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) >= self.rate:
+                return False
+            window.append(now)
+            return True
+
+
+class FakeAirtable:
+    """Serves list-records requests for a set of generated tables."""
+
+    def __init__(self, tables, rate=RATE_LIMIT, latency=0.0, jitter=0.0, error_rate=0.0, seed=0):
+        self.tables = {}
+        for table in tables:
+            self.tables[(table.base_id, table.table_id)] = table
+            self.tables[(table.base_id, table.name)] = table
+        self.generator = RecordGenerator(tables, seed)
+        self.limiter = RateLimiter(rate)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.stats = {'requests': 0, 'rate_limited': 0, 'injected_429': 0,
+                      'records': 0, 'bytes_sent': 0}
+        # (table ID, params) of every list-records request served
+        self.requests = []
+        # Rows changed by update()/create()/delete(), by table ID and index:
+        # (record, last modified time), or None once deleted
+        self.changes = {table.table_id: {} for table in tables}
+        self.selections = {}
+        self.version = 0
+        # Offsets carry the epoch they were issued in; expire_offsets() moves it on
+        self.epoch = 0
+        self.lock = threading.Lock()
+        self.httpd = None
+
+    @classmethod
+    def from_schemas(cls, records, **options):
+        """Entries, Priorities and Tasks tables sized for a benchmark of N records.
+
+        Entries and Tasks get N records each; Priorities get one per
+        TASKS_PER_PRIORITY tasks.
+        """
+        entries = parse_entries_schema()
+        priorities, tasks = parse_dincharya_schema()
+        entries.count = records
+        tasks.count = records
+        priorities.count = max(1, records // TASKS_PER_PRIORITY)
+        return cls([entries, priorities, tasks], **options)
+
+    def count(self, key, value=1):
+        """Add to one of the served-request counters."""
+        with self.lock:
+            self.stats[key] += value
+
+    def record(self, schema, index):
+        """(record, last modified time) of a table row as served, or None if deleted."""
+        changes = self.changes[schema.table_id]
+        if index in changes:
+            current = changes[index]
+        else:
+            record = self.generator.record(schema, index)
+            current = record, record['createdTime']
+        return self.looked_up(schema, current)
+
+    def looked_up(self, schema, current):
+        """A task with its Priority lookups re-read from changed priorities.
+
+        Like Airtable, a lookup changing leaves the task's modified time alone.
+        """
+        priorities = self.generator.tables.get('Priorities')
+        if current is None or schema.name != 'Tasks' or not self.changes[priorities.table_id]:
+            return current
+        record, modified = current
+        fields = dict(record['fields'])
+        parents = [self.record(priorities, record_index(rid))
+                   for rid in fields.get('Priority Link', [])]
+        for field in schema.fields:
+            if field.type != 'lookup' or not field.source:
+                continue
+            values = [parent[0]['fields'][field.source] for parent in parents
+                      if parent is not None and field.source in parent[0]['fields']]
+            if values:
+                fields[field.name] = values
+            else:
+                fields.pop(field.name, None)
+        return {**record, 'fields': fields}, modified
+
+    def store(self, schema, index, record):
+        """Replace (or with None, delete) a row, stamping its modified time."""
+        with self.lock:
+            self.changes[schema.table_id][index] = record and (record, timestamp())
+            self.version += 1
+            self.selections.clear()
+
+    def update(self, table_name, rid, fields):
+        """Change some fields of a record; a None value blanks the field."""
+        schema = self.generator.tables[table_name]
+        index = record_index(rid)
+        current = self.record(schema, index)
+        if current is None:
+            raise KeyError(rid)
+        merged = {**current[0]['fields'], **fields}
+        self.store(schema, index, {**current[0], 'fields': {
+            name: value for name, value in merged.items() if value not in (None, '', [])}})
+
+    def create(self, table_name, fields):
+        """Add a record after the generated ones and return its ID."""
+        schema = self.generator.tables[table_name]
+        index = max([schema.count - 1, *self.changes[schema.table_id]]) + 1
+        rid = record_id(schema, index)
+        self.store(schema, index, {'id': rid, 'createdTime': timestamp(), 'fields': {
+            name: value for name, value in fields.items() if value not in (None, '', [])}})
+        return rid
+
+    def delete(self, table_name, rid):
+        """Delete a record."""
+        self.store(self.generator.tables[table_name], record_index(rid), None)
+
+    def expire_offsets(self):
+        """Make every offset issued so far invalid, as Airtable's expire."""
+        with self.lock:
+            self.epoch += 1
+
+    def list_records(self, base_id, table_name, params):
+        """Return (status, body) for one list-records request."""
+        self.count('requests')
+        if not self.limiter.allow(base_id):
+            self.count('rate_limited')
+            return 429, rate_limit_error()
+        with self.lock:
+            inject = self.error_rate and self.rng.random() < self.error_rate
+            delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        if inject:
+            self.count('injected_429')
+            return 429, rate_limit_error()
+
+        schema = self.tables.get((base_id, table_name))
+        if schema is None:
+            return 404, {'error': {'type': 'TABLE_NOT_FOUND',
+                                   'message': f'Could not find table {table_name}'}}
+
+        with self.lock:
+            self.requests.append((schema.table_id, params))
+
+        offset = params.get('offset') or f'itr{self.epoch}.0'
+        match = re.fullmatch(r'itr(\d+)\.(\d+)', offset)
+        if not match or int(match.group(1)) != self.epoch:
+            return 422, {'error': {'type': 'LIST_RECORDS_ITERATOR_NOT_AVAILABLE'}}
+        try:
+            selected = self.select(schema, params)
+        except FormulaError as e:
+            return 422, {'error': {'type': 'INVALID_FILTER_BY_FORMULA', 'message': str(e)}}
+        total = len(selected)
+        if params.get('maxRecords'):
+            total = min(total, int(params['maxRecords']))
+        start = int(match.group(2))
+        page_size = min(int(params.get('pageSize') or MAX_PAGE_SIZE), MAX_PAGE_SIZE)
+        end = min(start + page_size, total)
+
+        fields = params.get('fields')
+        records = []
+        for index in selected[start:end]:
+            current = self.record(schema, index)
+            if current is None:
+                continue
+            record = current[0]
+            if fields:
+                record = {**record, 'fields': {k: v for k, v in record['fields'].items()
+                                               if k in fields}}
+            records.append(record)
+        self.count('records', len(records))
+
+        body = {'records': records}
+        if end < total:
+            body['offset'] = f'itr{self.epoch}.{end}'
+        return 200, body
+
+    def select(self, schema, params):
+        """Indices of the records matching the request's formula, in its sort order."""
+        formula = params.get('filterByFormula') or ''
+        sort = sort_field(params)
+        with self.lock:
+            key = (schema.table_id, formula, sort, descending(params), self.version)
+            selected = self.selections.get(key)
+        if selected is None:
+            selected = self.evaluate(schema, formula, sort)
+            if descending(params):
+                selected = selected[::-1]
+            with self.lock:
+                self.selections[key] = selected
+        return selected
+
+    def evaluate(self, schema, formula, sort):
+        """Indices of the records a formula matches, ascending on sort."""
+        predicate, inputs = compile_formula(formula)
+        changes = self.changes[schema.table_id]
+        if not changes and predicate is None:
+            return range(schema.count)
+        if not changes and schema.name == 'Entries' and inputs <= {'Date'}:
+            return self.date_runs(schema, predicate)
+
+        selected = []
+        added = sorted(index for index in changes if index >= schema.count)
+        for index in chain(range(schema.count), added):
+            current = self.record(schema, index)
+            if current is None:
+                continue
+            record, modified = current
+            if predicate is None or predicate(
+                    {'id': record['id'], 'fields': record['fields'], 'modified': modified}):
+                selected.append((index, record['fields'].get(sort) if sort else None))
+        if sort:
+            selected.sort(key=lambda item: (item[1] not in (None, '', []), item[1] or ''))
+        return [index for index, _ in selected]
+
+    def date_runs(self, schema, predicate):
+        """Generated Entries matching a Date-only formula, tested once per day."""
+        day = lambda index: self.generator.day(schema, index)
+        runs, start = [], 0
+        while start < schema.count:
+            current = day(start)
+            end = bisect_right(range(schema.count), current, lo=start, key=day)
+            if predicate({'id': None, 'fields': {'Date': current.isoformat()}, 'modified': None}):
+                if runs and runs[-1].stop == start:
+                    runs[-1] = range(runs[-1].start, end)
+                else:
+                    runs.append(range(start, end))
+            start = end
+        return runs[0] if len(runs) == 1 else list(chain.from_iterable(runs))
+
+    def serve(self, host='127.0.0.1', port=0):
+        """Start serving on a background thread and return self."""
+        fake = self
+
+        class Handler(RequestHandler):
+            server_fake = fake
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    @property
+    def url(self):
+        """Endpoint URL to pass as AIRTABLE_ENDPOINT_URL."""
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def shutdown(self):
+        """Stop the server."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def descending(params):
+    """True when the first sort of a GET or POST request is descending."""
+    sort = params.get('sort')
+    if isinstance(sort, list) and sort:
+        return sort[0].get('direction') == 'desc'
+    return params.get('sort[0][direction]') == 'desc'
+
+
+def sort_field(params):
+    """Field of the first sort of a GET or POST request, or None."""
+    sort = params.get('sort')
+    if isinstance(sort, list):
+        return sort[0].get('field') if sort else None
+    return params.get('sort[0][field]')
+
+
+def rate_limit_error():
+    """Body Airtable sends with a 429."""
+    return {'errors': [{'error': 'RATE_LIMIT_REACHED',
+                        'message': 'Rate limit exceeded. Please try again later'}]}
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """Routes list-records GET and POST requests to a FakeAirtable."""
+
+    server_fake = None
+    protocol_version = 'HTTP/1.1'
+    PATH = re.compile(r'^/v0/([^/]+)/([^/]+?)(/listRecords)?/?$')
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        match = self.PATH.match(parts.path)
+        if not match or match.group(3):
+            return self.reply(404, {'error': 'NOT_FOUND'})
+        query = parse_qs(parts.query)
+        params = {key: values[0] for key, values in query.items()}
+        params['fields'] = query.get('fields[]') or query.get('fields')
+        self.list_records(match, params)
+
+    def do_POST(self):
+        match = self.PATH.match(urlsplit(self.path).path)
+        if not match or not match.group(3):
+            return self.reply(404, {'error': 'NOT_FOUND'})
+        length = int(self.headers.get('Content-Length') or 0)
+        params = json.loads(self.rfile.read(length) or b'{}')
+        self.list_records(match, params)
+
+    def list_records(self, match, params):
+        status, body = self.server_fake.list_records(match.group(1), match.group(2), params)
+        self.reply(status, body)
+
+    def reply(self, status, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.server_fake.count('bytes_sent', len(payload))
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def sync_env(server):
+    """Environment variables that point both sync scripts at the fake server."""
+    tables = server.generator.tables
+    entries, priorities, tasks = tables['Entries'], tables['Priorities'], tables['Tasks']
+    return {
+        'AIRTABLE_ENDPOINT_URL': server.url,
+        'AIRTABLE_API_KEY': 'patFakeAirtableKey',
+        'AIRTABLE_BASE_ID': entries.base_id,
+        'AIRTABLE_TABLE_ID': entries.table_id,
+        'DINCHARYA_BASE_ID': priorities.base_id,
+        'DINCHARYA_PRIORITIES_TABLE_ID': priorities.table_id,
+        'DINCHARYA_TASKS_TABLE_ID': tasks.table_id,
+    }
+
+
+def main():
+    """Run the fake server in the foreground."""
+    parser = argparse.ArgumentParser(description='Serve synthetic Airtable records locally.')
+    parser.add_argument('--records', type=int, default=10_000)
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--rate', type=float, default=RATE_LIMIT,
+                        help='requests per second per base (0 = unlimited)')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to each response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random extra latency, seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered 429')
+    args = parser.parse_args()
+
+    server = FakeAirtable.from_schemas(
+        args.records, rate=args.rate, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate).serve(port=args.port)
+    print(f'Fake Airtable on {server.url} ({args.records:,} records per table)')
+    for key, value in sync_env(server).items():
+        print(f'  {key}={value}')
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
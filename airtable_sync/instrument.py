@@ -0,0 +1,189 @@
+"""
+Sync Instrumentation
+====================
+Monotonic per-phase timers, page latency histograms and throughput for a
+sync run, emitted as a JSON metrics record and optionally as a Prometheus
+textfile (for node_exporter's textfile collector).
+
+Phases are named by the sync scripts (fetch, transform, write, ...). The
+client adds network time, JSON decode time, bytes received and per-request
+latency (one request per page) through ClientMetrics.
+
+Usage:
+    run = SyncMetrics('entries', client=client_metrics)
+    with run.phase('transform'):
+        rows = [process_record(rec) for rec in page]
+    run.add_records(len(rows))
+    run.finish()
+    run.write_json('entries_metrics.json')
+    run.write_prometheus('entries.prom')
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import json
+import os
+import threading
+import time
+
+# Upper bounds (seconds) of the page latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_PREFIX = 'airtable_sync'
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Record one observation (not thread-safe; callers hold a lock)."""
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """Return (upper bound, cumulative count) pairs, ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def as_dict(self):
+        """Return the histogram as a plain dict."""
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 3),
+            'buckets': {('+Inf' if bound == float('inf') else str(bound)): count
+                        for bound, count in self.cumulative()},
+        }
+
+
+class SyncMetrics:
+    """Timings and counters for one sync run (e.g. one table)."""
+
+    def __init__(self, name, client=None):
+        self.name = name
+        self.client = client
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.monotonic()
+        self.duration = None
+        self.phases = {}
+        self.records = 0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block and add it to the named phase."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.monotonic() - start)
+
+    def add_time(self, name, seconds):
+        """Add seconds to a phase (safe to call from several threads)."""
+        with self.lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_records(self, count):
+        """Count records processed by the run."""
+        with self.lock:
+            self.records += count
+
+    def finish(self):
+        """Stop the wall-clock timer."""
+        self.duration = time.monotonic() - self.started
+
+    def elapsed(self):
+        """Seconds since the run started, or its total once finished."""
+        return self.duration if self.duration is not None else time.monotonic() - self.started
+
+    def records_per_sec(self):
+        """Throughput over the whole run."""
+        elapsed = self.elapsed()
+        return self.records / elapsed if elapsed else 0.0
+
+    def as_dict(self):
+        """Return the metrics record."""
+        record = {
+            'sync': self.name,
+            'started': self.started_at.isoformat(),
+            'duration': round(self.elapsed(), 3),
+            'records': self.records,
+            'records_per_sec': round(self.records_per_sec(), 1),
+            'phases': {name: round(seconds, 3) for name, seconds in self.phases.items()},
+        }
+        if self.client is not None:
+            record['client'] = self.client.as_dict()
+        return record
+
+    def summary(self):
+        """One-line phase breakdown for console output."""
+        phases = ', '.join(f'{name} {seconds:.2f}s' for name, seconds in self.phases.items())
+        return f'{self.records_per_sec():.0f} records/s ({phases})'
+
+    def write_json(self, path):
+        """Write the metrics record as JSON, atomically."""
+        write_atomic(path, json.dumps(self.as_dict(), indent=2) + '\n')
+
+    def write_prometheus(self, path):
+        """Write the metrics in Prometheus textfile format, atomically."""
+        write_atomic(path, prometheus_text(self))
+
+
+def prometheus_text(run):
+    """Render a SyncMetrics run in the Prometheus exposition format."""
+    p = PROMETHEUS_PREFIX
+    label = f'sync="{run.name}"'
+    lines = [
+        f'# TYPE {p}_duration_seconds gauge',
+        f'{p}_duration_seconds{{{label}}} {run.elapsed():.6f}',
+        f'# TYPE {p}_records gauge',
+        f'{p}_records{{{label}}} {run.records}',
+        f'# TYPE {p}_records_per_second gauge',
+        f'{p}_records_per_second{{{label}}} {run.records_per_sec():.3f}',
+        f'# TYPE {p}_last_run_timestamp_seconds gauge',
+        f'{p}_last_run_timestamp_seconds{{{label}}} {run.started_at.timestamp():.0f}',
+        f'# TYPE {p}_phase_seconds gauge',
+    ]
+    for name, seconds in run.phases.items():
+        lines.append(f'{p}_phase_seconds{{{label},phase="{name}"}} {seconds:.6f}')
+
+    client = run.client
+    if client is not None:
+        counters = client.as_dict()
+        for key in ('requests', 'retries', 'bytes_received'):
+            lines.append(f'# TYPE {p}_{key} gauge')
+            lines.append(f'{p}_{key}{{{label}}} {counters[key]}')
+        for key in ('throttle_time', 'backoff_time', 'network_time', 'decode_time'):
+            lines.append(f'# TYPE {p}_{key}_seconds gauge')
+            lines.append(f'{p}_{key}_seconds{{{label}}} {counters[key]}')
+
+        lines.append(f'# TYPE {p}_page_latency_seconds histogram')
+        for bound, count in client.latency.cumulative():
+            le = '+Inf' if bound == float('inf') else bound
+            lines.append(f'{p}_page_latency_seconds_bucket{{{label},le="{le}"}} {count}')
+        lines.append(f'{p}_page_latency_seconds_sum{{{label}}} {client.latency.sum:.6f}')
+        lines.append(f'{p}_page_latency_seconds_count{{{label}}} {client.latency.count}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_atomic(path, text):
+    """Write text to path via a temporary file, so scrapers never read a partial file."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
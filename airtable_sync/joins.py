@@ -0,0 +1,128 @@
+"""
+Local Joins
+===========
+Resolves Airtable lookup fields locally instead of asking Airtable for them.
+
+A lookup column ('Priority Horizon' on a task) repeats a field of the
+linked record ('Horizon' on its priority). Airtable computes lookups on
+every row and sends them in every page; when the linked table is synced
+anyway, the sync can fetch only the link IDs and fill the lookup columns
+with a hash join against the rows it already has. The result matches what
+extract_field produces for the Airtable lookup: the linked values that are
+not empty, joined with ', '.
+
+IndexedTable keeps a synced table in memory keyed by Record ID, with hash
+indexes built on first use, so other tools can query the joined data
+without re-reading CSVs.
+
+Usage:
+    priorities = IndexedTable(PRIORITY_ROW.columns, priority_rows)
+    task_rows = resolve_lookups(task_rows, TASK_ROW, TASKS.lookups, priorities)
+
+    tasks = IndexedTable.from_csv('DinCharya/tasks.csv')
+    active = tasks.where('Priority Status', 'Active')
+"""
+
+import csv
+
+from airtable_sync.mapping import RECORD_ID
+
+# Separator extract_field uses when joining linked IDs and lookup values
+LIST_SEPARATOR = ', '
+
+
+class Lookup:
+    """A lookup column filled from a field of the record its link points to."""
+
+    __slots__ = ('name', 'link', 'table', 'field')
+
+    def __init__(self, name, link, table, field):
+        self.name = name
+        self.link = link
+        self.table = table
+        self.field = field
+
+
+class IndexedTable:
+    """Rows of one table keyed by Record ID, with lazily built column indexes."""
+
+    def __init__(self, columns, rows, key=RECORD_ID):
+        self.columns = tuple(columns)
+        self.positions = {name: i for i, name in enumerate(self.columns)}
+        self.rows = list(rows)
+        key_index = self.positions[key]
+        self.by_id = {row[key_index]: row for row in self.rows}
+        self.indexes = {}
+
+    @classmethod
+    def from_csv(cls, path, key=RECORD_ID):
+        """Load a synced CSV."""
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            columns = next(reader)
+            return cls(columns, reader, key)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, record_id):
+        """Row for a record ID, or None."""
+        return self.by_id.get(record_id)
+
+    def value(self, row, column):
+        """One column of a row."""
+        return row[self.positions[column]]
+
+    def index(self, column):
+        """Hash index of column value -> rows, built on first use."""
+        index = self.indexes.get(column)
+        if index is None:
+            position = self.positions[column]
+            index = {}
+            for row in self.rows:
+                index.setdefault(row[position], []).append(row)
+            self.indexes[column] = index
+        return index
+
+    def where(self, column, value):
+        """Rows whose column equals value."""
+        return self.index(column).get(value, [])
+
+    def linked(self, row, link):
+        """Record IDs in a link column (stored joined, as extract_field writes them)."""
+        ids = row[self.positions[link]]
+        return ids.split(LIST_SEPARATOR) if ids else []
+
+    def as_dicts(self):
+        """Rows as column-keyed dicts."""
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+
+def resolve_lookups(rows, builder, lookups, targets):
+    """Return rows with each lookup column filled from its linked records.
+
+    targets maps each lookup's table name to an IndexedTable of that table.
+    Rows whose linked record is missing get an empty value, as Airtable
+    returns no lookup value for a dangling link.
+    """
+    link_positions = {}
+    plan = []
+    for lookup in lookups:
+        target = targets[lookup.table]
+        link = link_positions.setdefault(lookup.link, builder.index(lookup.link))
+        plan.append((builder.index(lookup.name), link, target.by_id, target.positions[lookup.field]))
+
+    resolved = []
+    for row in rows:
+        row = list(row)
+        for position, link, by_id, field in plan:
+            ids = row[link]
+            values = []
+            if ids:
+                for record_id in ids.split(LIST_SEPARATOR):
+                    linked = by_id.get(record_id)
+                    if linked is not None and linked[field] not in ('', None):
+                        values.append(str(linked[field]))
+            row[position] = LIST_SEPARATOR.join(values)
+        resolved.append(tuple(row))
+    return resolved
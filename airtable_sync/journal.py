@@ -0,0 +1,173 @@
+"""
+Sync Journal
+============
+Checkpoints a paginated fetch so an interrupted sync resumes from its last
+committed page instead of page 1.
+
+Each page of rows is appended to <name>.journal.csv and fsynced, then the
+Airtable offset of the next page and the journal's committed size are
+written atomically to <name>.journal.json. On the next run the rows file is
+truncated back to the committed size, its rows are replayed, and fetching
+continues from the stored offset. The journal is deleted once the output
+has been finalized.
+
+Airtable offsets expire after a few minutes. When a stored offset is
+rejected (422), the journal is discarded and the fetch starts over.
+
+Usage:
+    journal = SyncJournal('entries_data', key={'fields': FIELDS, 'sort': ['Date']})
+    for rows in resumable_pages(table, journal, ROW.build, sort=['Date']):
+        ...
+    journal.finish()
+"""
+
+import csv
+from datetime import datetime, timezone
+import json
+import os
+
+from requests import HTTPError
+
+# Airtable answers an expired or unknown offset with 422
+ITERATOR_EXPIRED = 422
+
+
+def iterate_pages(table, offset=None, **options):
+    """Yield (records, next offset) for each page of a list-records request."""
+    if offset:
+        options['offset'] = offset
+    for response in table.api.iterate_requests(
+        method='get',
+        url=table.urls.records,
+        fallback=('post', table.urls.records_post),
+        options=options,
+    ):
+        yield response.get('records', []), response.get('offset')
+
+
+class SyncJournal:
+    """Rows file plus offset state for one table's fetch."""
+
+    def __init__(self, name, key):
+        self.rows_path = name + '.journal.csv'
+        self.state_path = name + '.journal.json'
+        self.key = key
+        self.state = None
+
+    @property
+    def created(self):
+        """When the journaled fetch first started (UTC), or None."""
+        if not self.state:
+            return None
+        return datetime.fromisoformat(self.state['created'])
+
+    def load(self):
+        """Return the committed state of a matching journal, or None.
+
+        A journal written for different request options (key) is discarded.
+        """
+        if not (os.path.exists(self.state_path) and os.path.exists(self.rows_path)):
+            self.reset()
+            return None
+        with open(self.state_path, encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('key') != self.key:
+            self.reset()
+            return None
+        # Drop rows appended after the last committed page
+        with open(self.rows_path, 'r+b') as f:
+            f.truncate(state['size'])
+        self.state = state
+        return state
+
+    def replay(self, page_size):
+        """Yield committed rows in pages of at most page_size."""
+        with open(self.rows_path, newline='', encoding='utf-8') as f:
+            page = []
+            for row in csv.reader(f):
+                page.append(row)
+                if len(page) == page_size:
+                    yield page
+                    page = []
+            if page:
+                yield page
+
+    def commit(self, rows, offset):
+        """Durably append one page of rows, then record the next offset."""
+        with open(self.rows_path, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        if self.state:
+            previous, created = self.state['rows'], self.state['created']
+        else:
+            previous, created = 0, datetime.now(timezone.utc).isoformat()
+        self.state = {'key': self.key, 'offset': offset, 'rows': previous + len(rows),
+                      'size': size, 'complete': offset is None, 'created': created}
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def reset(self):
+        """Start an empty journal."""
+        self.state = None
+        for path in (self.rows_path, self.state_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def finish(self):
+        """Delete the journal once the output is finalized."""
+        self.reset()
+
+
+def resumable_pages(table, journal, transform, page_size=100, run=None, **options):
+    """Yield pages of transformed rows, resuming from the journal when possible.
+
+    Replayed rows come back from the journal as lists of strings, exactly as
+    they would be read from the finished CSV.
+    """
+    state = journal.load()
+    offset = None
+    if state:
+        if state['complete']:
+            yield from journal.replay(page_size)
+            return
+        offset = state['offset']
+
+    pages = iterate_pages(table, offset, page_size=page_size, **options)
+    first = None
+    if state:
+        # Check the stored offset is still valid before replaying anything
+        try:
+            first = timed(run, 'fetch', next, pages, None)
+        except HTTPError as e:
+            if e.response is None or e.response.status_code != ITERATOR_EXPIRED:
+                raise
+            journal.reset()
+            state = None
+            pages = iterate_pages(table, page_size=page_size, **options)
+        else:
+            print(f'  Resuming after {state["rows"]} journaled records')
+            yield from journal.replay(page_size)
+
+    while True:
+        page = first if first is not None else timed(run, 'fetch', next, pages, None)
+        first = None
+        if page is None:
+            return
+        records, offset = page
+        rows = timed(run, 'transform', lambda: [transform(rec) for rec in records])
+        journal.commit(rows, offset)
+        yield rows
+        if offset is None:
+            return
+
+
+def timed(run, phase, fn, *args):
+    """Call fn, adding its time to a SyncMetrics phase when run is given."""
+    if run is None:
+        return fn(*args)
+    with run.phase(phase):
+        return fn(*args)
@@ -0,0 +1,190 @@
+"""
+Content Manifest
+================
+Per-record content hashes stored in a sidecar JSON file next to each CSV,
+so a sync only replaces its output when something actually changed.
+
+Rows are hashed as they are written to a temporary file. When the header,
+every record hash and the record order match the previous manifest, the
+temporary file is discarded and the existing CSV (and its mtime) is left
+untouched; otherwise it atomically replaces the CSV.
+
+Locally derived columns (airtable_sync.derived) are left out of the hashes,
+so a record only counts as changed when its fetched content changes. The
+manifest instead stores the date the derived columns were computed for,
+and the CSV is rewritten when that date moves on.
+
+CSVOutput wraps both for the sync scripts and the runner: it writes a row
+builder's CSV through the temporary file, fixes the date derived columns
+are computed for, and commits through the manifest.
+
+Usage:
+    with CSVOutput('entries_data.csv', ROW, derive) as output:
+        for page in pages:
+            output.write(output.derive(page))
+        replaced = output.commit()
+    print(output.manifest.summary())
+"""
+
+import csv
+from datetime import datetime, timezone
+from hashlib import blake2b
+import json
+from operator import itemgetter
+import os
+
+from airtable_sync.mapping import RECORD_ID
+
+# Separates values inside a row hash (ASCII unit separator)
+SEPARATOR = '\x1f'
+
+
+def manifest_path(path):
+    """Sidecar manifest path of a CSV (entries_data.csv -> entries_data.manifest.json)."""
+    return os.path.splitext(path)[0] + '.manifest.json'
+
+
+def row_hash(row):
+    """Hash a row tuple as it is written to CSV (None as blank, str() otherwise)."""
+    text = SEPARATOR.join('' if value is None else str(value) for value in row)
+    return blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ContentManifest:
+    """Tracks record hashes for one CSV and decides whether to replace it."""
+
+    def __init__(self, path, columns, key_index, derived=(), as_of=None):
+        self.path = path
+        self.columns = list(columns)
+        self.key_index = key_index
+        # Positions of derived columns, excluded from hashes
+        self.derived = sorted(derived)
+        self.as_of = as_of
+        hashed = [i for i in range(len(self.columns)) if i not in self.derived]
+        self.hashed = itemgetter(*hashed) if self.derived else None
+        self.hashes = {}
+        self.previous = {}
+        self.previous_columns = None
+        self.previous_derived = []
+        self.previous_as_of = None
+        self.replaced = False
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.previous = data['rows']
+            self.previous_columns = data['columns']
+            self.previous_derived = data.get('derived', [])
+            self.previous_as_of = data.get('as_of')
+
+    def add(self, rows):
+        """Record the hash of each row written to the output."""
+        hashed = self.hashed
+        for row in rows:
+            self.hashes[row[self.key_index]] = row_hash(hashed(row) if hashed else row)
+
+    def diff(self):
+        """Return added, changed and removed record counts against the last run."""
+        previous = self.previous
+        added = changed = 0
+        for rid, digest in self.hashes.items():
+            old = previous.get(rid)
+            if old is None:
+                added += 1
+            elif old != digest:
+                changed += 1
+        removed = sum(1 for rid in previous if rid not in self.hashes)
+        return {'added': added, 'changed': changed, 'removed': removed}
+
+    def changed(self):
+        """True when the new output differs from the last run in content or order."""
+        return (self.columns != self.previous_columns
+                or self.derived != self.previous_derived
+                or self.as_of != self.previous_as_of
+                or list(self.hashes.items()) != list(self.previous.items()))
+
+    def commit(self, tmp_path, path):
+        """Move tmp_path over path if anything changed, else discard it.
+
+        Returns True when the output was replaced.
+        """
+        if os.path.exists(path) and not self.changed():
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+            self.save()
+            self.replaced = True
+        return self.replaced
+
+    def save(self):
+        """Write the manifest atomically."""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            data = {'columns': self.columns, 'rows': self.hashes}
+            if self.derived:
+                data.update(derived=self.derived, as_of=self.as_of)
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def summary(self):
+        """One-line change summary."""
+        counts = self.diff()
+        return f'{counts["added"]} added, {counts["changed"]} changed, {counts["removed"]} removed'
+
+
+class CSVOutput:
+    """A row builder's CSV, written to a temporary file and committed via its manifest.
+
+    With derive (a DerivedFields), formula columns are computed for today's
+    UTC date, fixed when the output is created, and left out of the record
+    hashes; the manifest stores that date, so the CSV is rewritten once a
+    day for them.
+    """
+
+    def __init__(self, path, builder, derive=None):
+        self.path = path
+        self.tmp_path = path + '.tmp'
+        self.derive_fields = derive
+        if derive is not None:
+            self.today = datetime.now(timezone.utc).date()
+            self.manifest = ContentManifest(manifest_path(path), builder.columns,
+                                            builder.index(RECORD_ID), derive.positions,
+                                            self.today.isoformat())
+        else:
+            self.today = None
+            self.manifest = ContentManifest(manifest_path(path), builder.columns,
+                                            builder.index(RECORD_ID))
+        self.file = open(self.tmp_path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(builder.columns)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # A failed sync leaves the CSV untouched and its temporary file removed
+        self.file.close()
+        if exc_type is not None:
+            try:
+                os.remove(self.tmp_path)
+            except FileNotFoundError:
+                pass
+
+    def derive(self, rows):
+        """Return rows with the derived columns computed for the output's date."""
+        if self.derive_fields is None:
+            return rows
+        return self.derive_fields.apply(rows, self.today)
+
+    def write(self, rows):
+        """Append rows to the temporary file and record their hashes."""
+        self.writer.writerows(rows)
+        self.file.flush()
+        self.manifest.add(rows)
+
+    def commit(self):
+        """Close the temporary file and replace the CSV if anything changed.
+
+        Returns True when the CSV was replaced.
+        """
+        self.file.close()
+        return self.manifest.commit(self.tmp_path, self.path)
@@ -0,0 +1,183 @@
+"""
+Multi-Table Sync Runner
+=======================
+Syncs every table in airtable_sync.config from one process: Pratyaksha
+entries, Din Charya priorities and tasks, and any table added there later.
+
+All tables share one client, so they share its keep-alive connection pool
+and the per-base token buckets that keep each base under Airtable's rate
+limit. Every table gets its own worker, so tables in different bases fetch
+in parallel and tables in the same base interleave their requests; total
+wall time is bounded by the slowest table rather than the sum of all.
+
+Each table is fetched in full through its checkpoint journal and written
+exactly as the per-table sync scripts write it (CSV, content manifest and,
+with --sqlite, the SQLite mirror). Incremental and partitioned fetches of
+entries remain in Pratyaksha/sync_airtable.py.
+
+Usage:
+    python -m airtable_sync.runner
+    python -m airtable_sync.runner --tables priorities tasks
+    python -m airtable_sync.runner --sqlite --metrics runner_metrics.json
+    python -m airtable_sync.runner --local-formulas
+    python -m airtable_sync.runner --summary runner_summary.json
+
+Output:
+    - Each table's CSV, manifest and SQLite table (see airtable_sync.config)
+    - JSON / Prometheus textfile metrics (with --metrics / --prometheus);
+      phases are named <table>.<phase>
+    - Console summary with per-table and total wall time, and each table's
+      statistics (also as JSON with --summary)
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+import json
+import os
+
+from dotenv import load_dotenv
+
+from airtable_sync.client import ClientMetrics, connect
+from airtable_sync.config import ROOT, TABLES
+from airtable_sync.instrument import SyncMetrics, write_atomic
+from airtable_sync.journal import resumable_pages
+from airtable_sync.manifest import CSVOutput
+from airtable_sync.sqlite_mirror import DEFAULT_PATH, SQLiteMirror
+from airtable_sync.summary import write_json as write_summary_json
+
+# Rows per Airtable page, journal checkpoint and SQLite transaction
+PAGE_SIZE = 100
+
+
+def sync_table(api, config, sqlite_path=None, local_formulas=False):
+    """Fetch one table in full and write its outputs; return (SyncMetrics, manifest, summary)."""
+    run = SyncMetrics(config.name)
+    summary = config.summarize()
+    builder = config.row
+    table = api.table(config.base_id(), config.table_id())
+    journal = config.journal(local_formulas=local_formulas)
+
+    path = config.output_path()
+    derive = config.derive() if local_formulas else None
+    # SQLite connections stay on the thread that opened them
+    mirror = SQLiteMirror(sqlite_path, config.name, builder, config.indexes) if sqlite_path else None
+
+    with CSVOutput(path, builder, derive) as output:
+        pages = resumable_pages(table, journal, config.builder(local_formulas).build,
+                                PAGE_SIZE, run, **config.fetch_options(local_formulas=local_formulas))
+        for rows in pages:
+            if derive is not None:
+                with run.phase('derive'):
+                    rows = output.derive(rows)
+            run.add_records(len(rows))
+            with run.phase('write'):
+                output.write(rows)
+            with run.phase('summary'):
+                summary.add(rows)
+            if mirror is not None:
+                with run.phase('sinks'):
+                    mirror.write(rows)
+        with run.phase('write'):
+            output.commit()
+    manifest = output.manifest
+    if mirror is not None:
+        with run.phase('sinks'):
+            mirror.close()
+    journal.finish()
+    run.finish()
+    return run, manifest, summary
+
+
+def run_all(configs, sqlite_path=None, local_formulas=False):
+    """Sync tables concurrently on one client; return the overall run and per-table results."""
+    metrics = ClientMetrics()
+    api = connect(os.getenv('AIRTABLE_API_KEY'), metrics=metrics)
+    overall = SyncMetrics('runner', client=metrics)
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=len(configs)) as pool:
+        futures = {pool.submit(sync_table, api, config, sqlite_path, local_formulas): config
+                   for config in configs}
+        for future in as_completed(futures):
+            config = futures[future]
+            run, manifest, summary = future.result()
+            results[config.name] = (run, manifest, summary)
+            for phase, seconds in run.phases.items():
+                overall.add_time(f'{config.name}.{phase}', seconds)
+            overall.add_records(run.records)
+            status = 'Saved' if manifest.replaced else 'Unchanged'
+            print(f'  {config.name}: {run.records} records in {run.elapsed():.1f}s '
+                  f'({status}: {config.output_path()})')
+
+    overall.finish()
+    return overall, results
+
+
+def parse_args():
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description='Sync every configured Airtable table.')
+    parser.add_argument('--tables', nargs='+', choices=list(TABLES), default=list(TABLES),
+                        help='tables to sync (default: all)')
+    parser.add_argument('--sqlite', nargs='?', const=DEFAULT_PATH, metavar='PATH',
+                        help=f'also mirror every table into an indexed SQLite database '
+                             f'(default: {os.path.basename(DEFAULT_PATH)})')
+    parser.add_argument('--local-formulas', action='store_true',
+                        help='skip fetching formula columns and compute them locally')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='write a JSON metrics record for the run')
+    parser.add_argument('--prometheus', metavar='PATH',
+                        help='write run metrics in Prometheus textfile format')
+    parser.add_argument('--summary', metavar='PATH',
+                        help='write every table\'s summary statistics as JSON')
+    return parser.parse_args()
+
+
+def main():
+    """Sync the selected tables and print a summary."""
+    args = parse_args()
+    load_dotenv(os.path.join(ROOT, '.env'))
+    configs = [TABLES[name] for name in args.tables]
+
+    print('=' * 50)
+    print('AIRTABLE SYNC')
+    print('=' * 50)
+    print(f'Started: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+    print(f'Syncing {", ".join(config.name for config in configs)}...')
+
+    overall, results = run_all(configs, args.sqlite, args.local_formulas)
+
+    if args.metrics:
+        record = overall.as_dict()
+        record['tables'] = {name: run.as_dict() for name, (run, _, _) in results.items()}
+        write_atomic(args.metrics, json.dumps(record, indent=2) + '\n')
+    if args.prometheus:
+        overall.write_prometheus(args.prometheus)
+    if args.summary:
+        write_summary_json(args.summary, {name: summary for name, (_, _, summary) in results.items()})
+
+    print()
+    print('-' * 50)
+    print('SYNC COMPLETE')
+    print('-' * 50)
+    for config in configs:
+        run, manifest, _ = results[config.name]
+        print(f'  {config.name}: {run.records} records, {run.elapsed():.2f}s, '
+              f'changes {manifest.summary()}')
+    slowest = max(run.elapsed() for run, _, _ in results.values())
+    print(f'  Wall time: {overall.elapsed():.2f}s (slowest table {slowest:.2f}s)')
+    print(f'  API: {overall.client.summary()}')
+    if args.sqlite:
+        print(f'  Mirrored: {args.sqlite}')
+    print(f'  Time: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+    for config in configs:
+        summary = results[config.name][2]
+        if summary.records:
+            print()
+            print(f'  [{config.name}]')
+            print(summary.text())
+    print('=' * 50)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+"""
+Full-Text Search
+================
+Incremental SQLite FTS5 index over the free-text columns of a synced table
+(for entries: Text, Snapshot, Summary (AI) and Actionable Insights (AI)),
+plus a query CLI that returns BM25-ranked records with highlighted
+snippets.
+
+The index lives next to the SQLite mirror (airtable.db by default) in two
+tables: <table>_search (FTS5, one document per record) and
+<table>_search_docs (Record ID, content hash and display columns). The
+sync hands it every page like any other sink; a record is re-indexed only
+when the hash of its indexed and display columns changed, and records
+absent from the run are removed when the index is closed.
+
+Usage:
+    python -m airtable_sync.search "sleep anxiety"
+    python -m airtable_sync.search "deadline*" --since 2025-01-01 --limit 5
+    python -m airtable_sync.search --build          # index entries_data.csv
+    python -m airtable_sync.search 'NEAR(work stress, 5)' --raw --json
+
+    index = SearchIndex(DEFAULT_PATH, 'entries', ROW, ENTRIES.search, ENTRIES.search_display)
+    index.write(page)
+    index.close()
+"""
+
+import argparse
+import csv
+import json
+import sqlite3
+import time
+
+from airtable_sync.config import TABLES
+from airtable_sync.manifest import row_hash
+from airtable_sync.mapping import RECORD_ID
+from airtable_sync.sqlite_mirror import BUSY_TIMEOUT, DEFAULT_PATH, column_name
+
+# Porter stemming over unicode61, so 'worried' also matches 'worry'
+TOKENIZER = 'porter unicode61 remove_diacritics 2'
+SNIPPET_TOKENS = 16
+
+
+class SearchIndex:
+    """FTS5 documents for one table, re-indexed only for changed records."""
+
+    def __init__(self, path, table, builder, columns, display=()):
+        self.fts = f'{table}_search'
+        self.docs = f'{table}_search_docs'
+        self.key_index = builder.index(RECORD_ID)
+        self.text_positions = [builder.index(name) for name in columns]
+        self.display_positions = [builder.index(name) for name in display]
+        self.text_columns = [column_name(name) for name in columns]
+        self.display_columns = [column_name(name) for name in display]
+        self.seen = set()
+        self.counts = {'indexed': 0, 'unchanged': 0, 'removed': 0}
+
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.create()
+
+    def create(self):
+        """Create the FTS and document tables."""
+        display = ''.join(f', {name} TEXT' for name in self.display_columns)
+        with self.conn:
+            self.conn.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts} USING fts5('
+                f'{", ".join(self.text_columns)}, tokenize="{TOKENIZER}")')
+            self.conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.docs} (docid INTEGER PRIMARY KEY, '
+                f'record_id TEXT UNIQUE NOT NULL, hash TEXT NOT NULL{display})')
+
+    def write(self, rows):
+        """Index the changed records of one page in a single transaction."""
+        key = self.key_index
+        ids = [row[key] for row in rows]
+        self.seen.update(ids)
+        existing = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            existing.update(
+                (rid, (docid, digest)) for rid, docid, digest in self.conn.execute(
+                    f'SELECT record_id, docid, hash FROM {self.docs} '
+                    f'WHERE record_id IN ({", ".join("?" for _ in chunk)})', chunk))
+
+        columns = ['record_id', 'hash'] + self.display_columns
+        upsert_doc = (
+            f'INSERT INTO {self.docs} ({", ".join(columns)}) '
+            f'VALUES ({", ".join("?" for _ in columns)}) '
+            f'ON CONFLICT(record_id) DO UPDATE SET '
+            + ', '.join(f'{c} = excluded.{c}' for c in columns[1:])
+        )
+        insert_text = (f'INSERT INTO {self.fts} (rowid, {", ".join(self.text_columns)}) '
+                       f'VALUES (?{", ?" * len(self.text_columns)})')
+        with self.conn:
+            for row in rows:
+                text = [row[i] or '' for i in self.text_positions]
+                display = [row[i] or '' for i in self.display_positions]
+                digest = row_hash(text + display)
+                previous = existing.get(row[key])
+                if previous is not None and previous[1] == digest:
+                    self.counts['unchanged'] += 1
+                    continue
+                if previous is not None:
+                    self.conn.execute(f'DELETE FROM {self.fts} WHERE rowid = ?', (previous[0],))
+                docid = self.conn.execute(
+                    upsert_doc + ' RETURNING docid', [row[key], digest] + display).fetchone()[0]
+                self.conn.execute(insert_text, [docid] + text)
+                self.counts['indexed'] += 1
+
+    def close(self):
+        """Remove records absent from this run, then close the connection."""
+        with self.conn:
+            self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS seen_ids (id TEXT PRIMARY KEY)')
+            self.conn.execute('DELETE FROM seen_ids')
+            self.conn.executemany('INSERT OR IGNORE INTO seen_ids VALUES (?)', ((i,) for i in self.seen))
+            stale = f'SELECT docid FROM {self.docs} WHERE record_id NOT IN (SELECT id FROM seen_ids)'
+            self.counts['removed'] = self.conn.execute(
+                f'DELETE FROM {self.fts} WHERE rowid IN ({stale})').rowcount
+            self.conn.execute(f'DELETE FROM {self.docs} WHERE docid IN ({stale})')
+        self.conn.close()
+
+    def summary(self):
+        """One-line index update summary."""
+        c = self.counts
+        return f'{c["indexed"]} indexed, {c["unchanged"]} unchanged, {c["removed"]} removed'
+
+
+def match_expression(query):
+    """Quote each word so plain text never trips FTS5 syntax; keep trailing * as prefix."""
+    terms = []
+    for word in query.split():
+        prefix = word.endswith('*')
+        word = word.rstrip('*').replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def search(path, table, query, display=(), limit=10, since=None, raw=False, date_column=None):
+    """Return BM25-ranked matches as dicts, best first (higher score is better).
+
+    since keeps records whose date_column (one of the display columns) is
+    on or after it.
+    """
+    if since and date_column not in display:
+        raise ValueError(f'since needs a date column among the display columns of {table}')
+    fts, docs = f'{table}_search', f'{table}_search_docs'
+    display_columns = [column_name(name) for name in display]
+    selected = ''.join(f', d.{name}' for name in display_columns)
+    sql = (f'SELECT d.record_id{selected}, -bm25({fts}) AS score, '
+           f"snippet({fts}, -1, '[', ']', '...', {SNIPPET_TOKENS}) "
+           f'FROM {fts} JOIN {docs} d ON d.docid = {fts}.rowid '
+           f'WHERE {fts} MATCH ?')
+    params = [query if raw else match_expression(query)]
+    if since:
+        sql += f' AND d.{column_name(date_column)} >= ?'
+        params.append(since)
+    sql += ' ORDER BY score DESC LIMIT ?'
+    params.append(limit)
+
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+    names = [RECORD_ID] + list(display) + ['score', 'snippet']
+    return [dict(zip(names, row)) for row in rows]
+
+
+def build(path, config):
+    """(Re)index a table from its synced CSV; return the SearchIndex."""
+    index = SearchIndex(path, config.name, config.row, config.search, config.search_display)
+    with open(config.output_path(), newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        page = []
+        for row in reader:
+            page.append(row)
+            if len(page) == 500:
+                index.write(page)
+                page = []
+        if page:
+            index.write(page)
+    index.close()
+    return index
+
+
+def main():
+    """Query (or build) the search index from the command line."""
+    searchable = [name for name, config in TABLES.items() if config.search]
+    parser = argparse.ArgumentParser(description='Full-text search over synced Airtable records.')
+    parser.add_argument('query', nargs='?', help='words to search for (word* for a prefix)')
+    parser.add_argument('--table', choices=searchable, default=searchable[0])
+    parser.add_argument('--db', default=DEFAULT_PATH, help='SQLite database with the index')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--since', metavar='YYYY-MM-DD', help='only records dated on or after')
+    parser.add_argument('--raw', action='store_true', help='pass the query to FTS5 unchanged')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--build', action='store_true', help="index the table's CSV first")
+    args = parser.parse_args()
+    config = TABLES[args.table]
+    if args.since and config.search_date() is None:
+        parser.error(f'--since needs a date column; {args.table} shows none with its results')
+
+    if args.build:
+        start = time.monotonic()
+        index = build(args.db, config)
+        print(f'Indexed {config.output_path()} in {time.monotonic() - start:.2f}s: {index.summary()}')
+    if not args.query:
+        if not args.build:
+            parser.error('a query is required unless --build is given')
+        return
+
+    start = time.monotonic()
+    results = search(args.db, config.name, args.query, config.search_display,
+                     args.limit, args.since, args.raw, config.search_date())
+    elapsed = (time.monotonic() - start) * 1000
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        label = ' | '.join(str(result[name]) for name in config.search_display if result[name])
+        print(f'{result["score"]:9.3g}  {result[RECORD_ID]}  {label}')
+        print(f'           {result["snippet"]}')
+    print(f'{len(results)} results in {elapsed:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+SQLite Mirror
+=============
+Keeps an indexed SQLite copy of each synced table next to the CSVs, so
+questions like "tasks for priority X" or "Stress entries in the last 30
+days" are index lookups instead of full CSV scans.
+
+Rows are upserted by Record ID, one transaction per page. Records that were
+not part of the run are deleted when the mirror is closed. The database
+uses WAL mode, so both sync scripts can write to the same file at once.
+
+Column names are snake_cased ('Inferred Mode' -> inferred_mode,
+'Task Completion %' -> task_completion_pct).
+
+Usage:
+    mirror = SQLiteMirror(DEFAULT_PATH, 'entries', ROW, indexes=['Date', 'Type'])
+    mirror.write(page)
+    mirror.close()
+"""
+
+import os
+import re
+import sqlite3
+
+from airtable_sync.columnar import to_bool, to_int
+from airtable_sync.mapping import RECORD_ID
+
+SQL_TYPES = {
+    'int': 'INTEGER',
+    'bool': 'INTEGER',
+}
+
+# Shared database written by both sync scripts (repository root)
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'airtable.db')
+
+# Seconds to wait for another writer (e.g. the other sync script) to commit
+BUSY_TIMEOUT = 30
+
+
+def column_name(name):
+    """SQL identifier for a CSV column."""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower().replace('%', 'pct')).strip('_')
+
+
+def to_sql(dtype):
+    """Return the converter from a row value to its SQLite value."""
+    if dtype == 'int':
+        return to_int
+    if dtype == 'bool':
+        return lambda value: int(to_bool(value))
+    return lambda value: '' if value is None else str(value)
+
+
+class SQLiteMirror:
+    """Upserts row tuples into one SQLite table keyed by Record ID."""
+
+    def __init__(self, path, table, builder, indexes=()):
+        self.table = table
+        self.columns = [column_name(name) for name in builder.columns]
+        self.key = column_name(RECORD_ID)
+        self.converters = [to_sql(dtype) for dtype in builder.dtypes]
+        self.seen = set()
+        self.key_index = builder.index(RECORD_ID)
+
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.create(builder, indexes)
+
+        assignments = ', '.join(f'{c} = excluded.{c}' for c in self.columns if c != self.key)
+        self.upsert_sql = (
+            f'INSERT INTO {table} ({", ".join(self.columns)}) '
+            f'VALUES ({", ".join("?" for _ in self.columns)}) '
+            f'ON CONFLICT({self.key}) DO UPDATE SET {assignments}'
+        )
+
+    def create(self, builder, indexes):
+        """Create the table and indexes, adding any columns new to the spec."""
+        definitions = [
+            f'{name} {SQL_TYPES.get(dtype, "TEXT")}' + (' PRIMARY KEY' if name == self.key else '')
+            for name, dtype in zip(self.columns, builder.dtypes)
+        ]
+        with self.conn:
+            self.conn.execute(f'CREATE TABLE IF NOT EXISTS {self.table} ({", ".join(definitions)})')
+            existing = {row[1] for row in self.conn.execute(f'PRAGMA table_info({self.table})')}
+            for name, definition in zip(self.columns, definitions):
+                if name not in existing:
+                    self.conn.execute(f'ALTER TABLE {self.table} ADD COLUMN {definition}')
+            for index in indexes:
+                name = column_name(index)
+                self.conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_{self.table}_{name} ON {self.table} ({name})')
+
+    def write(self, rows):
+        """Upsert one page of rows in a single transaction."""
+        values = [
+            [convert(value) for convert, value in zip(self.converters, row)]
+            for row in rows
+        ]
+        with self.conn:
+            self.conn.executemany(self.upsert_sql, values)
+        self.seen.update(row[self.key_index] for row in rows)
+
+    def close(self):
+        """Delete records absent from this run, then close the connection."""
+        with self.conn:
+            self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS seen_ids (id TEXT PRIMARY KEY)')
+            self.conn.execute('DELETE FROM seen_ids')
+            self.conn.executemany('INSERT OR IGNORE INTO seen_ids VALUES (?)', ((i,) for i in self.seen))
+            self.conn.execute(
+                f'DELETE FROM {self.table} WHERE {self.key} NOT IN (SELECT id FROM seen_ids)')
+        self.conn.close()
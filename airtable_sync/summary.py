@@ -0,0 +1,227 @@
+"""
+Run Summary
+===========
+Summary statistics over synced rows, accumulated page by page while the
+sync writes them, so the end-of-run summary costs no extra pass over the
+data.
+
+Each statistic reads its columns with operator.itemgetter and updates a
+collections.Counter from the whole page at once, so the per-row work runs
+in C rather than in a Python loop. Values that need parsing (dates, weeks)
+are parsed once per distinct value.
+
+Statistics:
+    - Distribution: value counts of one column
+    - DateRange: earliest and latest date
+    - WeeklyCounts: records per ISO week of a date column
+    - CrossTab: counts of value pairs (e.g. mode x energy)
+    - Ratio: sum(part) / sum(whole) * 100 per group (e.g. completion % by horizon)
+
+Usage:
+    summary = RunSummary(ROW, ENTRIES.summary)  # specs from airtable_sync.config
+    for page in pages:
+        summary.add(page)
+    print(summary.text())
+    summary.write_json('entries_summary.json')
+"""
+
+from abc import ABC, abstractmethod
+from collections import Counter
+import copy
+from datetime import date
+import json
+from operator import itemgetter
+
+from airtable_sync.columnar import to_int
+from airtable_sync.instrument import write_atomic
+
+# Label for blank values in distributions and cross-tabs
+UNKNOWN = 'Unknown'
+
+
+def label(value):
+    """Counter key for a cell: its text, or UNKNOWN when blank."""
+    return UNKNOWN if value in ('', None) else str(value)
+
+
+class Statistic(ABC):
+    """Base for statistics over named columns of a row builder's tuples."""
+
+    def __init__(self, columns, title):
+        self.columns = tuple(columns)
+        self.title = title
+
+    def bind(self, builder):
+        """Resolve column names to row positions (one value, or a tuple for several)."""
+        self.get = itemgetter(*(builder.index(column) for column in self.columns))
+
+    @abstractmethod
+    def add(self, rows):
+        """Update the statistic with one page of rows."""
+
+    @abstractmethod
+    def result(self):
+        """JSON-ready value."""
+
+    def text(self):
+        """One console line, or None when there is nothing to report."""
+        return f'{self.title}: {self.result()}'
+
+
+class Distribution(Statistic):
+    """Value counts of one column, ordered by count (or by value)."""
+
+    def __init__(self, column, title, by_count=True):
+        super().__init__([column], title)
+        self.by_count = by_count
+        self.counts = Counter()
+
+    def add(self, rows):
+        self.counts.update(map(label, map(self.get, rows)))
+
+    def result(self):
+        if self.by_count:
+            return dict(sorted(self.counts.items(), key=lambda item: -item[1]))
+        return dict(sorted(self.counts.items()))
+
+
+class DateRange(Statistic):
+    """Earliest and latest value of a date column (ISO strings compare as dates)."""
+
+    def __init__(self, column, title='Date Range'):
+        super().__init__([column], title)
+        self.first = None
+        self.last = None
+
+    def add(self, rows):
+        dates = [d for d in map(self.get, rows) if d]
+        if not dates:
+            return
+        first, last = min(dates), max(dates)
+        if self.first is None or first < self.first:
+            self.first = first
+        if self.last is None or last > self.last:
+            self.last = last
+
+    def result(self):
+        return {'first': self.first, 'last': self.last}
+
+    def text(self):
+        if self.first is None:
+            return None
+        return f'{self.title}: {self.first} to {self.last}'
+
+
+class WeeklyCounts(Statistic):
+    """Records per ISO week (YYYY-Www) of a date column."""
+
+    def __init__(self, column, title='Per Week'):
+        super().__init__([column], title)
+        self.counts = Counter()
+
+    def add(self, rows):
+        days = Counter(value[:10] for value in map(self.get, rows) if value)
+        for day, count in days.items():
+            year, week, _ = date.fromisoformat(day).isocalendar()
+            self.counts[f'{year}-W{week:02d}'] += count
+
+    def result(self):
+        return dict(sorted(self.counts.items()))
+
+    def text(self):
+        if not self.counts:
+            return None
+        counts = self.result()
+        last = list(counts.items())[-4:]
+        return (f'{self.title}: {len(counts)} weeks, avg {sum(counts.values()) / len(counts):.1f}, '
+                f'max {max(counts.values())}, recent {dict(last)}')
+
+
+class CrossTab(Statistic):
+    """Counts of (row value, column value) pairs, as a nested dict."""
+
+    def __init__(self, rows, columns, title):
+        super().__init__([rows, columns], title)
+        self.counts = Counter()
+
+    def add(self, rows):
+        self.counts.update(map(self.get, rows))
+
+    def result(self):
+        table = {}
+        # Raw keys that share a label ('' and None, 3 and '3') add up
+        for (row, column), count in self.counts.items():
+            counts = table.setdefault(label(row), {})
+            counts[label(column)] = counts.get(label(column), 0) + count
+        return {row: dict(sorted(counts.items())) for row, counts in sorted(table.items())}
+
+    def text(self):
+        table = self.result()
+        if not table:
+            return None
+        columns = sorted({column for counts in table.values() for column in counts})
+        width = max(len(row) for row in table)
+        lines = [f'{self.title}:',
+                 '  ' + ' ' * width + ''.join(f'{column:>12}' for column in columns)]
+        for row, counts in table.items():
+            lines.append(f'  {row:<{width}}' + ''.join(f'{counts.get(c, 0):>12}' for c in columns))
+        return '\n  '.join(lines)
+
+
+class Ratio(Statistic):
+    """sum(part) / sum(whole) * 100 for each value of a group column."""
+
+    def __init__(self, group, part, whole, title):
+        super().__init__([group, part, whole], title)
+        self.parts = Counter()
+        self.wholes = Counter()
+
+    def add(self, rows):
+        for group, part, whole in map(self.get, rows):
+            group = label(group)
+            self.parts[group] += to_int(part) or 0
+            self.wholes[group] += to_int(whole) or 0
+
+    def result(self):
+        return {group: round(self.parts[group] * 100 / whole, 1) if whole else None
+                for group, whole in sorted(self.wholes.items())}
+
+    def text(self):
+        if not self.wholes:
+            return None
+        return super().text()
+
+
+class RunSummary:
+    """A table's statistics, bound to its row layout and fed page by page."""
+
+    def __init__(self, builder, stats):
+        # Work on copies, so the specs in airtable_sync.config stay empty
+        self.stats = copy.deepcopy(list(stats))
+        for stat in self.stats:
+            stat.bind(builder)
+        self.records = 0
+
+    def add(self, rows):
+        """Update every statistic with one page of rows."""
+        self.records += len(rows)
+        for stat in self.stats:
+            stat.add(rows)
+
+    def as_dict(self):
+        """JSON-ready statistics keyed by title."""
+        return {'records': self.records, **{stat.title: stat.result() for stat in self.stats}}
+
+    def text(self):
+        """Console lines, indented like the sync summaries."""
+        return '\n'.join(f'  {line}' for line in (stat.text() for stat in self.stats) if line)
+
+    def write_json(self, path):
+        """Write the statistics as JSON, atomically."""
+        write_atomic(path, json.dumps(self.as_dict(), indent=2) + '\n')
+
+
+def write_json(path, summaries):
+    """Write several tables' statistics to one JSON file, keyed by table."""
+    write_atomic(path, json.dumps({name: summary.as_dict() for name, summary in summaries.items()},
+                                  indent=2) + '\n')
@@ -0,0 +1,85 @@
+"""
+Test Fixtures
+=============
+A FakeAirtable server on a random port (every table carrying one field no
+column maps), the environment that points the
+sync scripts at it (with output in a temporary directory), and the sync
+scripts loaded as modules.
+"""
+
+import argparse
+import importlib.util
+import os
+
+import pytest
+
+from airtable_sync.client import ClientMetrics, connect
+from airtable_sync.config import ROOT
+from airtable_sync.fake_airtable import FakeAirtable, Field, sync_env
+
+# Entries and Tasks records served (three pages each); Priorities get a tenth
+RECORDS = 250
+
+# A text field on every fake table that no column mapping reads
+UNMAPPED = 'Internal Notes'
+
+
+def load_script(path, name):
+    """Import a sync script by path, reading the current environment."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def fake():
+    server = FakeAirtable.from_schemas(RECORDS, rate=0)
+    for schema in server.generator.tables.values():
+        schema.fields.append(Field(UNMAPPED, 'singleLineText'))
+    server.serve()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def env(fake, tmp_path, monkeypatch):
+    for key, value in sync_env(fake).items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv('AIRTABLE_RATE_LIMIT', '1000')
+    monkeypatch.setenv('SYNC_OUTPUT_DIR', str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def api(env):
+    return connect(os.environ['AIRTABLE_API_KEY'], metrics=ClientMetrics())
+
+
+@pytest.fixture
+def entries(env):
+    """Pratyaksha/sync_airtable.py, configured for the fake server."""
+    return load_script(os.path.join('Pratyaksha', 'sync_airtable.py'), 'sync_airtable')
+
+
+@pytest.fixture
+def dincharya(env):
+    """DinCharya/sync_dincharya.py, configured for the fake server."""
+    return load_script(os.path.join('DinCharya', 'sync_dincharya.py'), 'sync_dincharya')
+
+
+def entries_args(**options):
+    """sync_airtable.py command-line options, defaults overridden by options."""
+    values = dict(incremental=False, partitions=1, local_formulas=False, columnar=None,
+                  sqlite=None, search=None, vectors=None, metrics=None, prometheus=None,
+                  summary=None)
+    values.update(options)
+    return argparse.Namespace(**values)
+
+
+def dincharya_args(**options):
+    """sync_dincharya.py command-line options, defaults overridden by options."""
+    values = dict(concurrent=False, local_lookups=False, local_formulas=False, sqlite=None,
+                  metrics=None, prometheus=None, summary=None)
+    values.update(options)
+    return argparse.Namespace(**values)
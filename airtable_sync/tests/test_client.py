@@ -0,0 +1,32 @@
+"""
+Airtable Client Tests
+=====================
+connect() against the fake Airtable server: every request is counted and
+its JSON decode timed where pyairtable processes the response, without
+replacing the response's own json() method.
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+import os
+
+from airtable_sync.client import ClientMetrics, connect
+from airtable_sync.config import PRIORITIES
+from airtable_sync.tests.conftest import RECORDS
+
+
+def test_decode_is_timed_without_replacing_json(env):
+    metrics = ClientMetrics()
+    api = connect(os.environ['AIRTABLE_API_KEY'], metrics=metrics)
+    responses = []
+    api.session.hooks['response'].append(lambda response, **kwargs: responses.append(response))
+
+    records = api.table(PRIORITIES.base_id(), PRIORITIES.table_id()).all(page_size=10)
+    assert len(records) == RECORDS // 10
+    assert metrics.requests == len(responses) == 3
+    assert metrics.decode_time > 0
+    assert metrics.bytes_received == sum(len(response.content) for response in responses)
+    for response in responses:
+        assert 'json' not in vars(response)
+        assert response.json()['records']
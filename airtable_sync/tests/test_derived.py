@@ -0,0 +1,20 @@
+"""
+Derived Field Tests
+===================
+Locally computed formula columns must equal what Airtable returns.
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+from airtable_sync.derived import percent
+
+
+def test_percent_uses_the_formula_operation_order():
+    # {Completed Tasks} / {Total Tasks} * 100, evaluated left to right
+    assert percent(None, ['1', '2', 3], ['3', '3', 7]) == [1 / 3 * 100, 2 / 3 * 100, 3 / 7 * 100]
+    assert percent(None, ['1'], ['3']) == [33.33333333333333]
+
+
+def test_percent_whole_numbers_and_blanks():
+    assert percent(None, ['2', '0', '', '5'], ['4', '5', '0', '']) == [50, 0, '', '']
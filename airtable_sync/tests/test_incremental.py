@@ -0,0 +1,74 @@
+"""
+Incremental Sync Tests
+======================
+merge_rows() applies changed and deleted records to the previous CSV rows
+in Date order, and an incremental Entries sync against the fake Airtable
+server writes exactly what a full sync of the changed table writes.
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+import pytest
+
+from airtable_sync.fake_airtable import record_id
+from airtable_sync.tests.conftest import entries_args
+
+
+def make_row(entries, rid, day, name=''):
+    """An Entries row with only its Record ID, Date and Name set."""
+    row = [''] * len(entries.COLUMNS)
+    row[entries.ID] = rid
+    row[entries.DATE] = day
+    row[entries.ROW.index('Name')] = name
+    return tuple(row)
+
+
+def test_merge_rows_upserts_and_deletes_in_date_order(entries):
+    a, b, c, d, e = (make_row(entries, rid, day) for rid, day in [
+        ('a', '2024-01-01'), ('b', '2024-01-02'), ('c', '2024-01-02'),
+        ('d', '2024-01-03'), ('e', '2024-01-05')])
+    changed = [
+        make_row(entries, 'b', '2024-01-02', 'edited'),   # same Date: stays in place
+        make_row(entries, 'c', '2024-01-01', 'earlier'),  # moves before b
+        make_row(entries, 'd', '2024-01-06', 'later'),    # moves past the deleted e
+        make_row(entries, 'f', '2024-01-02', 'new'),      # after the rows of its Date
+        make_row(entries, 'g', '', 'undated'),            # blank Dates sort first
+    ]
+    merged = list(entries.merge_rows(iter([a, b, c, d, e]), changed, {'e'}))
+    assert [(row[entries.ID], row[entries.DATE]) for row in merged] == [
+        ('g', ''), ('a', '2024-01-01'), ('c', '2024-01-01'), ('b', '2024-01-02'),
+        ('f', '2024-01-02'), ('d', '2024-01-06')]
+    assert merged[3] == changed[0]
+
+
+def test_merge_rows_without_changes_streams_existing(entries):
+    existing = [make_row(entries, str(i), f'2024-01-{i + 1:02d}') for i in range(5)]
+    assert list(entries.merge_rows(iter(existing), [], set())) == existing
+
+
+@pytest.mark.parametrize('local_formulas', [False, True], ids=['fetched', 'local-formulas'])
+def test_incremental_matches_full_sync(fake, entries, env, local_formulas):
+    table = entries.get_table(None)
+    entries.sync(entries_args(local_formulas=local_formulas), table, None, False)
+
+    schema = fake.generator.tables['Entries']
+    fake.update('Entries', record_id(schema, 40), {'Text': 'Rewritten after the sync'})
+    fake.update('Entries', record_id(schema, 41), {'Date': '2026-03-01'})
+    fake.update('Entries', record_id(schema, 42), {'Date': None})
+    fake.delete('Entries', record_id(schema, 43))
+    fake.create('Entries', {'Name': 'New entry', 'Date': '2025-12-30', 'Text': 'Written later'})
+
+    del fake.requests[:]
+    args = entries_args(incremental=True, local_formulas=local_formulas)
+    _, stats = entries.sync(args, table, None, True)
+    assert stats['changes'] == {'added': 1, 'changed': 3, 'removed': 1}
+    # Only the changed-records filter, the ID-only pass and RECORD_ID() re-reads
+    for _, params in fake.requests:
+        assert params.get('filterByFormula') or params['fields'] == entries.ID_ONLY_FIELDS
+    incremental = (env / 'entries_data.csv').read_text(encoding='utf-8')
+
+    # A full sync of the changed table finds nothing left to rewrite
+    _, stats = entries.sync(entries_args(local_formulas=local_formulas), table, None, False)
+    assert not stats['replaced']
+    assert (env / 'entries_data.csv').read_text(encoding='utf-8') == incremental
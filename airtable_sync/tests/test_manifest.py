@@ -0,0 +1,58 @@
+"""
+CSV Output Tests
+================
+CSVOutput replaces its CSV only on commit; a sync that fails inside the
+with block leaves the previous CSV untouched and no temporary file behind.
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+import os
+
+import pytest
+
+from airtable_sync.config import PRIORITIES
+from airtable_sync.manifest import CSVOutput
+
+PADDING = ('',) * (len(PRIORITIES.row.columns) - 2)
+ROWS = [('rec1', 'First') + PADDING, ('rec2', 'Second') + PADDING]
+
+
+def write(path, rows):
+    with CSVOutput(path, PRIORITIES.row) as output:
+        output.write(rows)
+        return output.commit()
+
+
+def test_commit_replaces_only_on_change(tmp_path):
+    path = str(tmp_path / 'priorities.csv')
+    assert write(path, ROWS)
+    assert not write(path, ROWS)
+    assert write(path, ROWS[:1])
+    assert not os.path.exists(path + '.tmp')
+
+
+def test_failed_sync_removes_temporary_file(tmp_path):
+    path = str(tmp_path / 'priorities.csv')
+    write(path, ROWS)
+    with open(path, encoding='utf-8') as f:
+        before = f.read()
+
+    with pytest.raises(RuntimeError):
+        with CSVOutput(path, PRIORITIES.row) as output:
+            assert os.path.exists(output.tmp_path)
+            raise RuntimeError('fetch failed')
+    assert not os.path.exists(path + '.tmp')
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == before
+
+
+def test_failure_after_commit_keeps_new_csv(tmp_path):
+    path = str(tmp_path / 'priorities.csv')
+    with pytest.raises(RuntimeError):
+        with CSVOutput(path, PRIORITIES.row) as output:
+            output.commit()
+            raise RuntimeError('sink failed')
+    assert os.path.exists(path)
+    assert not os.path.exists(path + '.tmp')
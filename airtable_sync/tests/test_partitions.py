@@ -0,0 +1,69 @@
+"""
+Date Partition Tests
+====================
+The filterByFormula windows of the partitioned Entries fetch, evaluated by
+the fake Airtable server: together they must return every record exactly
+once, including records whose Date is blank, and their k-way merge must
+yield the serial fetch's rows in the same order.
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+import pytest
+
+from airtable_sync.fake_airtable import record_id
+from airtable_sync.instrument import SyncMetrics
+from airtable_sync.tests.conftest import entries_args
+
+# Entries whose Date is cleared before the windows are fetched
+BLANK_DATES = (0, 7, 120, 249)
+
+
+def blank_dates(fake):
+    """Clear the Date of the BLANK_DATES entries; return their record IDs."""
+    schema = fake.generator.tables['Entries']
+    blank = {record_id(schema, index) for index in BLANK_DATES}
+    for rid in blank:
+        fake.update('Entries', rid, {'Date': None})
+    return blank
+
+
+@pytest.mark.parametrize('partitions', [2, 3, 5])
+def test_windows_are_disjoint_and_complete(fake, entries, partitions):
+    blank = blank_dates(fake)
+    table = entries.get_table(None)
+
+    formulas = entries.partition_formulas(*entries.date_bounds(table), partitions)
+    assert len(formulas) == partitions
+    windows = [{rec['id'] for rec in table.all(formula=formula, fields=['Date'])}
+               for formula in formulas]
+
+    every = {rec['id'] for rec in table.all(fields=['Date'])}
+    assert sum(len(window) for window in windows) == len(every)
+    assert set().union(*windows) == every
+    assert blank <= windows[0]
+
+
+@pytest.mark.parametrize('partitions', [2, 4, 7])
+def test_merge_yields_serial_order(fake, entries, partitions):
+    blank_dates(fake)
+    table = entries.get_table(None)
+    run = SyncMetrics('entries')
+    serial = [row for page in entries.fetch_pages(table, run) for row in page]
+    partitioned = [row for page in entries.fetch_partitioned(table, run, partitions)
+                   for row in page]
+    assert partitioned == serial
+    days = [row[entries.DATE] or '' for row in partitioned]
+    assert days == sorted(days)
+    assert days[:len(BLANK_DATES)] == [''] * len(BLANK_DATES)
+
+
+def test_partitioned_sync_writes_serial_output(fake, entries, env):
+    blank_dates(fake)
+    table = entries.get_table(None)
+    entries.sync(entries_args(), table, None, False)
+    serial = (env / 'entries_data.csv').read_text(encoding='utf-8')
+    _, stats = entries.sync(entries_args(partitions=4), table, None, False)
+    assert not stats['replaced']
+    assert (env / 'entries_data.csv').read_text(encoding='utf-8') == serial
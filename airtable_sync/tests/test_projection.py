@@ -0,0 +1,114 @@
+"""
+Field Projection Tests
+======================
+Every request the syncs send to the fake Airtable server must project
+fields=[...] onto the Airtable fields its column mapping reads: nothing
+unmapped, and nothing computed locally under --local-lookups or
+--local-formulas.
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from airtable_sync.config import ENTRIES, PRIORITIES, TASKS
+from airtable_sync.fake_airtable import record_id
+from airtable_sync.mapping import CREATED_TIME, LOCAL, RECORD_ID
+from airtable_sync.instrument import SyncMetrics
+from airtable_sync.tests.conftest import UNMAPPED, dincharya_args, entries_args
+
+VARIANTS = [
+    pytest.param(False, False, id='fetched'),
+    pytest.param(True, False, id='local-lookups'),
+    pytest.param(False, True, id='local-formulas'),
+    pytest.param(True, True, id='local-lookups-and-formulas'),
+]
+
+
+def mapped_sources(config, local_lookups, local_formulas):
+    """Airtable fields the table's columns read, straight from its Column specs."""
+    skip = set()
+    if local_lookups:
+        skip.update(lookup.name for lookup in config.lookups)
+    if local_formulas:
+        skip.update(derived.name for derived in config.derived)
+    return {column.source for column in config.mapping
+            if column.name != RECORD_ID and column.name not in skip
+            and column.source not in (CREATED_TIME, LOCAL)}
+
+
+def requested_fields(fake):
+    """Field names sent by each logged request, by table ID (None when unprojected)."""
+    fields = {}
+    for table_id, params in fake.requests:
+        fields.setdefault(table_id, []).append(params.get('fields'))
+    return fields
+
+
+def served_fields(fake, config):
+    """Fields present on the fake table's records."""
+    schema = fake.tables[(config.base_id(), config.table_id())]
+    fields = set()
+    for index in range(schema.count):
+        fields.update(fake.generator.record(schema, index)['fields'])
+    return fields
+
+
+def assert_projected(fake, config, local_lookups=False, local_formulas=False):
+    """Every request for the table asked for mapped source fields only."""
+    requests = requested_fields(fake)[config.table_id()]
+    allowed = mapped_sources(config, local_lookups, local_formulas)
+    assert UNMAPPED in served_fields(fake, config)
+    for fields in requests:
+        assert fields is not None
+        assert set(fields) <= allowed
+        assert UNMAPPED not in fields
+
+
+ENTRIES_RUNS = [
+    pytest.param(entries_args(), id='serial'),
+    pytest.param(entries_args(partitions=3), id='partitioned'),
+    pytest.param(entries_args(local_formulas=True), id='local-formulas'),
+    pytest.param(entries_args(incremental=True), id='incremental'),
+]
+
+
+@pytest.mark.parametrize('args', ENTRIES_RUNS)
+def test_entries_requests_only_mapped_fields(fake, entries, args):
+    table = entries.get_table(None)
+    # An incremental run needs a watermark, so it follows a full one
+    entries.sync(entries_args(local_formulas=args.local_formulas), table, None, False)
+    del fake.requests[:]
+    entries.sync(args, table, None, args.incremental)
+    assert_projected(fake, ENTRIES, local_formulas=args.local_formulas)
+
+
+def test_entries_request_paths(fake, entries):
+    table = entries.get_table(None)
+    run = SyncMetrics('entries')
+    for page in entries.fetch_pages(table, run):
+        pass
+    entries.date_bounds(table)
+    records, _, _ = entries.fetch_changed_records(table, datetime(2024, 1, 1, tzinfo=timezone.utc),
+                                                  {record_id(fake.generator.tables['Entries'], 0)})
+    assert records
+    # date_bounds and the ID-only pass of fetch_changed_records ask for Date alone
+    assert ['Date'] in requested_fields(fake)[ENTRIES.table_id()]
+    assert_projected(fake, ENTRIES)
+
+
+@pytest.mark.parametrize('local_lookups, local_formulas', VARIANTS)
+def test_dincharya_requests_only_mapped_fields(fake, dincharya, api, local_lookups, local_formulas):
+    dincharya.sync(dincharya_args(local_lookups=local_lookups, local_formulas=local_formulas),
+                   api, None)
+    assert_projected(fake, PRIORITIES, local_formulas=local_formulas)
+    assert_projected(fake, TASKS, local_lookups, local_formulas)
+
+
+def test_source_override_is_requested_instead_of_column_name():
+    fields = TASKS.fields()
+    assert 'Priority Link' in fields
+    assert 'Priority' not in fields
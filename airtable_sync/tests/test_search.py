@@ -0,0 +1,61 @@
+"""
+Full-Text Search Tests
+======================
+search --since filters on the table's date display column, taken from its
+TableConfig, and is refused for a table that shows no date.
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+import sys
+
+import pytest
+
+from airtable_sync import search
+from airtable_sync.config import ENTRIES, TableConfig
+from airtable_sync.mapping import RECORD_ID, Column
+
+DAYS = ['2024-12-30', '2025-01-01', '2025-02-14']
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / 'airtable.db')
+    builder = ENTRIES.row
+    rows = []
+    for i, day in enumerate(DAYS):
+        row = [''] * len(builder.columns)
+        row[builder.index(RECORD_ID)] = f'rec{i}'
+        row[builder.index('Date')] = day
+        row[builder.index('Text')] = 'a deadline loomed over the week'
+        rows.append(tuple(row))
+    index = search.SearchIndex(path, 'entries', builder, ENTRIES.search, ENTRIES.search_display)
+    index.write(rows)
+    index.close()
+    return path
+
+
+def test_since_filters_on_config_date_column(db):
+    assert ENTRIES.search_date() == 'Date'
+    results = search.search(db, 'entries', 'deadline', ENTRIES.search_display,
+                            since='2025-01-01', date_column=ENTRIES.search_date())
+    assert sorted(result['Date'] for result in results) == DAYS[1:]
+
+
+def test_since_without_date_column_is_refused(db):
+    with pytest.raises(ValueError):
+        search.search(db, 'entries', 'deadline', ENTRIES.search_display, since='2025-01-01')
+
+
+def test_cli_rejects_since_for_table_without_date(monkeypatch, capsys, db):
+    notes = TableConfig('notes', 'NOTES_BASE_ID', 'NOTES_TABLE_ID', output='notes.csv',
+                        mapping=[Column(RECORD_ID), Column('Title'), Column('Body')],
+                        search=['Body'], search_display=['Title'])
+    assert notes.search_date() is None
+    monkeypatch.setattr(search, 'TABLES', {'notes': notes})
+    monkeypatch.setattr(sys, 'argv', ['search', 'deadline', '--db', db, '--since', '2025-01-01'])
+    with pytest.raises(SystemExit) as error:
+        search.main()
+    assert error.value.code == 2
+    assert '--since needs a date column' in capsys.readouterr().err
@@ -0,0 +1,50 @@
+"""
+Run Summary Tests
+=================
+Raw cell values that share a label must be counted together, and every
+statistic implements Statistic's abstract add() and result().
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+import pytest
+
+from airtable_sync.mapping import Column, compile_mapping
+from airtable_sync.summary import (
+    UNKNOWN, CrossTab, DateRange, Distribution, Ratio, Statistic, WeeklyCounts)
+
+ROW = compile_mapping([Column('Mode'), Column('Energy')])
+
+
+def test_crosstab_adds_counts_of_keys_with_the_same_label():
+    crosstab = CrossTab('Mode', 'Energy', 'Mode x Energy')
+    crosstab.bind(ROW)
+    crosstab.add([('Calm', ''), ('Calm', None), (3, 'High'), ('3', 'High'), (None, 'High')])
+    assert crosstab.result() == {
+        '3': {'High': 2},
+        'Calm': {UNKNOWN: 2},
+        UNKNOWN: {'High': 1},
+    }
+
+
+def test_crosstab_matches_distribution_totals():
+    rows = [('Calm', ''), ('Calm', None), ('', 'Low'), (None, 'Low'), (3, 'High'), ('3', 'High')]
+    crosstab = CrossTab('Mode', 'Energy', 'Mode x Energy')
+    distribution = Distribution('Mode', 'Modes')
+    for statistic in (crosstab, distribution):
+        statistic.bind(ROW)
+        statistic.add(rows)
+    totals = {row: sum(counts.values()) for row, counts in crosstab.result().items()}
+    assert totals == distribution.result()
+
+
+def test_statistic_must_implement_add_and_result():
+    class Total(Statistic):
+        def add(self, rows):
+            pass
+
+    with pytest.raises(TypeError):
+        Total(['Type'], 'Total')
+    for statistic in (Distribution, DateRange, WeeklyCounts, CrossTab, Ratio):
+        assert not statistic.__abstractmethods__
@@ -0,0 +1,87 @@
+"""
+Watch Polling Tests
+===================
+A DinCharya watch cycle after the first polls the fake Airtable server for
+changed and deleted records only, and merges them into the rows it holds:
+its CSVs, SQLite mirror and summary must match what a full sync of the
+changed tables writes.
+
+Usage:
+    python -m pytest airtable_sync/tests
+"""
+
+import sqlite3
+
+import pytest
+
+from airtable_sync.fake_airtable import record_id
+from airtable_sync.tests.conftest import dincharya_args
+
+VARIANTS = [
+    pytest.param(False, False, id='fetched'),
+    pytest.param(True, True, id='local-lookups-and-formulas'),
+]
+
+
+def outputs(output_dir):
+    """CSV text, summary JSON and SQLite rows of both tables."""
+    files = {name: (output_dir / name).read_text(encoding='utf-8')
+             for name in ('priorities.csv', 'tasks.csv', 'summary.json')}
+    with sqlite3.connect(output_dir / 'airtable.db') as conn:
+        for table in ('priorities', 'tasks'):
+            files[table] = conn.execute(f'SELECT * FROM {table} ORDER BY 1').fetchall()
+    return files
+
+
+def option(schema, field, current):
+    """A select option of field other than current."""
+    options = next(f for f in schema.fields if f.name == field).options
+    return next(value for value in options if value != current)
+
+
+@pytest.mark.parametrize('local_lookups, local_formulas', VARIANTS)
+def test_poll_matches_full_sync(fake, dincharya, api, env, local_lookups, local_formulas):
+    args = dincharya_args(local_lookups=local_lookups, local_formulas=local_formulas,
+                          sqlite=str(env / 'airtable.db'), summary=str(env / 'summary.json'))
+    state = {}
+    dincharya.sync(args, api, None, state)
+
+    priorities = fake.generator.tables['Priorities']
+    tasks = fake.generator.tables['Tasks']
+    moved = record_id(priorities, 3)
+    horizon = fake.record(priorities, 3)[0]['fields'].get('Horizon')
+    # A new Horizon reaches the linked tasks' lookups; a new Rank reorders
+    fake.update('Priorities', moved, {'Horizon': option(priorities, 'Horizon', horizon),
+                                      'Rank': 1000})
+    fake.delete('Priorities', record_id(priorities, 5))
+    fake.update('Tasks', record_id(tasks, 10), {'Status': option(tasks, 'Status', None)})
+    fake.delete('Tasks', record_id(tasks, 11))
+    fake.create('Tasks', {'Task': 'Write the watch tests', 'Priority Link': [moved]})
+
+    del fake.requests[:]
+    _, _, changes = dincharya.sync(args, api, None, state)
+    assert changes['priorities'].replaced and changes['tasks'].replaced
+    # Only filtered requests and the ID-only passes
+    id_only = list(dincharya.ID_ONLY_FIELDS.values())
+    for _, params in fake.requests:
+        assert params.get('filterByFormula') or params['fields'] in id_only
+    polled = outputs(env)
+
+    # A full sync of the changed tables finds nothing left to rewrite
+    _, _, changes = dincharya.sync(args, api, None)
+    assert not any(manifest.replaced for manifest in changes.values())
+    assert outputs(env) == polled
+
+
+def test_poll_without_changes_rewrites_nothing(fake, dincharya, api):
+    state = {}
+    dincharya.sync(dincharya_args(), api, None, state)
+    del fake.requests[:]
+    _, summaries, changes = dincharya.sync(dincharya_args(), api, None, state)
+    assert not any(manifest.replaced for manifest in changes.values())
+    assert summaries['tasks'].records == len(state['tasks']['rows'])
+    # Nothing changed, so the filtered requests found nothing to re-read
+    formulas = [params['filterByFormula'] for _, params in fake.requests
+                if params.get('filterByFormula')]
+    assert len(formulas) == 2
+    assert all('LAST_MODIFIED_TIME()' in formula for formula in formulas)
@@ -0,0 +1,330 @@
+"""
+Entry Vectors
+=============
+Offline similarity search over synced records: every record gets an
+embedding, stored in a memory-mapped float32 matrix with a JSON sidecar of
+record IDs, and a batched top-k cosine search runs over it locally.
+
+Embeddings come from a hashing vectorizer (signed feature hashing of word
+unigrams and bigrams, log-scaled counts, L2-normalized), so no model
+download or network call is needed. Vectors are unit length, so cosine
+similarity is a dot product.
+
+Files (for entries, next to entries_data.csv):
+    - entries_data.vectors.f32   row-major float32 matrix, one row per record
+    - entries_data.vectors.json  model, dimension, record IDs and text hashes
+
+The sync hands every page to a VectorStore like any other sink. Records
+whose embedded text is unchanged keep their stored vector (copied from the
+previous matrix); only new or changed records are embedded. The new matrix
+replaces the old one atomically when the store is closed.
+
+NumPy is optional: with it, searches are a single matrix product; without
+it, a pure-Python scan is used.
+
+Usage:
+    python -m airtable_sync.vectors "trouble sleeping before deadlines"
+    python -m airtable_sync.vectors --like recXXXXXXXXXXXXXX --k 5
+    python -m airtable_sync.vectors --build      # embed entries_data.csv
+
+    index = VectorIndex.open('Pratyaksha/entries_data')
+    for hits in index.search(index.embed(['work stress', 'family time']), k=5):
+        print(hits)   # [(record_id, cosine), ...]
+"""
+
+import argparse
+from array import array
+from collections import Counter
+import csv
+from hashlib import blake2b
+import heapq
+import json
+import math
+import mmap
+from operator import mul
+import os
+import re
+import time
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+from airtable_sync.config import TABLES
+from airtable_sync.joins import IndexedTable
+from airtable_sync.manifest import row_hash
+from airtable_sync.mapping import RECORD_ID
+
+DIMENSIONS = 512
+MODEL = 'hashing-v1'
+TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+# Bytes per float32
+ITEM_SIZE = 4
+
+
+class HashingEmbedder:
+    """Feature-hashing text vectorizer: unigrams and bigrams into dim signed buckets."""
+
+    def __init__(self, dim=DIMENSIONS):
+        self.dim = dim
+        self.name = MODEL
+        self.cache = {}
+
+    def bucket(self, feature):
+        """(index, sign) of a feature, cached across calls."""
+        slot = self.cache.get(feature)
+        if slot is None:
+            h = int.from_bytes(blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little')
+            slot = self.cache[feature] = (h % self.dim, 1.0 if h >> 63 else -1.0)
+        return slot
+
+    def embed(self, texts):
+        """Return one unit-length array('f') per text (all zeros for empty text)."""
+        vectors = []
+        for text in texts:
+            words = TOKEN_PATTERN.findall(text.lower())
+            features = Counter(words)
+            features.update(f'{a} {b}' for a, b in zip(words, words[1:]))
+            vector = [0.0] * self.dim
+            for feature, count in features.items():
+                index, sign = self.bucket(feature)
+                vector[index] += sign * (1.0 + math.log(count))
+            norm = math.sqrt(sum(v * v for v in vector))
+            if norm:
+                vector = [v / norm for v in vector]
+            vectors.append(array('f', vector))
+        return vectors
+
+
+def load_sidecar(prefix):
+    """Return the sidecar of a vector matrix, or None if absent."""
+    path = prefix + '.vectors.json'
+    if not (os.path.exists(path) and os.path.exists(prefix + '.vectors.f32')):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def open_matrix(prefix):
+    """Memory-map a vector matrix read-only (None when it is empty)."""
+    with open(prefix + '.vectors.f32', 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class VectorStore:
+    """Writes a table's vector matrix page by page, embedding only changed records."""
+
+    def __init__(self, prefix, builder, columns, embedder=None):
+        self.prefix = prefix
+        self.embedder = embedder or HashingEmbedder()
+        self.key_index = builder.index(RECORD_ID)
+        self.positions = [builder.index(name) for name in columns]
+        self.ids = []
+        self.hashes = {}
+        self.counts = {'embedded': 0, 'reused': 0, 'removed': 0}
+
+        # Previous matrix: reused for records whose text is unchanged
+        self.previous = {}
+        self.old = None
+        sidecar = load_sidecar(prefix)
+        if (sidecar and sidecar['model'] == self.embedder.name
+                and sidecar['dim'] == self.embedder.dim):
+            self.old = open_matrix(prefix)
+            self.previous = {rid: (i, sidecar['hashes'][rid]) for i, rid in enumerate(sidecar['ids'])}
+        self.tmp_path = prefix + '.vectors.f32.tmp'
+        self.out = open(self.tmp_path, 'wb')
+
+    def write(self, rows):
+        """Append one page of records to the new matrix."""
+        row_bytes = self.embedder.dim * ITEM_SIZE
+        pending = []
+        slots = []
+        for row in rows:
+            rid = row[self.key_index]
+            if rid in self.hashes:
+                continue  # duplicate within a run: keep the first
+            text = '\n'.join(str(row[i]) for i in self.positions if row[i])
+            digest = row_hash((text,))
+            self.ids.append(rid)
+            self.hashes[rid] = digest
+            previous = self.previous.get(rid)
+            if previous is not None and previous[1] == digest and self.old is not None:
+                start = previous[0] * row_bytes
+                slots.append(self.old[start:start + row_bytes])
+                self.counts['reused'] += 1
+            else:
+                slots.append(len(pending))
+                pending.append(text)
+        vectors = self.embedder.embed(pending)
+        self.counts['embedded'] += len(pending)
+        for slot in slots:
+            self.out.write(vectors[slot].tobytes() if isinstance(slot, int) else slot)
+
+    def close(self):
+        """Replace the matrix and sidecar with this run's."""
+        self.out.close()
+        if self.old is not None:
+            self.old.close()
+        self.counts['removed'] = sum(1 for rid in self.previous if rid not in self.hashes)
+        os.replace(self.tmp_path, self.prefix + '.vectors.f32')
+        tmp_path = self.prefix + '.vectors.json.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'model': self.embedder.name, 'dim': self.embedder.dim,
+                       'ids': self.ids, 'hashes': self.hashes}, f)
+        os.replace(tmp_path, self.prefix + '.vectors.json')
+
+    def summary(self):
+        """One-line update summary."""
+        c = self.counts
+        return f'{c["embedded"]} embedded, {c["reused"]} reused, {c["removed"]} removed'
+
+
+class VectorIndex:
+    """Read-only, memory-mapped vector matrix with batched top-k cosine search."""
+
+    def __init__(self, ids, dim, matrix, embedder):
+        self.ids = ids
+        self.dim = dim
+        self.positions = {rid: i for i, rid in enumerate(ids)}
+        self.embedder = embedder
+        self.matrix = matrix
+        if matrix is None:
+            self.rows = None
+        elif np is not None:
+            self.rows = np.frombuffer(matrix, dtype=np.float32).reshape(len(ids), dim)
+        else:
+            self.rows = memoryview(matrix).cast('f')
+
+    @classmethod
+    def open(cls, prefix):
+        """Open the matrix written for prefix (e.g. 'Pratyaksha/entries_data')."""
+        sidecar = load_sidecar(prefix)
+        if sidecar is None:
+            raise FileNotFoundError(f'No vectors at {prefix}.vectors.*; sync with --vectors first')
+        return cls(sidecar['ids'], sidecar['dim'], open_matrix(prefix), HashingEmbedder(sidecar['dim']))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def embed(self, texts):
+        """Embed query texts with the model the matrix was built with."""
+        return self.embedder.embed(texts)
+
+    def vector(self, record_id):
+        """Stored vector of a record."""
+        i = self.positions[record_id]
+        if np is not None:
+            return self.rows[i]
+        return self.rows[i * self.dim:(i + 1) * self.dim]
+
+    def search(self, queries, k=10, exclude=()):
+        """Return the top-k (record_id, cosine) pairs for each query vector."""
+        if self.rows is None or not queries:
+            return [[] for _ in queries]
+        exclude = set(exclude)
+        if np is not None:
+            scores = np.asarray(queries, dtype=np.float32) @ self.rows.T
+            results = []
+            for row in scores:
+                n = min(k + len(exclude), len(row))
+                top = np.argpartition(-row, n - 1)[:n]
+                top = top[np.argsort(-row[top])]
+                hits = [(self.ids[i], float(row[i])) for i in top if self.ids[i] not in exclude]
+                results.append(hits[:k])
+            return results
+
+        dim = self.dim
+        rows = self.rows
+        results = []
+        for query in queries:
+            query = list(query)
+            scores = ((sum(map(mul, query, rows[i * dim:(i + 1) * dim])), rid)
+                      for i, rid in enumerate(self.ids) if rid not in exclude)
+            results.append([(rid, score) for score, rid in heapq.nlargest(k, scores)])
+        return results
+
+    def similar(self, record_id, k=10):
+        """Records most similar to one record (excluding itself)."""
+        return self.search([self.vector(record_id)], k, exclude=[record_id])[0]
+
+    def close(self):
+        """Release the memory map."""
+        self.rows = None
+        if self.matrix is not None:
+            self.matrix.close()
+
+
+def vectors_prefix(config):
+    """Default matrix prefix for a table: its CSV path without the extension."""
+    return os.path.splitext(config.output_path())[0]
+
+
+def build(config, prefix=None):
+    """Embed a table from its synced CSV (reusing unchanged vectors); return the VectorStore."""
+    store = VectorStore(prefix or vectors_prefix(config), config.row, config.embed)
+    with open(config.output_path(), newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        page = []
+        for row in reader:
+            page.append(row)
+            if len(page) == 500:
+                store.write(page)
+                page = []
+        if page:
+            store.write(page)
+    store.close()
+    return store
+
+
+def main():
+    """Query (or build) a vector index from the command line."""
+    embeddable = [name for name, config in TABLES.items() if config.embed]
+    parser = argparse.ArgumentParser(description='Similarity search over synced Airtable records.')
+    parser.add_argument('query', nargs='*', help='text to find similar records for')
+    parser.add_argument('--like', metavar='RECORD_ID', help='find records similar to this one')
+    parser.add_argument('--table', choices=embeddable, default=embeddable[0])
+    parser.add_argument('--prefix', help='matrix path without .vectors.* (default: next to the CSV)')
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    parser.add_argument('--build', action='store_true', help="embed the table's CSV first")
+    args = parser.parse_args()
+    config = TABLES[args.table]
+    prefix = args.prefix or vectors_prefix(config)
+
+    if args.build:
+        start = time.monotonic()
+        store = build(config, prefix)
+        print(f'Embedded {config.output_path()} in {time.monotonic() - start:.2f}s: {store.summary()}')
+    if not (args.query or args.like):
+        if not args.build:
+            parser.error('give query text or --like RECORD_ID (or --build)')
+        return
+
+    index = VectorIndex.open(prefix)
+    if args.like and args.like not in index.positions:
+        parser.error(f'{args.like} has no stored vector')
+    start = time.monotonic()
+    if args.like:
+        hits = index.similar(args.like, args.k)
+    else:
+        hits = index.search(index.embed([' '.join(args.query)]), args.k)[0]
+    elapsed = (time.monotonic() - start) * 1000
+    index.close()
+    if args.json:
+        print(json.dumps([{RECORD_ID: rid, 'score': round(score, 4)} for rid, score in hits], indent=2))
+        return
+    records = IndexedTable.from_csv(config.output_path()) if hits else None
+    for rid, score in hits:
+        row = records.get(rid)
+        label = '' if row is None else ' | '.join(
+            records.value(row, name) for name in config.search_display if records.value(row, name))
+        print(f'{score:7.3f}  {rid}  {label}')
+    print(f'{len(hits)} results from {len(index)} records in {elapsed:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
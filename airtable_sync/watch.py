@@ -0,0 +1,196 @@
+"""
+Watch Mode
+==========
+Runs a sync repeatedly in one long-lived process, so the interpreter,
+imports and the client's keep-alive HTTPS connections are paid for once.
+
+The poll interval adapts: it drops to the minimum as soon as a cycle sees
+changes and doubles after every idle (or failed) cycle, up to the maximum.
+An optional HTTP endpoint reports health and the last cycle's metrics:
+
+    GET /health   JSON status; 503 while the last cycle failed
+    GET /metrics  Prometheus text for the last cycle plus watch gauges
+
+Usage:
+    watcher = Watcher('entries', cycle, min_interval=15, max_interval=300)
+    watcher.serve_health(9464)
+    watcher.run()
+
+cycle() runs one sync and returns (SyncMetrics, number of changed records).
+"""
+
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import signal
+import threading
+import time
+import traceback
+
+from airtable_sync.instrument import PROMETHEUS_PREFIX, prometheus_text
+
+MIN_INTERVAL = 15.0
+MAX_INTERVAL = 300.0
+BACKOFF_FACTOR = 2.0
+
+
+class AdaptiveInterval:
+    """Poll interval that tightens on changes and backs off when idle."""
+
+    def __init__(self, minimum=MIN_INTERVAL, maximum=MAX_INTERVAL, factor=BACKOFF_FACTOR):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self.current = minimum
+
+    def update(self, changed):
+        """Return the next interval after a cycle that did (or did not) see changes."""
+        if changed:
+            self.current = self.minimum
+        else:
+            self.current = min(self.maximum, self.current * self.factor)
+        return self.current
+
+
+class Watcher:
+    """Runs a sync cycle on an adaptive interval until stopped."""
+
+    def __init__(self, name, cycle, min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL):
+        self.name = name
+        self.cycle = cycle
+        self.interval = AdaptiveInterval(min_interval, max_interval)
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+        self.last_run = None
+        self.state = {
+            'sync': name,
+            'status': 'starting',
+            'started': datetime.now(timezone.utc).isoformat(),
+            'cycles': 0,
+            'failures': 0,
+            'last_success': None,
+            'last_error': None,
+            'last_changes': None,
+            'interval': min_interval,
+        }
+        self.httpd = None
+
+    def run(self):
+        """Poll until SIGINT or SIGTERM."""
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: self.stopped.set())
+        print(f'Watching {self.name}: polling every {self.interval.minimum:g}-'
+              f'{self.interval.maximum:g}s (Ctrl+C to stop)')
+        while not self.stopped.is_set():
+            self.run_cycle()
+            self.stopped.wait(self.state['interval'])
+        print(f'Stopped watching {self.name} after {self.state["cycles"]} cycles.')
+        if self.httpd is not None:
+            self.httpd.shutdown()
+
+    def run_cycle(self):
+        """Run one sync cycle and update health state and the interval."""
+        start = time.monotonic()
+        try:
+            run, changes = self.cycle()
+        except Exception as e:
+            traceback.print_exc()
+            interval = self.interval.update(changed=False)
+            with self.lock:
+                self.state.update(status='error', last_error=f'{type(e).__name__}: {e}',
+                                  interval=interval)
+                self.state['cycles'] += 1
+                self.state['failures'] += 1
+            print(f'[{timestamp()}] {self.name}: failed, retrying in {interval:g}s')
+            return
+        interval = self.interval.update(changed=changes > 0)
+        with self.lock:
+            self.last_run = run
+            self.state.update(status='ok', last_success=datetime.now(timezone.utc).isoformat(),
+                              last_changes=changes, interval=interval)
+            self.state['cycles'] += 1
+        print(f'[{timestamp()}] {self.name}: {changes} changes in '
+              f'{time.monotonic() - start:.1f}s, next poll in {interval:g}s')
+
+    def health(self):
+        """Return (HTTP status, JSON-ready health state)."""
+        with self.lock:
+            state = dict(self.state)
+            if self.last_run is not None:
+                state['last_run'] = self.last_run.as_dict()
+        return (503 if state['status'] == 'error' else 200), state
+
+    def metrics_text(self):
+        """Prometheus text for the last cycle plus the watch loop's own gauges."""
+        p = PROMETHEUS_PREFIX
+        label = f'sync="{self.name}"'
+        with self.lock:
+            state = dict(self.state)
+            text = prometheus_text(self.last_run) if self.last_run is not None else ''
+        lines = [
+            f'# TYPE {p}_watch_cycles gauge',
+            f'{p}_watch_cycles{{{label}}} {state["cycles"]}',
+            f'# TYPE {p}_watch_failures gauge',
+            f'{p}_watch_failures{{{label}}} {state["failures"]}',
+            f'# TYPE {p}_watch_interval_seconds gauge',
+            f'{p}_watch_interval_seconds{{{label}}} {state["interval"]}',
+            f'# TYPE {p}_watch_up gauge',
+            f'{p}_watch_up{{{label}}} {int(state["status"] != "error")}',
+        ]
+        return text + '\n'.join(lines) + '\n'
+
+    def serve_health(self, port, host='127.0.0.1'):
+        """Serve /health and /metrics on a background thread."""
+        this = self
+
+        class Handler(HealthHandler):
+            watcher = this
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        print(f'Health endpoint: http://{host}:{self.httpd.server_address[1]}/health')
+        return self.httpd
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    """GET /health and /metrics for a Watcher."""
+
+    watcher = None
+
+    def do_GET(self):
+        if self.path == '/health':
+            status, state = self.watcher.health()
+            self.reply(status, json.dumps(state, indent=2), 'application/json')
+        elif self.path == '/metrics':
+            self.reply(200, self.watcher.metrics_text(), 'text/plain; version=0.0.4')
+        else:
+            self.reply(404, 'not found\n', 'text/plain')
+
+    def reply(self, status, text, content_type):
+        payload = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def timestamp():
+    """Local time for watch log lines."""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def add_watch_arguments(parser):
+    """Add the --watch options shared by both sync scripts."""
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and poll for changes on an adaptive interval')
+    parser.add_argument('--interval', type=float, default=MIN_INTERVAL, metavar='SECONDS',
+                        help=f'shortest poll interval in watch mode (default: {MIN_INTERVAL:g})')
+    parser.add_argument('--max-interval', type=float, default=MAX_INTERVAL, metavar='SECONDS',
+                        help=f'longest poll interval when idle (default: {MAX_INTERVAL:g})')
+    parser.add_argument('--health-port', type=int, metavar='PORT',
+                        help='serve /health and /metrics on this port in watch mode')